@@ -1,12 +1,15 @@
 from django.db import models
 from django.utils.translation import gettext_lazy as _
 from myproject.apps.core.model_fields import TranslatedField
+from myproject.apps.core.models import TranslatableQuerySet
 
 class Category(models.Model):
     title = models.CharField(_("Title"), max_length=200)
 
     translated_title = TranslatedField("title")
 
+    objects = TranslatableQuerySet.as_manager()
+
     class Meta:
         verbose_name = _("Category")
         verbose_name_plural = _("Categories")
@@ -1,7 +1,10 @@
 from django.conf import settings
 from django import forms
+from django.contrib import admin
 from django.utils.translation import gettext_lazy as _
 
+from .models import StoredBlob
+
 def get_multilingual_field_names(field_name):
     lang_code_underscored = settings.LANGUAGE_CODE.replace("-", "_")
     field_names = [f"{field_name}_{lang_code_underscored}"]
@@ -25,4 +28,10 @@ class LanguageChoicesForm(forms.ModelForm):
             label=_("Language"),
             choices=LANGUAGES_EXCEPT_THE_DEFAULT,
             required=True,
-        )
\ No newline at end of file
+        )
+
+@admin.register(StoredBlob)
+class StoredBlobAdmin(admin.ModelAdmin):
+    list_display = ["content_hash", "size", "reference_count", "created"]
+    search_fields = ["content_hash"]
+    readonly_fields = ["content_hash", "size", "reference_count", "created", "modified"]
@@ -0,0 +1,75 @@
+"""
+Responsive image renditions.
+
+Every preset defines an aspect ratio and the widths of its renditions,
+and every width is rendered as JPEG and, if the installed Pillow can
+save them, as WebP and AVIF. The specs are registered in the imagekit
+registry (this module is autodiscovered by imagekit), so they can be
+generated for any image file by their id.
+"""
+from collections import namedtuple
+
+from django.conf import settings
+from imagekit import ImageSpec, register
+from pilkit.processors import ResizeToFill
+
+ImageFormat = namedtuple("ImageFormat", ["format", "mime_type", "options"])
+
+# from the most to the least efficient; the last one is the fallback
+IMAGE_FORMATS = [
+    ImageFormat("AVIF", "image/avif", {"quality": 50}),
+    ImageFormat("WEBP", "image/webp", {"quality": 75, "method": 4}),
+    ImageFormat("JPEG", "image/jpeg", {"quality": 80, "progressive": True, "optimize": True}),
+]
+
+RESPONSIVE_IMAGE_PRESETS = getattr(settings, "RESPONSIVE_IMAGE_PRESETS", {
+    # preset: (aspect ratio, widths)
+    "card": ((728, 250), (364, 728, 1092)),
+    "large": ((2, 1), (400, 800, 1200)),
+})
+
+
+def get_supported_formats():
+    from PIL import Image
+
+    Image.init()
+    return [
+        image_format for image_format in IMAGE_FORMATS
+        if image_format.format in Image.SAVE
+    ]
+
+
+def get_spec_id(preset, width, image_format):
+    return f"core:{preset}:{width}:{image_format.format.lower()}"
+
+
+def get_height(preset, width):
+    (ratio_width, ratio_height), widths = RESPONSIVE_IMAGE_PRESETS[preset]
+    return round(width * ratio_height / ratio_width)
+
+
+def get_responsive_spec_ids():
+    return [
+        get_spec_id(preset, width, image_format)
+        for preset, (aspect_ratio, widths) in RESPONSIVE_IMAGE_PRESETS.items()
+        for width in widths
+        for image_format in get_supported_formats()
+    ]
+
+
+def create_spec_class(preset, width, image_format):
+    class ResponsiveSpec(ImageSpec):
+        processors = [ResizeToFill(width, get_height(preset, width))]
+        format = image_format.format
+        options = image_format.options
+
+    return ResponsiveSpec
+
+
+for preset, (aspect_ratio, widths) in RESPONSIVE_IMAGE_PRESETS.items():
+    for width in widths:
+        for image_format in IMAGE_FORMATS:
+            register.generator(
+                get_spec_id(preset, width, image_format),
+                create_spec_class(preset, width, image_format),
+            )
@@ -0,0 +1,109 @@
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = (
+        "Generates the missing image renditions of all pictures in parallel processes."
+    )
+    SILENT, NORMAL, VERBOSE, VERY_VERBOSE = 0, 1, 2, 3
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--model", dest="models", action="append", default=[],
+            help="Only the renditions of the given model, e.g. ideas.Idea. "
+                 "Can be used several times.",
+        )
+        parser.add_argument(
+            "--workers", type=int, default=None,
+            help="The amount of worker processes (by default the amount of CPUs).",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=500,
+            help="The amount of objects read from the database at once.",
+        )
+        parser.add_argument(
+            "--force", action="store_true",
+            help="Regenerate the renditions which exist already.",
+        )
+
+    def handle(self, *args, **options):
+        self.verbosity = options.get("verbosity", self.NORMAL)
+        self.model_labels = options["models"]
+        self.workers = options["workers"]
+        self.batch_size = options["batch_size"]
+        self.force = options["force"]
+        self.prepare()
+        self.main()
+        self.finalize()
+
+    def prepare(self):
+        from django.apps import apps
+        from ...renditions import get_rendition_specs
+
+        if self.model_labels:
+            try:
+                self.models = [apps.get_model(label) for label in self.model_labels]
+            except (LookupError, ValueError) as exc:
+                raise CommandError(str(exc))
+        else:
+            self.models = [
+                model for model in apps.get_models() if get_rendition_specs(model)
+            ]
+        self.generated_count = 0
+        self.failed_count = 0
+
+    def main(self):
+        import multiprocessing
+        import time
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+        from django.db import connections
+        from ...renditions import generate_rendition, _init_worker
+
+        started = time.perf_counter()
+        # the forked workers must not share the database connections
+        connections.close_all()
+        with ProcessPoolExecutor(
+            max_workers=self.workers,
+            mp_context=multiprocessing.get_context("fork"),
+            initializer=_init_worker,
+        ) as executor:
+            for model in self.models:
+                if self.verbosity >= self.NORMAL:
+                    self.stdout.write(f"=== Renditions of {model._meta.label} ===")
+                # a batch of tasks at a time keeps the amount of pending
+                # futures independent of the amount of pictures
+                for tasks in self.get_task_batches(model):
+                    futures = {
+                        executor.submit(generate_rendition, *task, force=self.force): task
+                        for task in tasks
+                    }
+                    for future in as_completed(futures):
+                        self.report(futures[future], future)
+        self.duration = time.perf_counter() - started
+
+    def get_task_batches(self, model):
+        from ...misc import iterate_in_chunks
+        from ...renditions import get_rendition_tasks
+
+        for chunk in iterate_in_chunks(model._default_manager.all(), self.batch_size):
+            yield [task for instance in chunk for task in get_rendition_tasks(instance)]
+
+    def report(self, task, future):
+        exception = future.exception()
+        if exception is None:
+            self.generated_count += 1
+            if self.verbosity >= self.VERBOSE:
+                self.stdout.write(f" - {task.spec_id}: {task.source_name}\n")
+        else:
+            self.failed_count += 1
+            if self.verbosity >= self.NORMAL:
+                self.stderr.write(
+                    f" - {task.spec_id}: {task.source_name} failed: {exception}\n"
+                )
+
+    def finalize(self):
+        if self.verbosity >= self.NORMAL:
+            self.stdout.write(f"-------------------------\n")
+            self.stdout.write(f"Renditions checked: {self.generated_count}\n")
+            self.stdout.write(f"Renditions failed: {self.failed_count}\n")
+            self.stdout.write(f"Total time: {self.duration:.2f} s\n\n")
@@ -1,2 +1,20 @@
 def custom_show_toolbar(request):
     return "1" == request.COOKIES.get("DebugToolbar", False)
+
+
+def iterate_in_chunks(queryset, chunk_size):
+    """
+    Yields lists of the objects of the queryset ordered by the primary
+    key, chunk_size objects at a time
+    """
+    queryset = queryset.order_by("pk")
+    last_pk = None
+    while True:
+        chunk_queryset = queryset
+        if last_pk is not None:
+            chunk_queryset = chunk_queryset.filter(pk__gt=last_pk)
+        chunk = list(chunk_queryset[:chunk_size])
+        if not chunk:
+            break
+        yield chunk
+        last_pk = chunk[-1].pk
@@ -46,28 +46,35 @@ class MultilingualField(models.Field):
     def contribute_to_class(self, cls, name,
                             private_only=False,
                             virtual_only=False):
-        def translated_value(self):
-            language = get_language()
-            val = self.__dict__.get(
-                MultilingualField.localized_field_name(
-                        name, language))
-            if not val:
-                val = self.__dict__.get(
-                    MultilingualField.localized_field_name(
-                            name, settings.LANGUAGE_CODE))
-            return val
-
         # generate language-specific fields dynamically
         if not cls._meta.abstract:
             if self.localized_field_model:
+                # the language to column map is computed once per class
+                localized_field_names = {
+                    lang_code: MultilingualField.localized_field_name(
+                        name, lang_code)
+                    for lang_code, lang_name in settings.LANGUAGES
+                }
+                default_field_name = localized_field_names[settings.LANGUAGE_CODE]
+
+                def translated_value(self):
+                    field_name = localized_field_names.get(
+                        get_language(), default_field_name)
+                    val = self.__dict__.get(field_name)
+                    if not val:
+                        val = self.__dict__.get(default_field_name)
+                    return val
+
                 for lang_code, lang_name in settings.LANGUAGES:
                     localized_field = self.get_localized_field(
                         lang_code, lang_name)
                     localized_field.contribute_to_class(
-                            cls,
-                            MultilingualField.localized_field_name(
-                                    name, lang_code))
+                            cls, localized_field_names[lang_code])
 
+                if "multilingual_fields" not in cls.__dict__:
+                    cls.multilingual_fields = dict(
+                        getattr(cls, "multilingual_fields", {}))
+                cls.multilingual_fields[name] = localized_field_names
                 setattr(cls, name, property(translated_value))
             else:
                 super().contribute_to_class(
@@ -82,11 +89,50 @@ class MultilingualTextField(models.TextField, MultilingualField):
     pass
 
 
+TRANSLATIONS_CACHE_ATTR = "_translations_cache"
+
+
+def get_prefetched_translations_attr(lang_code):
+    lang_code_safe = lang_code.replace("-", "_")
+    return f"_prefetched_translations_{lang_code_safe}"
+
+
+def get_translation(instance, lang_code):
+    """
+    Returns the translation of the instance for the language or None.
+    The result is cached on the instance, and the translations loaded
+    by with_translations() or prefetch_related("translations")
+    are used instead of a query.
+    """
+    translations_cache = instance.__dict__.setdefault(TRANSLATIONS_CACHE_ATTR, {})
+    if lang_code not in translations_cache:
+        language_translations = getattr(
+            instance, get_prefetched_translations_attr(lang_code), None
+        )
+        if language_translations is None:
+            prefetched_objects = getattr(instance, "_prefetched_objects_cache", {})
+            language_translations = prefetched_objects.get("translations")
+        if language_translations is not None:
+            obj_translation = next(
+                (obj_translation for obj_translation in language_translations
+                 if obj_translation.language == lang_code),
+                None,
+            )
+        else:
+            obj_translation = instance.translations.filter(
+                language=lang_code,
+            ).first()
+        translations_cache[lang_code] = obj_translation
+    return translations_cache[lang_code]
+
+
 class TranslatedField(object):
     def __init__(self, field_name):
         self.field_name = field_name
 
     def __get__(self, instance, owner):
+        if instance is None:
+            return self
         lang_code = translation.get_language()
         if lang_code == settings.LANGUAGE_CODE:
             # The fields of the default language are in the main model
@@ -94,7 +140,5 @@ class TranslatedField(object):
         else:
             # The fields of the other languages are in the translation
             # model, but falls back to the main model
-            translations = instance.translations.filter(
-                language=lang_code,
-            ).first() or instance
-            return getattr(translations, self.field_name)
\ No newline at end of file
+            translations = get_translation(instance, lang_code) or instance
+            return getattr(translations, self.field_name)
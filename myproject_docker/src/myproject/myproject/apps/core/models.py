@@ -1,6 +1,7 @@
 from urllib.parse import urlparse, urlunparse
 from django.conf import settings
 from django.db import models
+from django.utils import translation
 from django.utils.translation import gettext_lazy as _
 from django.utils.safestring import mark_safe
 from django.template.loader import render_to_string
@@ -9,6 +10,87 @@ from django.contrib.contenttypes.fields import GenericForeignKey
 from django.core.exceptions import FieldError
 
 
+class TranslatableQuerySet(models.QuerySet):
+    """
+    A queryset for models with a "translations" relation
+    of TranslatedField values
+    """
+    def with_translations(self, lang_code=None):
+        """
+        Loads the translations of the given or active language
+        for all objects with one additional query
+        """
+        from .model_fields import get_prefetched_translations_attr
+
+        lang_code = lang_code or translation.get_language()
+        if not lang_code or lang_code == settings.LANGUAGE_CODE:
+            # the default language is stored in the main model
+            return self
+        translation_model = self.model._meta.get_field("translations").related_model
+        return self.prefetch_related(models.Prefetch(
+            "translations",
+            queryset=translation_model.objects.filter(language=lang_code),
+            to_attr=get_prefetched_translations_attr(lang_code),
+        ))
+
+    def with_translated_fields(self, *field_names, lang_code=None):
+        """
+        Annotates translated_<field_name> for the given fields, or for
+        all translated fields of the model, with the value of the given
+        or active language falling back to the main model in the same
+        SELECT. The annotations can be used for filtering and ordering
+        and are read instead of the TranslatedField descriptors.
+        """
+        from django.db.models.functions import Coalesce
+        from .model_fields import TranslatedField
+
+        lang_code = lang_code or translation.get_language() or settings.LANGUAGE_CODE
+        if not field_names:
+            field_names = [
+                attr.field_name
+                for attr in vars(self.model).values()
+                if isinstance(attr, TranslatedField)
+            ]
+        translations_relation = self.model._meta.get_field("translations")
+        annotations = {}
+        for field_name in field_names:
+            if lang_code == settings.LANGUAGE_CODE:
+                # the default language is stored in the main model
+                annotations[f"translated_{field_name}"] = models.F(field_name)
+                continue
+            translated_value = translations_relation.related_model.objects.filter(
+                **{translations_relation.field.name: models.OuterRef("pk")},
+                language=lang_code,
+            ).values(field_name)[:1]
+            annotations[f"translated_{field_name}"] = Coalesce(
+                models.Subquery(translated_value), models.F(field_name)
+            )
+        return self.annotate(**annotations)
+
+
+class MultilingualQuerySet(models.QuerySet):
+    """
+    A queryset for models with MultilingualField fields
+    """
+    def for_language(self, lang_code=None):
+        """
+        Defers the columns of the multilingual fields except the ones
+        of the given or active language and of the default language,
+        which are enough to read the translated values
+        """
+        lang_code = lang_code or translation.get_language()
+        loaded_languages = {lang_code, settings.LANGUAGE_CODE}
+        deferred_field_names = [
+            field_name
+            for localized_field_names in getattr(
+                self.model, "multilingual_fields", {}
+            ).values()
+            for field_lang_code, field_name in localized_field_names.items()
+            if field_lang_code not in loaded_languages
+        ]
+        return self.defer(*deferred_field_names)
+
+
 # Это всё миксины, UrlBase - получить ПОЛНЫЙ url объекта =]
 class UrlBase(models.Model):
     """
@@ -118,12 +200,23 @@ class MetaTagsBase(models.Model):
             self.get_meta_copyright(),
         )
 
+OBJECT_ID_FIELD_CLASSES = {
+    "char": models.CharField,
+    "uuid": models.UUIDField,
+    "integer": models.PositiveIntegerField,
+}
+
+
 def object_relation_base_factory(
         prefix=None,
         prefix_verbose=None,
         add_related_name=False,
         limit_content_type_choices_to=None,
-        is_required=False):
+        is_required=False,
+        object_id_type="char",
+        add_index=False,
+        unique=False,
+        unique_with=None):
     """
     Returns a mixin class for generic foreign keys using
     "Content type - object ID" with dynamic field names.
@@ -140,10 +233,27 @@ def object_relation_base_factory(
                       value should be true, if you use more
                       than one ObjectRelationMixin in your
                       model.
+    object_id_type:   "char" (default), "uuid" or "integer";
+                      use a typed object ID when all related
+                      models have primary keys of that type,
+                      so that joins don't need text casts
+    add_index:        a boolean value indicating, that a
+                      composite index on the content type and
+                      object ID should be added
+    unique:           a boolean value indicating, that a unique
+                      constraint on the content type, the object
+                      ID and the fields of unique_with should be
+                      added (its index also serves the lookups)
+    unique_with:      names of the fields of the concrete model,
+                      for example an owner, which are added to
+                      the unique constraint
     The model fields are created using this naming scheme:
         <<prefix>>_content_type
         <<prefix>>_object_id
         <<prefix>>_content_object
+    The indexes and constraints are defined in the Meta class
+    of the mixin, so the Meta class of the model should extend
+    it, e.g. "class Meta(TheMixin.Meta):".
     """
     p = ""
     if prefix:
@@ -156,9 +266,30 @@ def object_relation_base_factory(
     object_id_field = f"{p}object_id"
     content_object_field = f"{p}content_object"
 
+    try:
+        object_id_field_class = OBJECT_ID_FIELD_CLASSES[object_id_type]
+    except KeyError:
+        raise FieldError(f"object_id_type should be one of: "
+                         f"{', '.join(OBJECT_ID_FIELD_CLASSES)}")
+
+    meta_indexes = []
+    if add_index:
+        meta_indexes.append(models.Index(
+            fields=[content_type_field, object_id_field],
+            name=f"%(app_label)s_%(class)s_{p}obj_idx"))
+
+    meta_constraints = []
+    if unique or unique_with:
+        meta_constraints.append(models.UniqueConstraint(
+            fields=[content_type_field, object_id_field,
+                    *(unique_with or [])],
+            name=f"%(app_label)s_%(class)s_{p}unique_obj"))
+
     class TheClass(models.Model):
         class Meta:
             abstract = True
+            indexes = meta_indexes
+            constraints = meta_constraints
 
     if add_related_name:
         if not prefix:
@@ -185,13 +316,20 @@ def object_relation_base_factory(
 
     fk_verbose_name = prefix_verbose
 
-    object_id = models.CharField(
-        fk_verbose_name,
-        blank=optional,
-        null=False,
-        help_text=_("Please enter the ID of the related object."),
-        max_length=255,
-        default="")  # for migrations
+    if object_id_field_class is models.CharField:
+        object_id = models.CharField(
+            fk_verbose_name,
+            blank=optional,
+            null=False,
+            help_text=_("Please enter the ID of the related object."),
+            max_length=255,
+            default="")  # for migrations
+    else:
+        object_id = object_id_field_class(
+            fk_verbose_name,
+            blank=optional,
+            null=optional,
+            help_text=_("Please enter the ID of the related object."))
 
     content_object = GenericForeignKey(
         ct_field=content_type_field,
@@ -202,4 +340,22 @@ def object_relation_base_factory(
     TheClass.add_to_class(content_object_field,
                           content_object)
 
-    return TheClass
\ No newline at end of file
+    return TheClass
+
+class StoredBlob(CreationModificationDateBase):
+    """
+    A file of the ContentAddressedStorage, which is stored once
+    for all uploads with the same content
+    """
+    content_hash = models.CharField(
+        _("Content hash"), max_length=64, primary_key=True
+    )
+    size = models.BigIntegerField(_("Size"), default=0)
+    reference_count = models.PositiveIntegerField(_("Reference count"), default=0)
+
+    class Meta:
+        verbose_name = _("Stored blob")
+        verbose_name_plural = _("Stored blobs")
+
+    def __str__(self):
+        return self.content_hash
@@ -0,0 +1,221 @@
+"""
+Keyset (cursor) pagination.
+
+Instead of counting all rows and skipping OFFSET rows, a page is
+selected by a WHERE condition on the ordering values of the last
+(or first) object of the previous page, so deep pages are as fast as
+the first one. The position is passed around as an opaque signed
+cursor token.
+"""
+import json
+
+from django.core import signing
+from django.core.exceptions import FieldDoesNotExist
+from django.db import connections, models
+
+CURSOR_SALT = "myproject.apps.core.paginators.cursor"
+
+
+class InvalidCursor(Exception):
+    pass
+
+
+def get_approximate_count(queryset):
+    """
+    Returns the row estimate of the query planner on PostgreSQL
+    and the exact count on other databases
+    """
+    connection = connections[queryset.db]
+    if connection.vendor != "postgresql":
+        return queryset.count()
+    sql, params = queryset.order_by().query.sql_with_params()
+    with connection.cursor() as cursor:
+        cursor.execute(f"EXPLAIN (FORMAT JSON) {sql}", params)
+        plan = cursor.fetchone()[0]
+    if isinstance(plan, str):
+        plan = json.loads(plan)
+    return plan[0]["Plan"]["Plan Rows"]
+
+
+class KeysetPage(object):
+    def __init__(self, object_list, paginator, has_next, has_previous):
+        self.object_list = object_list
+        self.paginator = paginator
+        self._has_next = has_next
+        self._has_previous = has_previous
+
+    def __repr__(self):
+        return f"<Keyset page of {len(self.object_list)} objects>"
+
+    def __len__(self):
+        return len(self.object_list)
+
+    def __getitem__(self, index):
+        return self.object_list[index]
+
+    def __iter__(self):
+        return iter(self.object_list)
+
+    def has_next(self):
+        return self._has_next
+
+    def has_previous(self):
+        return self._has_previous
+
+    def has_other_pages(self):
+        return self.has_next() or self.has_previous()
+
+    @property
+    def next_cursor(self):
+        if not self.has_next():
+            return ""
+        return self.paginator.get_cursor(self.object_list[-1], reverse=False)
+
+    @property
+    def previous_cursor(self):
+        if not self.has_previous():
+            return ""
+        return self.paginator.get_cursor(self.object_list[0], reverse=True)
+
+    @property
+    def approximate_count(self):
+        return self.paginator.approximate_count
+
+
+class KeysetPaginator(object):
+    """
+    Paginates a queryset by the unique combination of the ordering
+    fields, e.g. ("title", "pk") or ("-created", "-pk"). The fields
+    can be model fields or annotations, but must not be NULL.
+    """
+    def __init__(self, queryset, per_page, ordering=("pk",),
+                 approximate_count=False):
+        self.queryset = queryset
+        self.per_page = int(per_page)
+        self.ordering = list(ordering)
+        self.with_approximate_count = approximate_count
+        self._approximate_count = None
+
+    @property
+    def fields(self):
+        return [
+            (field_name.lstrip("-"), field_name.startswith("-"))
+            for field_name in self.ordering
+        ]
+
+    @property
+    def approximate_count(self):
+        if not self.with_approximate_count:
+            return None
+        if self._approximate_count is None:
+            self._approximate_count = get_approximate_count(self.queryset)
+        return self._approximate_count
+
+    def get_cursor(self, obj, reverse=False):
+        values = [
+            self.serialize_value(getattr(obj, field_name))
+            for field_name, descending in self.fields
+        ]
+        return signing.dumps([values, reverse], salt=CURSOR_SALT, compress=True)
+
+    def parse_cursor(self, cursor):
+        try:
+            values, reverse = signing.loads(cursor, salt=CURSOR_SALT)
+        except (signing.BadSignature, TypeError, ValueError):
+            raise InvalidCursor(cursor)
+        if len(values) != len(self.fields):
+            raise InvalidCursor(cursor)
+        values = [
+            self.deserialize_value(field_name, value)
+            for (field_name, descending), value in zip(self.fields, values)
+        ]
+        return values, bool(reverse)
+
+    @staticmethod
+    def serialize_value(value):
+        if hasattr(value, "isoformat"):
+            return value.isoformat()
+        if isinstance(value, (int, float, str)):
+            return value
+        return str(value)
+
+    def deserialize_value(self, field_name, value):
+        opts = self.queryset.model._meta
+        try:
+            field = opts.pk if field_name == "pk" else opts.get_field(field_name)
+        except FieldDoesNotExist:
+            return value  # an annotation
+        try:
+            return field.to_python(value)
+        except Exception:
+            raise InvalidCursor(value)
+
+    def get_condition(self, values, reverse):
+        """
+        Returns the condition of the objects after the values, e.g.
+        a > x OR (a = x AND b > y) for the ascending fields a and b
+        """
+        condition = models.Q()
+        equal_fields = {}
+        for (field_name, descending), value in zip(self.fields, values):
+            lookup = "lt" if descending != reverse else "gt"
+            condition |= models.Q(
+                **equal_fields, **{f"{field_name}__{lookup}": value}
+            )
+            equal_fields[field_name] = value
+        return condition
+
+    def get_page(self, cursor=None):
+        """
+        Returns the page after the position of the cursor,
+        or the first page for an empty or invalid cursor
+        """
+        values, reverse = None, False
+        if cursor:
+            try:
+                values, reverse = self.parse_cursor(cursor)
+            except InvalidCursor:
+                values, reverse = None, False
+
+        ordering = self.ordering
+        if reverse:
+            ordering = [
+                field_name[1:] if field_name.startswith("-") else f"-{field_name}"
+                for field_name in ordering
+            ]
+        queryset = self.queryset.order_by(*ordering)
+        if values is not None:
+            queryset = queryset.filter(self.get_condition(values, reverse))
+
+        # one object more tells whether there are more pages
+        object_list = list(queryset[:self.per_page + 1])
+        has_more = len(object_list) > self.per_page
+        object_list = object_list[:self.per_page]
+        if reverse:
+            object_list.reverse()
+            return KeysetPage(
+                object_list, self, has_next=True, has_previous=has_more
+            )
+        return KeysetPage(
+            object_list, self, has_next=has_more, has_previous=values is not None
+        )
+
+
+class KeysetPaginationMixin(object):
+    """
+    Paginates a ListView with a KeysetPaginator:
+    the page position is read from the "cursor" query parameter
+    """
+    keyset_ordering = ("-created", "-pk")
+    approximate_count = False
+    cursor_kwarg = "cursor"
+
+    def paginate_queryset(self, queryset, page_size):
+        paginator = KeysetPaginator(
+            queryset,
+            page_size,
+            ordering=self.keyset_ordering,
+            approximate_count=self.approximate_count,
+        )
+        page = paginator.get_page(self.request.GET.get(self.cursor_kwarg))
+        return (paginator, page, page.object_list, page.has_other_pages())
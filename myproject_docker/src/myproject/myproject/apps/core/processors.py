@@ -1,11 +1,78 @@
+import os
+from functools import lru_cache
+
 from pilkit.lib import Image
 
+POSITIONS = ("fill", "center", "top-left", "top-right", "bottom-left", "bottom-right")
+
+
+@lru_cache(maxsize=8)
+def load_watermark(path, mtime):
+    """
+    Reads the watermark once per process and modification time
+    """
+    watermark = Image.open(path)
+    return watermark.convert("RGBA")
+
+
+@lru_cache(maxsize=64)
+def get_prepared_watermark(path, mtime, size, mode, position, opacity):
+    """
+    Returns the watermark scaled for an image of the given size and
+    converted to its mode, and the mask with the opacity applied
+    """
+    watermark = load_watermark(path, mtime)
+    if position == "fill":
+        if watermark.size != size:
+            watermark = watermark.resize(size, Image.LANCZOS)
+    elif watermark.width > size[0] or watermark.height > size[1]:
+        watermark = watermark.copy()
+        watermark.thumbnail(size, Image.LANCZOS)
+    mask = watermark.getchannel("A")
+    if opacity < 1:
+        mask = mask.point(lambda value: round(value * opacity))
+    return watermark.convert(mode), mask
+
+
+def get_offset(position, size, overlay_size):
+    width, height = size
+    overlay_width, overlay_height = overlay_size
+    if position in ("fill", "center"):
+        return (width - overlay_width) // 2, (height - overlay_height) // 2
+    vertical, horizontal = position.split("-")
+    left = 0 if horizontal == "left" else width - overlay_width
+    top = 0 if vertical == "top" else height - overlay_height
+    return left, top
+
+
 class WatermarkOverlay(object):
-    def __init__(self, watermark_image):
+    """
+    Draws a watermark with transparency over the image.
+
+    The watermark is stretched over the whole image with the position
+    "fill" or placed in the center or a corner at its own size.
+    """
+    def __init__(self, watermark_image, position="fill", opacity=1.0):
+        if position not in POSITIONS:
+            raise ValueError(f"Unknown watermark position: {position}")
         self.watermark_image = watermark_image
+        self.position = position
+        self.opacity = opacity
 
     def process(self, img):
-        original = img.convert('RGBA')
-        overlay = Image.open(self.watermark_image)
-        img = Image.alpha_composite(original, overlay).convert('RGB')
-        return img
\ No newline at end of file
+        if img.mode == "RGB":
+            img = img.copy()
+        else:
+            img = img.convert("RGB")
+        overlay, mask = get_prepared_watermark(
+            self.watermark_image,
+            os.path.getmtime(self.watermark_image),
+            img.size,
+            img.mode,
+            self.position,
+            self.opacity,
+        )
+        # pasting with the alpha channel as the mask blends the watermark
+        # into the RGB image without converting the image to RGBA and back
+        img.paste(overlay, get_offset(self.position, img.size, overlay.size), mask)
+        return img
@@ -0,0 +1,254 @@
+"""
+Eager generation of the image renditions.
+
+Imagekit generates the renditions of an ImageSpecField (and the
+responsive renditions of core.imagegenerators) when their URL is
+first requested, which happens while a list template is rendered. With
+the DeferredStrategy the templates never generate anything; instead the
+renditions of a saved picture are generated in a pool of spawned worker
+processes after the transaction was committed, and the warm_renditions
+command generates the missing renditions of all existing pictures.
+
+The workers only need the spec id and the name of the source file, so
+they don't touch the database.
+"""
+import contextlib
+import logging
+import multiprocessing
+import os
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache, partial
+
+from django.conf import settings
+
+logger = logging.getLogger(__name__)
+
+RenditionSpec = namedtuple("RenditionSpec", ["attname", "source_field_name", "spec_id"])
+RenditionTask = namedtuple("RenditionTask", ["model_label", "source_field_name", "spec_id", "source_name"])
+
+_executor = None
+_executor_pid = None
+
+
+class DeferredStrategy(object):
+    """
+    A cache file strategy which doesn't generate the renditions when
+    their URL is requested, but only when their content is read
+    """
+    def on_content_required(self, file):
+        file.generate()
+
+    def should_verify_existence(self, file):
+        # {% if spec %} in templates tells whether it's generated yet
+        return True
+
+
+@lru_cache(maxsize=None)
+def get_rendition_specs(model):
+    """
+    Returns the RenditionSpecs of the ImageSpecFields of a model
+    """
+    from imagekit.models.fields.utils import ImageSpecFileDescriptor
+
+    specs = []
+    for klass in reversed(model.__mro__):
+        for attname, value in vars(klass).items():
+            if isinstance(value, ImageSpecFileDescriptor):
+                specs.append(
+                    RenditionSpec(attname, value.source_field_name, value.field.spec_id)
+                )
+    return specs
+
+
+def get_source_field_names(model):
+    source_field_names = []
+    for spec in get_rendition_specs(model):
+        if spec.source_field_name not in source_field_names:
+            source_field_names.append(spec.source_field_name)
+    return source_field_names
+
+
+def get_source_names(instance):
+    """
+    Returns the file names of the loaded picture fields without
+    querying the deferred ones
+    """
+    source_names = {}
+    for source_field_name in get_source_field_names(type(instance)):
+        if source_field_name in instance.__dict__:
+            value = instance.__dict__[source_field_name]
+            source_names[source_field_name] = getattr(value, "name", value) or ""
+    return source_names
+
+
+def remember_source_names(instance):
+    """
+    Called on post_init to tell the changed pictures apart on save
+    """
+    instance._rendition_source_names = get_source_names(instance)
+
+
+def get_rendition_tasks(instance, source_field_names=None):
+    """
+    Returns the RenditionTasks of the ImageSpecFields of an instance and
+    of the responsive renditions of their source pictures
+    """
+    from .imagegenerators import get_responsive_spec_ids
+
+    if source_field_names is None:
+        source_field_names = get_source_field_names(type(instance))
+    model_label = instance._meta.label
+    tasks = []
+    for spec in get_rendition_specs(type(instance)):
+        if spec.source_field_name not in source_field_names:
+            continue
+        source = getattr(instance, spec.source_field_name)
+        if source:
+            tasks.append(
+                RenditionTask(model_label, spec.source_field_name, spec.spec_id, source.name)
+            )
+    for source_field_name in source_field_names:
+        source = getattr(instance, source_field_name)
+        if source:
+            tasks += [
+                RenditionTask(model_label, source_field_name, spec_id, source.name)
+                for spec_id in get_responsive_spec_ids()
+            ]
+    return tasks
+
+
+def generate_rendition(model_label, source_field_name, spec_id, source_name, force=False):
+    """
+    Generates one rendition unless it exists already
+    """
+    from django.apps import apps
+    from imagekit.cachefiles import ImageCacheFile
+    from imagekit.registry import generator_registry
+    from . import imagegenerators  # registers the responsive specs
+
+    field = apps.get_model(model_label)._meta.get_field(source_field_name)
+    source = field.attr_class(None, field, source_name)
+    try:
+        spec = generator_registry.get(spec_id, source=source)
+        ImageCacheFile(spec).generate(force=force)
+    finally:
+        source.close()
+    return spec_id, source_name
+
+
+def delete_renditions(model_label, source_field_name, source_name):
+    """
+    Deletes all renditions of a picture, including the responsive ones,
+    and forgets that they exist
+    """
+    from django.apps import apps
+    from imagekit.cachefiles import ImageCacheFile
+    from imagekit.cachefiles.backends import CacheFileState
+    from imagekit.registry import generator_registry
+    from .imagegenerators import get_responsive_spec_ids
+
+    model = apps.get_model(model_label)
+    field = model._meta.get_field(source_field_name)
+    source = field.attr_class(None, field, source_name)
+    spec_ids = [
+        spec.spec_id for spec in get_rendition_specs(model)
+        if spec.source_field_name == source_field_name
+    ]
+    spec_ids += get_responsive_spec_ids()
+    for spec_id in spec_ids:
+        rendition = ImageCacheFile(generator_registry.get(spec_id, source=source))
+        with contextlib.suppress(FileNotFoundError):
+            rendition.storage.delete(rendition.name)
+        rendition.cachefile_backend.set_state(rendition, CacheFileState.DOES_NOT_EXIST)
+
+
+def delete_released_renditions(instance, released_names):
+    """
+    Deletes the renditions of the pictures which are no longer
+    referenced by any row as soon as the transaction is committed
+    """
+    from django.db import transaction
+
+    source_field_names = get_source_field_names(type(instance))
+    for source_field_name, source_name in released_names:
+        if source_field_name in source_field_names:
+            transaction.on_commit(partial(
+                delete_renditions,
+                instance._meta.label,
+                source_field_name,
+                source_name,
+            ))
+
+
+def _init_worker():
+    import django
+    from django.apps import apps
+    from django.core.cache import caches
+
+    if not apps.ready:
+        # the spawned workers start without the Django setup
+        django.setup()
+    # the forked workers of warm_renditions must not share the cache connections
+    for cache in caches.all():
+        cache.close()
+
+
+def get_executor():
+    """
+    Returns the process pool of the current process. The workers are
+    spawned instead of forked, because the web process forks them on
+    demand while its requests have open database and cache connections.
+    """
+    global _executor, _executor_pid
+    if _executor is None or _executor_pid != os.getpid():
+        _executor = ProcessPoolExecutor(
+            max_workers=getattr(settings, "RENDITION_WORKERS", None),  # by default the amount of CPUs
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+        )
+        _executor_pid = os.getpid()
+    return _executor
+
+
+def _log_failure(future):
+    exception = future.exception()
+    if exception is not None:
+        logger.error("Rendition failed: %r", exception)
+
+
+def enqueue_renditions(tasks, force=False):
+    """
+    Generates the renditions in the process pool, or in the current
+    process when the setting RENDITIONS_ASYNC is False
+    """
+    if not getattr(settings, "RENDITIONS_ASYNC", True):
+        for task in tasks:
+            generate_rendition(*task, force=force)
+        return
+    executor = get_executor()
+    for task in tasks:
+        future = executor.submit(generate_rendition, *task, force=force)
+        future.add_done_callback(_log_failure)
+
+
+def schedule_renditions(instance, created=False):
+    """
+    Enqueues the renditions of the new or changed pictures of a saved
+    instance as soon as the current transaction is committed
+    """
+    from django.db import transaction
+
+    old_source_names = getattr(instance, "_rendition_source_names", {})
+    new_source_names = get_source_names(instance)
+    changed_field_names = [
+        source_field_name
+        for source_field_name, source_name in new_source_names.items()
+        if source_name and (created or source_name != old_source_names.get(source_field_name))
+    ]
+    instance._rendition_source_names = new_source_names
+    if not changed_field_names:
+        return
+    tasks = get_rendition_tasks(instance, changed_field_names)
+    if tasks:
+        transaction.on_commit(lambda: enqueue_renditions(tasks))
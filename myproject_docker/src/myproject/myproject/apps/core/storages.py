@@ -0,0 +1,344 @@
+"""
+Content-addressed media storage.
+
+The uploads are hashed with SHA-256 while they are read, and each
+distinct content is stored only once in the wrapped storage as a blob
+named by its hash alone. The names saved in the model fields keep the
+directory of upload_to and the original filename, e.g.
+"ideas/2020/01/<hash>/beach.jpg", so re-uploads and copies of the
+same file point to the same blob.
+
+StoredBlob counts the saved rows which reference a blob: the post_save
+and post_delete signal handlers of the models call
+update_file_references() and release_file_references(), so copies of a
+name without a new upload and QuerySet.delete() are counted too. The
+blob is deleted after its last reference was released. The StoredBlob
+row of a hash is kept with a reference count of zero, so that saving
+and deleting the same content always lock the same row.
+"""
+import hashlib
+import os
+import re
+import tempfile
+
+from django.conf import settings
+from django.core.files import File
+from django.core.files.storage import Storage, default_storage
+from django.db import models, transaction
+from django.utils.deconstruct import deconstructible
+
+CHUNK_SIZE = 64 * 1024
+SPOOL_MAX_SIZE = getattr(settings, "CONTENT_ADDRESSED_SPOOL_MAX_SIZE", 5 * 1024 * 1024)  # bytes
+BLOB_DIRECTORY = getattr(settings, "CONTENT_ADDRESSED_BLOB_DIRECTORY", "blobs")
+
+CONTENT_HASH_REGEX = re.compile(r"(?:^|/)(?P<hash>[0-9a-f]{64})/[^/]+$")
+
+
+def get_content_hash(name):
+    """
+    Returns the content hash of a content-addressed name or None
+    """
+    match = CONTENT_HASH_REGEX.search(name or "")
+    return match.group("hash") if match else None
+
+
+def get_blob_name(content_hash):
+    # the same content uploaded with different extensions is one blob
+    return f"{BLOB_DIRECTORY}/{content_hash[:2]}/{content_hash}"
+
+
+@deconstructible
+class ContentAddressedStorage(Storage):
+    def __init__(self, storage=None):
+        self._storage = storage
+
+    @property
+    def storage(self):
+        return self._storage or default_storage
+
+    def hash_content(self, content):
+        """
+        Returns the SHA-256 hash and the size of the content and a file
+        to read the content from again; content which can't be read
+        twice is spooled into a temporary file while it's hashed
+        """
+        sha256 = hashlib.sha256()
+        size = 0
+        readable = content
+        if not content.seekable():
+            readable = File(
+                tempfile.SpooledTemporaryFile(max_size=SPOOL_MAX_SIZE),
+                name=content.name,
+            )
+        for chunk in content.chunks(CHUNK_SIZE):
+            sha256.update(chunk)
+            size += len(chunk)
+            if readable is not content:
+                readable.write(chunk)
+        readable.seek(0)
+        return sha256.hexdigest(), size, readable
+
+    def get_available_name(self, name, max_length=None):
+        # a name is only reused for the same content
+        return name
+
+    def save(self, name, content, max_length=None):
+        if name is None:
+            name = content.name
+        if not hasattr(content, "chunks"):
+            content = File(content, name)
+        return self._save(name, content, max_length=max_length)
+
+    def _save(self, name, content, max_length=None):
+        from .models import StoredBlob
+
+        content_hash, size, readable = self.hash_content(content)
+        blob_name = get_blob_name(content_hash)
+        with transaction.atomic():
+            # the lock serializes the saving and deleting of the blob;
+            # the reference is counted when a row is saved with the name
+            StoredBlob.objects.select_for_update().get_or_create(
+                content_hash=content_hash, defaults={"size": size}
+            )
+            if not self.storage.exists(blob_name):
+                saved_name = self.storage.save(blob_name, readable)
+                if saved_name != blob_name:
+                    self.storage.delete(saved_name)
+                    raise IOError(f"The blob {blob_name} couldn't be saved.")
+
+        directory, filename = os.path.split(name)
+        name = f"{directory}/{content_hash}/{filename}".lstrip("/")
+        if max_length is not None and len(name) > max_length:
+            # shorten the filename, but keep its extension
+            base, extension = os.path.splitext(filename)
+            base = base[:max(1, len(base) - (len(name) - max_length))]
+            name = f"{directory}/{content_hash}/{base}{extension}".lstrip("/")
+        return name
+
+    def _open(self, name, mode="rb"):
+        return self.storage.open(self.get_stored_name(name), mode)
+
+    def get_stored_name(self, name):
+        """
+        Returns the name of the blob in the wrapped storage, or the
+        name itself for files saved before the content addressing
+        """
+        content_hash = get_content_hash(name)
+        if content_hash is None:
+            return name
+        return get_blob_name(content_hash)
+
+    def get_reference_count(self, name):
+        from .models import StoredBlob
+
+        content_hash = get_content_hash(name)
+        if content_hash is None:
+            return 1
+        return (
+            StoredBlob.objects.filter(content_hash=content_hash)
+            .values_list("reference_count", flat=True)
+            .first()
+        ) or 0
+
+    def add_reference(self, name):
+        """
+        Counts a saved row which references the name
+        """
+        from .models import StoredBlob
+
+        content_hash = get_content_hash(name)
+        if content_hash is None:
+            return
+        with transaction.atomic():
+            blob, created = StoredBlob.objects.select_for_update().get_or_create(
+                content_hash=content_hash,
+                defaults={"size": self.storage.size(get_blob_name(content_hash))},
+            )
+            StoredBlob.objects.filter(pk=blob.pk).update(
+                reference_count=models.F("reference_count") + 1
+            )
+
+    def release(self, name):
+        """
+        Releases the reference of a saved row and deletes the blob after
+        the last one. Returns True when the file is no longer referenced.
+        """
+        from .models import StoredBlob
+
+        content_hash = get_content_hash(name)
+        if content_hash is None:
+            # the files saved before the content addressing aren't counted
+            return False
+        with transaction.atomic():
+            blob = (
+                StoredBlob.objects.select_for_update()
+                .filter(content_hash=content_hash)
+                .first()
+            )
+            if blob is None:
+                return False
+            if blob.reference_count > 0:
+                blob.reference_count -= 1
+                blob.save(update_fields=["reference_count", "modified"])
+            if blob.reference_count > 0:
+                return False
+            transaction.on_commit(lambda: self.delete_unreferenced_blob(content_hash))
+        return True
+
+    def delete(self, name):
+        """
+        Deletes the blob unless saved rows reference it; they release
+        their references when they are changed or deleted
+        """
+        from .models import StoredBlob
+
+        content_hash = get_content_hash(name)
+        if content_hash is None:
+            self.storage.delete(name)
+            return
+        with transaction.atomic():
+            blob = (
+                StoredBlob.objects.select_for_update()
+                .filter(content_hash=content_hash)
+                .first()
+            )
+            if blob is not None and blob.reference_count == 0:
+                transaction.on_commit(lambda: self.delete_unreferenced_blob(content_hash))
+
+    def delete_unreferenced_blob(self, content_hash):
+        """
+        Deletes the blob file unless it was saved again in the meantime
+        """
+        from .models import StoredBlob
+
+        with transaction.atomic():
+            blob = (
+                StoredBlob.objects.select_for_update()
+                .filter(content_hash=content_hash)
+                .first()
+            )
+            if blob is not None and blob.reference_count == 0:
+                self.storage.delete(get_blob_name(content_hash))
+
+    def exists(self, name):
+        return self.storage.exists(self.get_stored_name(name))
+
+    def listdir(self, path):
+        return self.storage.listdir(path)
+
+    def size(self, name):
+        return self.storage.size(self.get_stored_name(name))
+
+    def url(self, name):
+        return self.storage.url(self.get_stored_name(name))
+
+    def path(self, name):
+        return self.storage.path(self.get_stored_name(name))
+
+    def get_accessed_time(self, name):
+        return self.storage.get_accessed_time(self.get_stored_name(name))
+
+    def get_created_time(self, name):
+        return self.storage.get_created_time(self.get_stored_name(name))
+
+    def get_modified_time(self, name):
+        return self.storage.get_modified_time(self.get_stored_name(name))
+
+
+content_addressed_storage = ContentAddressedStorage()
+
+
+def get_file_names(instance):
+    """
+    Returns the names of the loaded content-addressed file fields
+    without querying the deferred ones
+    """
+    file_names = {}
+    for field in instance._meta.concrete_fields:
+        if not isinstance(field, models.FileField):
+            continue
+        if not isinstance(field.storage, ContentAddressedStorage):
+            continue
+        if field.attname in instance.__dict__:
+            value = instance.__dict__[field.attname]
+            file_names[field.attname] = getattr(value, "name", value) or ""
+    return file_names
+
+
+def remember_file_names(instance):
+    """
+    Called on post_init to tell the changed files apart on save
+    """
+    instance._content_addressed_names = get_file_names(instance)
+
+
+def update_file_references(instance, created=False):
+    """
+    Called on post_save: counts the references of the new names and
+    releases the replaced ones. Returns the (field name, file name)
+    pairs of the files which are no longer referenced.
+    """
+    old_names = {} if created else getattr(instance, "_content_addressed_names", {})
+    new_names = get_file_names(instance)
+    released = []
+    for field_name, name in new_names.items():
+        old_name = old_names.get(field_name, "")
+        if name == old_name:
+            continue
+        storage = instance._meta.get_field(field_name).storage
+        if name:
+            storage.add_reference(name)
+        if old_name and storage.release(old_name):
+            released.append((field_name, old_name))
+    instance._content_addressed_names = new_names
+    return released
+
+
+def release_file_references(instance):
+    """
+    Called on post_delete: releases the references of the deleted row.
+    Returns the (field name, file name) pairs of the files which are no
+    longer referenced.
+    """
+    released = []
+    for field_name, name in get_file_names(instance).items():
+        if not name:
+            continue
+        storage = instance._meta.get_field(field_name).storage
+        if get_content_hash(name) is None:
+            # the files saved before the content addressing were
+            # deleted with their rows
+            storage.delete(name)
+            released.append((field_name, name))
+        elif storage.release(name):
+            released.append((field_name, name))
+    return released
+
+
+def content_hash_as_path(generator):
+    """
+    An imagekit cache file namer which names the renditions of
+    content-addressed files by the content hash and the spec, so that
+    all copies of a file share their renditions
+    """
+    import pickle
+    from imagekit.cachefiles.namers import source_name_as_path
+    from imagekit.utils import suggest_extension
+
+    source_name = getattr(generator.source, "name", None)
+    content_hash = get_content_hash(source_name)
+    if content_hash is None:
+        return source_name_as_path(generator)
+    spec_hash = hashlib.md5(pickle.dumps([
+        generator.processors,
+        generator.format,
+        generator.options,
+        generator.autoconvert,
+    ])).hexdigest()
+    extension = suggest_extension(source_name, generator.format)
+    return os.path.normpath(os.path.join(
+        getattr(settings, "IMAGEKIT_CACHEFILE_DIR", "CACHE/images"),
+        content_hash[:2],
+        content_hash,
+        f"{spec_hash}{extension}",
+    ))
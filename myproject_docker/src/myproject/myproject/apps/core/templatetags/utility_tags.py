@@ -313,3 +313,74 @@ def humanize_url(url, letter_count=40):
     if len(url) > letter_count:
         url = f"{url[:letter_count - 1]}…"
     return url
+
+
+@register.filter
+def rendition_url(rendition):
+    """
+    Returns the URL of a generated rendition, or the URL of its source
+    picture until the rendition workers have generated it
+    """
+    # the DeferredStrategy checks whether the rendition exists
+    if rendition:
+        return rendition.url
+    source = getattr(rendition.generator, "source", None)
+    return source.url if source else ""
+
+
+@register.inclusion_tag("misc/includes/responsive_picture.html")
+def responsive_picture(source, preset, alt="", sizes="100vw", css_class=""):
+    """
+    Renders a <picture> with the responsive renditions of an image file
+    in the modern formats and a JPEG fallback
+    """
+    from imagekit.cachefiles import ImageCacheFile
+    from imagekit.registry import generator_registry
+    from myproject.apps.core.imagegenerators import (
+        RESPONSIVE_IMAGE_PRESETS,
+        get_height,
+        get_spec_id,
+        get_supported_formats,
+    )
+
+    context = {"alt": alt, "sizes": sizes, "css_class": css_class, "sources": []}
+    if not source:
+        return context
+    aspect_ratio, widths = RESPONSIVE_IMAGE_PRESETS[preset]
+    default_index = len(widths) // 2
+    for image_format in get_supported_formats():
+        renditions = [
+            ImageCacheFile(
+                generator_registry.get(
+                    get_spec_id(preset, width, image_format), source=source
+                )
+            )
+            for width in widths
+        ]
+        # the URLs don't generate the renditions; see DeferredStrategy
+        if not all(renditions):
+            continue
+        urls = [rendition.url for rendition in renditions]
+        context["sources"].append({
+            "mime_type": image_format.mime_type,
+            "srcset": ", ".join(
+                f"{url} {width}w" for url, width in zip(urls, widths)
+            ),
+            "urls": urls,
+        })
+    context.update({
+        "width": widths[default_index],
+        "height": get_height(preset, widths[default_index]),
+    })
+    # the last format is JPEG, which is supported by all browsers
+    if not context["sources"] or context["sources"][-1]["mime_type"] != "image/jpeg":
+        # the original picture until the rendition workers have generated
+        # the JPEG renditions; the modern formats need the fallback
+        context.update({"sources": [], "fallback_srcset": "", "src": source.url})
+        return context
+    fallback = context["sources"].pop()
+    context.update({
+        "fallback_srcset": fallback["srcset"],
+        "src": fallback["urls"][default_index],
+    })
+    return context
@@ -0,0 +1,85 @@
+from django.conf import settings
+from django.db import models
+from django.test import SimpleTestCase
+from django.utils import translation
+
+from ..model_fields import MultilingualCharField, MultilingualTextField
+from ..models import MultilingualQuerySet
+
+
+class MultilingualArticle(models.Model):
+    # no model of the project uses the multilingual fields yet,
+    # so the tests declare one without a table
+    title = MultilingualCharField("Title", max_length=200)
+    description = MultilingualTextField("Description", blank=True)
+
+    objects = MultilingualQuerySet.as_manager()
+
+    class Meta:
+        app_label = "core"
+        managed = False
+
+
+class MultilingualFieldTest(SimpleTestCase):
+    def test_localized_field_names(self):
+        lang_codes = [lang_code for lang_code, lang_name in settings.LANGUAGES]
+        self.assertEqual(
+            set(MultilingualArticle.multilingual_fields), {"title", "description"}
+        )
+        self.assertEqual(
+            MultilingualArticle.multilingual_fields["title"],
+            {lang_code: f"title_{lang_code.replace('-', '_')}" for lang_code in lang_codes},
+        )
+        field_names = {field.name for field in MultilingualArticle._meta.get_fields()}
+        for localized_field_names in MultilingualArticle.multilingual_fields.values():
+            self.assertLessEqual(set(localized_field_names.values()), field_names)
+
+    def test_translated_value(self):
+        article = MultilingualArticle(title_en="Lighthouse", title_de="Leuchtturm")
+        with translation.override("de"):
+            self.assertEqual(article.title, "Leuchtturm")
+        # the other languages fall back to the default language
+        with translation.override("fr"):
+            self.assertEqual(article.title, "Lighthouse")
+
+
+class MultilingualQuerySetTest(SimpleTestCase):
+    def get_deferred_field_names(self, queryset):
+        field_names, defer = queryset.query.deferred_loading
+        self.assertTrue(defer)
+        return set(field_names)
+
+    def get_column_names(self, lang_codes):
+        return {
+            localized_field_names[lang_code]
+            for localized_field_names in MultilingualArticle.multilingual_fields.values()
+            for lang_code in lang_codes
+        }
+
+    def test_other_languages_are_deferred(self):
+        other_lang_codes = [
+            lang_code for lang_code, lang_name in settings.LANGUAGES
+            if lang_code not in ("de", settings.LANGUAGE_CODE)
+        ]
+        self.assertEqual(
+            self.get_deferred_field_names(MultilingualArticle.objects.for_language("de")),
+            self.get_column_names(other_lang_codes),
+        )
+        with translation.override("de"):
+            self.assertEqual(
+                self.get_deferred_field_names(MultilingualArticle.objects.for_language()),
+                self.get_column_names(other_lang_codes),
+            )
+
+    def test_default_language_is_enough(self):
+        other_lang_codes = [
+            lang_code for lang_code, lang_name in settings.LANGUAGES
+            if lang_code != settings.LANGUAGE_CODE
+        ]
+        queryset = MultilingualArticle.objects.for_language(settings.LANGUAGE_CODE)
+        self.assertEqual(
+            self.get_deferred_field_names(queryset),
+            self.get_column_names(other_lang_codes),
+        )
+        self.assertNotIn("title_de", str(queryset.query))
+        self.assertIn(f"title_{settings.LANGUAGE_CODE}", str(queryset.query))
@@ -0,0 +1,55 @@
+from django.test import TestCase
+
+from myproject.apps.ideas.models import Idea
+
+
+class KeysetPaginatorTest(TestCase):
+    def setUp(self):
+        from myproject.apps.accounts.models import User
+
+        # titles are only unique for ideas without an author
+        author = User.objects.create_user(
+            username="author", password="author", email="author@example.com"
+        )
+        # equal titles are ordered by the pk
+        for title in ["Alpha", "Beta", "Beta", "Gamma", "Delta"]:
+            Idea.objects.create(
+                title=title,
+                content="",
+                author=author,
+                picture="ideas/2020/01/idea.jpg",
+            )
+        self.queryset = Idea.objects.with_translated_fields("title")
+        self.expected = list(self.queryset.order_by("translated_title", "pk"))
+
+    def get_paginator(self):
+        from myproject.apps.core.paginators import KeysetPaginator
+
+        return KeysetPaginator(
+            self.queryset, 2, ordering=("translated_title", "pk")
+        )
+
+    def test_next_pages(self):
+        paginator = self.get_paginator()
+        ideas = []
+        page = paginator.get_page()
+        self.assertFalse(page.has_previous())
+        while True:
+            ideas += page.object_list
+            if not page.has_next():
+                break
+            page = paginator.get_page(page.next_cursor)
+        self.assertEqual(ideas, self.expected)
+
+    def test_previous_page(self):
+        paginator = self.get_paginator()
+        second_page = paginator.get_page(paginator.get_page().next_cursor)
+        third_page = paginator.get_page(second_page.next_cursor)
+        previous_page = paginator.get_page(third_page.previous_cursor)
+        self.assertEqual(previous_page.object_list, self.expected[2:4])
+        self.assertTrue(previous_page.has_previous())
+        self.assertTrue(previous_page.has_next())
+
+    def test_invalid_cursor_shows_first_page(self):
+        page = self.get_paginator().get_page("tampered")
+        self.assertEqual(page.object_list, self.expected[:2])
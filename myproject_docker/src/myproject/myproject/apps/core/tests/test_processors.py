@@ -0,0 +1,40 @@
+from django.test import TestCase
+
+
+class WatermarkOverlayTest(TestCase):
+    def setUp(self):
+        import tempfile
+        from PIL import Image
+
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.watermark_path = f"{self.tmp_dir.name}/watermark.png"
+        # a half transparent white watermark
+        Image.new("RGBA", (100, 50), (255, 255, 255, 128)).save(self.watermark_path)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def test_watermark_is_scaled_and_cached(self):
+        from PIL import Image
+        from myproject.apps.core.processors import WatermarkOverlay, load_watermark
+
+        load_watermark.cache_clear()
+        processor = WatermarkOverlay(watermark_image=self.watermark_path)
+        for index in range(3):
+            img = processor.process(Image.new("RGB", (800, 400), (0, 0, 0)))
+        self.assertEqual(load_watermark.cache_info().misses, 1)
+        self.assertEqual(img.mode, "RGB")
+        self.assertEqual(img.size, (800, 400))
+        self.assertEqual(img.getpixel((799, 399)), (128, 128, 128))
+
+    def test_position_and_opacity(self):
+        from PIL import Image
+        from myproject.apps.core.processors import WatermarkOverlay
+
+        processor = WatermarkOverlay(
+            watermark_image=self.watermark_path, position="bottom-right", opacity=0.5
+        )
+        img = processor.process(Image.new("RGBA", (800, 400), (0, 0, 0, 255)))
+        self.assertEqual(img.mode, "RGB")
+        self.assertEqual(img.getpixel((0, 0)), (0, 0, 0))
+        self.assertEqual(img.getpixel((799, 399)), (64, 64, 64))
@@ -0,0 +1,194 @@
+import re
+import shutil
+import tempfile
+from io import StringIO
+from unittest import mock
+
+from django.core.management import call_command
+from django.db import transaction
+from django.test import TestCase, TransactionTestCase, override_settings
+
+from myproject.apps.ideas.models import Idea
+
+
+class RenditionsTest(TestCase):
+    def test_rendition_specs(self):
+        from myproject.apps.core.renditions import get_rendition_specs
+
+        self.assertEqual(
+            {spec.attname for spec in get_rendition_specs(Idea)},
+            {
+                "picture_social",
+                "picture_large",
+                "picture_thumnail",
+                "watermarked_picture_large",
+            },
+        )
+
+    def test_url_doesnt_generate_rendition(self):
+        from imagekit.cachefiles import ImageCacheFile
+
+        idea = Idea.objects.create(
+            title="Idea", content="", picture="ideas/2020/01/idea.jpg"
+        )
+        with mock.patch.object(ImageCacheFile, "generate") as generate:
+            self.assertTrue(idea.picture_thumnail.url)
+        generate.assert_not_called()
+
+
+def create_image_content(size=(1200, 600)):
+    from io import BytesIO
+    from django.core.files.base import ContentFile
+    from PIL import Image
+
+    image_file = BytesIO()
+    Image.new("RGB", size, (200, 100, 50)).save(image_file, "JPEG")
+    return ContentFile(image_file.getvalue())
+
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class ScheduleRenditionsTest(TransactionTestCase):
+    def test_renditions_are_enqueued_on_commit(self):
+        from myproject.apps.core.imagegenerators import get_responsive_spec_ids
+
+        with mock.patch("myproject.apps.core.renditions.enqueue_renditions") as enqueue:
+            with transaction.atomic():
+                idea = Idea.objects.create(
+                    title="Idea", content="", picture="ideas/2020/01/idea.jpg"
+                )
+                enqueue.assert_not_called()
+            enqueue.assert_called_once()
+            tasks = enqueue.call_args[0][0]
+        self.assertEqual(len(tasks), 4 + len(get_responsive_spec_ids()))
+        self.assertEqual({task.source_name for task in tasks}, {"ideas/2020/01/idea.jpg"})
+
+    def test_only_changed_pictures_are_enqueued(self):
+        with mock.patch("myproject.apps.core.renditions.enqueue_renditions") as enqueue:
+            idea = Idea.objects.create(
+                title="Idea", content="", picture="ideas/2020/01/idea.jpg"
+            )
+            enqueue.reset_mock()
+
+            idea = Idea.objects.get(pk=idea.pk)
+            idea.title = "Changed idea"
+            idea.save()
+            enqueue.assert_not_called()
+
+            idea.picture = "ideas/2020/02/other.jpg"
+            idea.save()
+            enqueue.assert_called_once()
+            tasks = enqueue.call_args[0][0]
+        self.assertEqual({task.source_name for task in tasks}, {"ideas/2020/02/other.jpg"})
+
+
+@override_settings(CACHES=LOCMEM_CACHES, RENDITIONS_ASYNC=False)
+class GenerateRenditionTest(TestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.media_settings = override_settings(MEDIA_ROOT=self.media_root)
+        self.media_settings.enable()
+
+    def tearDown(self):
+        self.media_settings.disable()
+        shutil.rmtree(self.media_root, ignore_errors=True)
+
+    def test_renditions_are_generated_in_process(self):
+        from django.core.files.storage import default_storage
+        from imagekit.cachefiles import ImageCacheFile
+        from imagekit.registry import generator_registry
+        from myproject.apps.core.imagegenerators import get_responsive_spec_ids
+        from myproject.apps.core.renditions import enqueue_renditions, get_rendition_tasks
+
+        idea = Idea(title="Idea", content="")
+        idea.picture.save("photo.jpg", create_image_content(), save=False)
+        responsive_spec_id = get_responsive_spec_ids()[0]
+        tasks = [
+            task for task in get_rendition_tasks(idea)
+            if task.spec_id in (Idea.picture_large.spec_id, responsive_spec_id)
+        ]
+        self.assertEqual(len(tasks), 2)
+        self.assertFalse(default_storage.exists(idea.picture_large.name))
+
+        enqueue_renditions(tasks)
+        self.assertTrue(default_storage.exists(idea.picture_large.name))
+        responsive_file = ImageCacheFile(
+            generator_registry.get(responsive_spec_id, source=idea.picture)
+        )
+        self.assertTrue(default_storage.exists(responsive_file.name))
+
+
+class DeleteRenditionsTest(TransactionTestCase):
+    # the renditions are deleted on commit
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.media_settings = override_settings(MEDIA_ROOT=self.media_root)
+        self.media_settings.enable()
+
+    def tearDown(self):
+        self.media_settings.disable()
+        shutil.rmtree(self.media_root, ignore_errors=True)
+
+    def test_renditions_are_deleted_with_the_last_reference(self):
+        from django.core.files.storage import default_storage
+        from imagekit.cachefiles import ImageCacheFile
+        from imagekit.registry import generator_registry
+        from myproject.apps.core.renditions import enqueue_renditions, get_rendition_tasks
+
+        with mock.patch("myproject.apps.core.renditions.enqueue_renditions"):
+            idea = Idea(title="Idea", content="")
+            idea.picture.save("photo.jpg", create_image_content())
+            # a copy of the name without a second upload
+            copy = Idea.objects.create(title="Copy", content="", picture=idea.picture.name)
+        enqueue_renditions(get_rendition_tasks(idea))
+        rendition_names = [
+            ImageCacheFile(generator_registry.get(task.spec_id, source=idea.picture)).name
+            for task in get_rendition_tasks(idea)
+        ]
+        self.assertTrue(all(default_storage.exists(name) for name in rendition_names))
+
+        # the renditions are shared by all copies of the picture
+        Idea.objects.filter(pk=copy.pk).delete()
+        self.assertTrue(all(default_storage.exists(name) for name in rendition_names))
+        idea.delete()
+        self.assertFalse(any(default_storage.exists(name) for name in rendition_names))
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class WarmRenditionsCommandTest(TransactionTestCase):
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.media_settings = override_settings(MEDIA_ROOT=self.media_root)
+        self.media_settings.enable()
+
+    def tearDown(self):
+        self.media_settings.disable()
+        shutil.rmtree(self.media_root, ignore_errors=True)
+
+    def test_missing_renditions_are_generated(self):
+        from django.core.files.storage import default_storage
+        from myproject.apps.core.renditions import get_rendition_tasks
+
+        # the renditions aren't generated on save in this test
+        with mock.patch("myproject.apps.core.renditions.enqueue_renditions"):
+            idea = Idea(title="Idea", content="")
+            idea.picture.save("photo.jpg", create_image_content())
+        task_count = len(get_rendition_tasks(idea))
+
+        stdout, stderr = StringIO(), StringIO()
+        call_command(
+            "warm_renditions",
+            models=["ideas.Idea"],
+            workers=2,
+            stdout=stdout,
+            stderr=stderr,
+        )
+        output = stdout.getvalue()
+        checked_count = int(re.search(r"Renditions checked: (\d+)", output).group(1))
+        failed_count = int(re.search(r"Renditions failed: (\d+)", output).group(1))
+        self.assertEqual(checked_count + failed_count, task_count)
+        self.assertGreaterEqual(checked_count, task_count - 1)  # the watermark needs collectstatic
+        self.assertTrue(default_storage.exists(idea.picture_large.name))
+        self.assertTrue(default_storage.exists(idea.picture_thumnail.name))
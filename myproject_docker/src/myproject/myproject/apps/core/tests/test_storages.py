@@ -0,0 +1,170 @@
+import io
+import os
+import shutil
+import tempfile
+from unittest import mock
+
+from django.core.files import File
+from django.core.files.base import ContentFile
+from django.core.files.storage import FileSystemStorage
+from django.test import TransactionTestCase, override_settings
+
+from myproject.apps.ideas.models import Idea
+
+from ..models import StoredBlob
+from ..storages import CHUNK_SIZE, ContentAddressedStorage, get_content_hash
+
+
+class NonSeekableBytesIO(io.BytesIO):
+    def seekable(self):
+        return False
+
+    def seek(self, *args):
+        raise io.UnsupportedOperation("seek")
+
+
+class ContentAddressedStorageTest(TransactionTestCase):
+    # the blobs are deleted on commit
+    def setUp(self):
+        self.tmp_dir = tempfile.TemporaryDirectory()
+        self.backend = FileSystemStorage(location=self.tmp_dir.name)
+        self.storage = ContentAddressedStorage(storage=self.backend)
+
+    def tearDown(self):
+        self.tmp_dir.cleanup()
+
+    def get_blob_files(self):
+        return [
+            os.path.join(directory, filename)
+            for directory, subdirectories, filenames in os.walk(self.tmp_dir.name)
+            for filename in filenames
+        ]
+
+    def test_same_content_is_stored_once(self):
+        first_name = self.storage.save("ideas/2020/01/beach.jpg", ContentFile(b"beach"))
+        second_name = self.storage.save("ideas/2020/02/copy.jpg", ContentFile(b"beach"))
+        self.assertTrue(first_name.endswith("/beach.jpg"))
+        self.assertTrue(second_name.endswith("/copy.jpg"))
+        self.assertEqual(
+            self.storage.get_stored_name(first_name),
+            self.storage.get_stored_name(second_name),
+        )
+        self.assertEqual(len(self.get_blob_files()), 1)
+
+        # the saved rows count the references
+        self.storage.add_reference(first_name)
+        self.storage.add_reference(second_name)
+        self.assertEqual(StoredBlob.objects.get().reference_count, 2)
+
+        self.assertFalse(self.storage.release(first_name))
+        self.assertTrue(self.storage.exists(second_name))
+        with self.storage.open(second_name) as f:
+            self.assertEqual(f.read(), b"beach")
+
+        self.assertTrue(self.storage.release(second_name))
+        self.assertFalse(self.storage.exists(second_name))
+        self.assertEqual(StoredBlob.objects.get().reference_count, 0)
+
+    def test_referenced_blobs_arent_deleted(self):
+        name = self.storage.save("ideas/2020/01/beach.jpg", ContentFile(b"beach"))
+        self.storage.add_reference(name)
+        self.storage.delete(name)
+        self.assertTrue(self.storage.exists(name))
+
+    def test_content_is_saved_again_after_deletion(self):
+        name = self.storage.save("ideas/2020/01/beach.jpg", ContentFile(b"beach"))
+        self.storage.delete(name)
+        self.assertFalse(self.storage.exists(name))
+        name = self.storage.save("ideas/2020/01/beach.jpg", ContentFile(b"beach"))
+        self.assertTrue(self.storage.exists(name))
+
+    def test_extensions_dont_matter(self):
+        first_name = self.storage.save("ideas/2020/01/a.jpg", ContentFile(b"photo"))
+        second_name = self.storage.save("ideas/2020/01/b.jpeg", ContentFile(b"photo"))
+        self.assertEqual(len(self.get_blob_files()), 1)
+        self.storage.delete(first_name)
+        self.storage.delete(second_name)
+        self.assertEqual(self.get_blob_files(), [])
+
+    def test_long_filenames_are_shortened(self):
+        name = self.storage.save(
+            "ideas/2020/01/" + "x" * 100 + ".jpg", ContentFile(b"long"), max_length=100
+        )
+        self.assertEqual(len(name), 100)
+        self.assertTrue(name.endswith("x.jpg"))
+        self.assertIsNotNone(get_content_hash(name))
+        with self.storage.open(name) as f:
+            self.assertEqual(f.read(), b"long")
+
+    def test_legacy_names_without_hash(self):
+        name = self.backend.save("ideas/2019/01/old.jpg", ContentFile(b"old"))
+        self.assertIsNone(get_content_hash(name))
+        self.assertTrue(self.storage.exists(name))
+        self.assertEqual(self.storage.size(name), 3)
+        self.assertEqual(self.storage.path(name), self.backend.path(name))
+        with self.storage.open(name) as f:
+            self.assertEqual(f.read(), b"old")
+        self.storage.delete(name)
+        self.assertFalse(self.backend.exists(name))
+
+    def test_non_seekable_content_is_spooled(self):
+        data = os.urandom(CHUNK_SIZE * 3 + 1)
+        content = File(NonSeekableBytesIO(data), name="stream.bin")
+        name = self.storage.save("uploads/stream.bin", content)
+        with self.storage.open(name) as f:
+            self.assertEqual(f.read(), data)
+        self.assertEqual(StoredBlob.objects.get().size, len(data))
+
+
+class FileReferencesTest(TransactionTestCase):
+    # the blobs are deleted on commit
+    def setUp(self):
+        self.media_root = tempfile.mkdtemp()
+        self.media_settings = override_settings(MEDIA_ROOT=self.media_root)
+        self.media_settings.enable()
+        # the renditions aren't generated in this test
+        self.enqueue_patcher = mock.patch("myproject.apps.core.renditions.enqueue_renditions")
+        self.enqueue_patcher.start()
+
+    def tearDown(self):
+        self.enqueue_patcher.stop()
+        self.media_settings.disable()
+        shutil.rmtree(self.media_root, ignore_errors=True)
+
+    def create_idea(self, title, **kwargs):
+        idea = Idea(title=title, content="", **kwargs)
+        idea.save()
+        return idea
+
+    def test_rows_sharing_a_name(self):
+        idea = Idea(title="Idea", content="")
+        idea.picture.save("beach.jpg", ContentFile(b"beach"))
+        # no second upload, like "save as new" in the administration
+        copy = self.create_idea("Copy", picture=idea.picture.name)
+        storage = idea.picture.storage
+        self.assertEqual(storage.get_reference_count(idea.picture.name), 2)
+
+        Idea.objects.filter(pk=idea.pk).delete()
+        self.assertTrue(storage.exists(copy.picture.name))
+        self.assertEqual(storage.get_reference_count(copy.picture.name), 1)
+
+        copy = Idea.objects.get(pk=copy.pk)
+        copy.delete()
+        self.assertFalse(storage.exists(copy.picture.name))
+        self.assertEqual(storage.get_reference_count(copy.picture.name), 0)
+
+    def test_replaced_picture_is_released(self):
+        idea = Idea(title="Idea", content="")
+        idea.picture.save("beach.jpg", ContentFile(b"beach"))
+        old_name = idea.picture.name
+        copy = self.create_idea("Copy", picture=old_name)
+
+        idea.picture.save("sea.jpg", ContentFile(b"sea"))
+        storage = idea.picture.storage
+        self.assertEqual(storage.get_reference_count(old_name), 1)
+        self.assertEqual(storage.get_reference_count(idea.picture.name), 1)
+
+        copy.picture = idea.picture.name
+        copy.save()
+        self.assertFalse(storage.exists(old_name))
+        self.assertEqual(storage.get_reference_count(idea.picture.name), 2)
@@ -0,0 +1,54 @@
+from unittest import mock
+
+from django.test import TestCase
+
+from myproject.apps.ideas.models import Idea
+
+
+class ResponsivePictureTest(TestCase):
+    def render(self, idea):
+        from django.template import Context, Template
+        from django.test import RequestFactory
+
+        return Template(
+            '{% load utility_tags %}{% responsive_picture idea.picture "card" alt="Idea" %}'
+        ).render(Context({"idea": idea, "request": RequestFactory().get("/")}))
+
+    def test_picture_markup(self):
+        idea = Idea.objects.create(
+            title="Idea", content="", picture="ideas/2020/01/idea.jpg"
+        )
+        # as if the rendition workers had generated the renditions
+        with mock.patch(
+            "imagekit.cachefiles.ImageCacheFile.__bool__", return_value=True
+        ):
+            html = self.render(idea)
+        self.assertIn("<picture>", html)
+        self.assertIn('width="728" height="250"', html)
+        for width in (364, 728, 1092):
+            self.assertIn(f" {width}w", html)
+
+    def test_source_picture_until_the_renditions_exist(self):
+        idea = Idea.objects.create(
+            title="Idea", content="", picture="ideas/2020/01/idea.jpg"
+        )
+        html = self.render(idea)
+        self.assertIn(f'src="{idea.picture.url}"', html)
+        self.assertIn('width="728" height="250"', html)
+        self.assertNotIn("srcset", html)
+        self.assertNotIn("<source", html)
+
+    def test_rendition_url(self):
+        from django.template import Context, Template
+
+        idea = Idea.objects.create(
+            title="Idea", content="", picture="ideas/2020/01/idea.jpg"
+        )
+        template = Template("{% load utility_tags %}{{ idea.picture_large|rendition_url }}")
+        self.assertEqual(template.render(Context({"idea": idea})), idea.picture.url)
+        with mock.patch(
+            "imagekit.cachefiles.ImageCacheFile.__bool__", return_value=True
+        ):
+            self.assertEqual(
+                template.render(Context({"idea": idea})), idea.picture_large.url
+            )
@@ -4,4 +4,7 @@ from django.utils.translation import gettext_lazy as _
 
 class IdeasAppConfig(AppConfig):
     name = "myproject.apps.ideas"
-    verbose_name = _("Ideas")
\ No newline at end of file
+    verbose_name = _("Ideas")
+
+    def ready(self):
+        from . import signals
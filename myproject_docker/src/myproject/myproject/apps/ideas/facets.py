@@ -0,0 +1,117 @@
+"""
+Facet counts of the idea list.
+
+The counts of the authors, categories and ratings of the filtered ideas
+are computed with one grouped query per facet and cached per filter
+combination. Any change of the ideas or categories increases the
+version in the cache keys, which invalidates all cached facets at once.
+"""
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import models
+from django.db.models.functions import Coalesce
+
+FACETS_CACHE_TIMEOUT = getattr(settings, "IDEAS_FACETS_CACHE_TIMEOUT", 300)  # seconds
+
+
+def get_facets_version():
+    # starting from the current time, an evicted version
+    # can't bring back the facets of an older one
+    return cache.get_or_set("ideas:facets:version", int(time.time()), timeout=None)
+
+
+def invalidate_facets():
+    try:
+        cache.incr("ideas:facets:version")
+    except ValueError:
+        cache.set("ideas:facets:version", int(time.time()), timeout=None)
+
+
+def filter_by_category(qs, category):
+    """
+    Filters the ideas in the category or any of its descendants
+    without a join, so that no distinct() is necessary
+    """
+    from .models import Idea
+
+    Through = Idea.categories_django_mptt.through
+    return qs.filter(
+        pk__in=Through.objects.filter(
+            category__in=category.get_descendants(include_self=True)
+        ).values("idea")
+    )
+
+
+def get_facet_counts(qs):
+    """
+    Returns a dictionary of the authors and categories with an
+    idea_count attribute and of (rating, label, count) tuples
+    """
+    from django.contrib.auth import get_user_model
+    from myproject.apps.categories1.models import Category
+    from .models import Idea, RATING_CHOICES
+
+    User = get_user_model()
+    Through = Idea.categories_django_mptt.through
+    idea_ids = qs.order_by().values("pk")
+
+    authors = list(
+        User.objects.filter(authored_ideas__in=idea_ids)
+        .annotate(idea_count=models.Count("authored_ideas", distinct=True))
+        .order_by("username")
+    )
+
+    # the ideas of a category include the ideas of its descendants,
+    # which are the categories of the same tree between lft and rght
+    category_idea_count = (
+        Through.objects.filter(
+            idea__in=idea_ids,
+            category__tree_id=models.OuterRef("tree_id"),
+            category__lft__gte=models.OuterRef("lft"),
+            category__lft__lte=models.OuterRef("rght"),
+        )
+        .order_by()
+        .values("category__tree_id")
+        .annotate(count=models.Count("idea", distinct=True))
+        .values("count")
+    )
+    categories = list(
+        Category.objects.annotate(
+            idea_count=Coalesce(
+                models.Subquery(category_idea_count), 0
+            )
+        ).filter(idea_count__gt=0)
+    )
+
+    rating_counts = dict(
+        Idea.objects.filter(pk__in=idea_ids, rating__isnull=False)
+        .order_by()
+        .values_list("rating")
+        .annotate(count=models.Count("pk"))
+    )
+    ratings = [
+        (rating, label, rating_counts[rating])
+        for rating, label in RATING_CHOICES
+        if rating in rating_counts
+    ]
+    return {"authors": authors, "categories": categories, "ratings": ratings}
+
+
+def get_cached_facet_counts(qs, selected_filters):
+    """
+    Returns the facet counts from the cache for the filter combination
+    given as a dictionary of query parameters and selected values
+    """
+    filter_key = ":".join(
+        f"{query_param}={getattr(value, 'pk', value)}"
+        for query_param, value in sorted(selected_filters.items())
+        if value
+    )
+    cache_key = f"ideas:facets:{get_facets_version()}:{filter_key}"
+    facet_counts = cache.get(cache_key)
+    if facet_counts is None:
+        facet_counts = get_facet_counts(qs)
+        cache.set(cache_key, facet_counts, FACETS_CACHE_TIMEOUT)
+    return facet_counts
@@ -1,5 +1,4 @@
 import uuid
-import contextlib
 import os
 
 from imagekit.models import ImageSpecField
@@ -13,8 +12,13 @@ from django.utils.translation import gettext_lazy as _
 from django.conf import settings
 from django.core.exceptions import ValidationError
 
-from myproject.apps.core.models import UrlBase, CreationModificationDateBase
+from myproject.apps.core.models import (
+    UrlBase,
+    CreationModificationDateBase,
+    TranslatableQuerySet,
+)
 from myproject.apps.core.processors import WatermarkOverlay
+from myproject.apps.core.storages import content_addressed_storage
 
 from myproject.apps.core.model_fields import (
     MultilingualCharField,
@@ -64,10 +68,11 @@ RATING_CHOICES = (
 )
 
 def upload_to(instance, filename):
+    # the content-addressed storage adds the content hash as a directory
     now = timezone_now()
     base, extension = os.path.splitext(filename)
     extension = extension.lower()
-    return f"ideas/{now:%Y/%m}/{instance.pk}/{extension}"
+    return f"ideas/{now:%Y/%m}/{base}{extension}"
 
 class Idea(CreationModificationDateBase, UrlBase):
     uuid = models.UUIDField(
@@ -112,7 +117,14 @@ class Idea(CreationModificationDateBase, UrlBase):
     translated_title = TranslatedField("title")
     translated_content = TranslatedField("content")
 
-    picture = models.ImageField(_("Image"), upload_to=upload_to)
+    objects = TranslatableQuerySet.as_manager()
+
+    picture = models.ImageField(
+        _("Image"),
+        upload_to=upload_to,
+        storage=content_addressed_storage,
+        max_length=255,
+    )
     picture_social = ImageSpecField(
         source="picture",
         processors=[ResizeToFill(1024, 512)],
@@ -178,22 +190,6 @@ class Idea(CreationModificationDateBase, UrlBase):
                 _("The title cannot start or end with a whitespace.")
             )
 
-    def delete(self, *args, **kwargs):
-        from django.core.files.storage import default_storage
-        if self.picture:
-            with contextlib.suppress(FileNotFoundError):
-                default_storage.delete(
-                    self.picture_social.path
-                )
-                default_storage.delete(
-                    self.picture_large.path
-                )
-                default_storage.delete(
-                    self.picture_thumbnail.path
-                )
-            self.picture.delete()
-        super().delete(*args, **kwargs)
-
     @property
     def structured_data(self):
         from django.utils.translation import get_language
@@ -0,0 +1,56 @@
+from django.conf import settings
+from django.db.models.signals import m2m_changed, post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from myproject.apps.categories1.models import Category
+from myproject.apps.core.renditions import (
+    delete_released_renditions,
+    remember_source_names,
+    schedule_renditions,
+)
+from myproject.apps.core.storages import (
+    release_file_references,
+    remember_file_names,
+    update_file_references,
+)
+
+from .facets import invalidate_facets
+from .models import Idea
+
+
+@receiver(post_save, sender=Idea)
+@receiver(post_delete, sender=Idea)
+@receiver(post_save, sender=Category)
+@receiver(post_delete, sender=Category)
+@receiver(post_delete, sender=settings.AUTH_USER_MODEL)
+def invalidate_idea_facets(sender, **kwargs):
+    invalidate_facets()
+
+
+@receiver(m2m_changed, sender=Idea.categories_django_mptt.through)
+def invalidate_idea_category_facets(sender, **kwargs):
+    if kwargs["action"] in ("post_add", "post_remove", "post_clear"):
+        invalidate_facets()
+
+
+@receiver(post_init, sender=Idea)
+def remember_idea_picture(sender, instance, **kwargs):
+    remember_source_names(instance)
+    remember_file_names(instance)
+
+
+@receiver(post_save, sender=Idea)
+def count_idea_picture_references(sender, instance, created, **kwargs):
+    delete_released_renditions(instance, update_file_references(instance, created=created))
+
+
+@receiver(post_delete, sender=Idea)
+def release_idea_picture(sender, instance, **kwargs):
+    # also called for the ideas deleted by QuerySet.delete()
+    delete_released_renditions(instance, release_file_references(instance))
+
+
+@receiver(post_save, sender=Idea)
+def generate_idea_renditions(sender, instance, created, update_fields=None, **kwargs):
+    if update_fields is None or "picture" in update_fields:
+        schedule_renditions(instance, created=created)
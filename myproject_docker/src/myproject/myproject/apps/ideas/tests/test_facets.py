@@ -0,0 +1,77 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from ..models import Idea
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class FacetCountsTest(TestCase):
+    def setUp(self):
+        from myproject.apps.accounts.models import User
+        from myproject.apps.categories1.models import Category
+
+        cache.clear()
+        self.author = User.objects.create_user(
+            username="author", password="author", email="author@example.com"
+        )
+        self.music = Category.objects.create(title="Music")
+        self.rock = Category.objects.create(title="Rock", parent=self.music)
+        self.sports = Category.objects.create(title="Sports")
+
+        def create_idea(title, categories, rating=None, author=None):
+            idea = Idea.objects.create(
+                title=title,
+                content=title,
+                rating=rating,
+                author=author,
+                picture="ideas/2020/01/idea.jpg",  # dummy path
+            )
+            idea.categories_django_mptt.set(categories)
+            return idea
+
+        create_idea("Concert", [self.music, self.rock], rating=5, author=self.author)
+        create_idea("Guitar lessons", [self.rock], rating=4)
+        create_idea("Marathon", [self.sports], rating=4)
+
+    def get_counts(self, **selected_filters):
+        from ..facets import filter_by_category, get_cached_facet_counts
+
+        qs = Idea.objects.all()
+        if "category" in selected_filters:
+            qs = filter_by_category(qs, selected_filters["category"])
+        facet_counts = get_cached_facet_counts(qs, selected_filters)
+        return {
+            "authors": {
+                author.username: author.idea_count
+                for author in facet_counts["authors"]
+            },
+            "categories": {
+                category.title: category.idea_count
+                for category in facet_counts["categories"]
+            },
+            "ratings": {
+                rating: count for rating, label, count in facet_counts["ratings"]
+            },
+        }
+
+    def test_counts_include_descendants(self):
+        counts = self.get_counts()
+        self.assertEqual(counts["authors"], {"author": 1})
+        # an idea in a category and its subcategory is counted once
+        self.assertEqual(counts["categories"], {"Music": 2, "Rock": 2, "Sports": 1})
+        self.assertEqual(counts["ratings"], {4: 2, 5: 1})
+
+    def test_counts_of_filtered_ideas(self):
+        counts = self.get_counts(category=self.music)
+        self.assertEqual(counts["categories"], {"Music": 2, "Rock": 2})
+        self.assertEqual(counts["ratings"], {4: 1, 5: 1})
+
+    def test_counts_are_cached_until_ideas_change(self):
+        self.get_counts()
+        with self.assertNumQueries(0):
+            self.get_counts()
+
+        Idea.objects.filter(title="Marathon").delete()
+        self.assertEqual(self.get_counts()["categories"], {"Music": 2, "Rock": 2})
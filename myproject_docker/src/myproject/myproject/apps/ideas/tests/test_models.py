@@ -0,0 +1,64 @@
+from django.test import TestCase
+from django.utils import translation
+
+from ..models import Idea, IdeaTranslations
+
+
+class TranslatedFieldTest(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super(TranslatedFieldTest, cls).setUpClass()
+
+        cls.ideas = [
+            Idea.objects.create(
+                title=f"Idea {index}",
+                content=f"Content {index}",
+                picture="ideas/2020/01/idea.jpg",  # dummy path
+            )
+            for index in range(3)
+        ]
+        for idea in cls.ideas[:2]:
+            IdeaTranslations.objects.create(
+                idea=idea,
+                language="de",
+                title=f"{idea.title} (de)",
+                content=f"{idea.content} (de)",
+            )
+
+    @classmethod
+    def tearDownClass(cls):
+        super(TranslatedFieldTest, cls).tearDownClass()
+        for idea in cls.ideas:
+            Idea.objects.filter(pk=idea.pk).delete()
+
+    def test_with_translations(self):
+        with translation.override("de"):
+            with self.assertNumQueries(2):
+                ideas = list(Idea.objects.with_translations().order_by("title"))
+            with self.assertNumQueries(0):
+                titles = [idea.translated_title for idea in ideas]
+                contents = [idea.translated_content for idea in ideas]
+        self.assertEqual(titles, ["Idea 0 (de)", "Idea 1 (de)", "Idea 2"])
+        self.assertEqual(contents, ["Content 0 (de)", "Content 1 (de)", "Content 2"])
+
+    def test_translation_is_cached_per_instance(self):
+        idea = Idea.objects.get(pk=self.ideas[0].pk)
+        with translation.override("de"):
+            with self.assertNumQueries(1):
+                self.assertEqual(idea.translated_title, "Idea 0 (de)")
+                self.assertEqual(idea.translated_content, "Content 0 (de)")
+        with translation.override("en"):
+            with self.assertNumQueries(0):
+                self.assertEqual(idea.translated_title, "Idea 0")
+
+    def test_with_translated_fields(self):
+        with translation.override("de"):
+            with self.assertNumQueries(1):
+                ideas = list(
+                    Idea.objects.with_translated_fields().order_by("-translated_title")
+                )
+                titles = [idea.translated_title for idea in ideas]
+                contents = [idea.translated_content for idea in ideas]
+        self.assertEqual(titles, ["Idea 2", "Idea 1 (de)", "Idea 0 (de)"])
+        self.assertEqual(contents, ["Content 2", "Content 1 (de)", "Content 0 (de)"])
+
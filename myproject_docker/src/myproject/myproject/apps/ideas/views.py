@@ -7,9 +7,10 @@ from django.contrib.auth.decorators import login_required
 from django.shortcuts import render, redirect, get_object_or_404
 from django.views.generic import ListView, DetailView, View
 from django.forms import modelformset_factory
-from django.core.paginator import EmptyPage, PageNotAnInteger, Paginator
 from django.template.loader import render_to_string
 
+from myproject.apps.core.paginators import KeysetPaginator
+
 from .models import Idea, IdeaTranslations, RATING_CHOICES
 from .forms import IdeaForm, IdeaTranslationsForm, IdeaFilterForm
 
@@ -19,11 +20,17 @@ class IdeaList(ListView):
     template_name = "ideas/idea_list.html"
     context_object_name = "ideas"
 
+    def get_queryset(self):
+        return Idea.objects.with_translations()
+
 class IdeaDetail(DetailView):
     model = Idea
     context_object_name = "idea"
     template_name = "ideas/idea_detail.html"
 
+    def get_queryset(self):
+        return Idea.objects.with_translations()
+
 
 @login_required
 def add_or_change_idea(request, pk=None):
@@ -120,27 +127,33 @@ class IdeaListView(View):
 
 
     def get_queryset_and_facets(self, form):
-        qs = Idea.objects.order_by("title")
-        facets = {
-            "selected": {},
-            "categories": {
-                "authors": form.fields["author"].queryset,
-                "categories": form.fields["category"].queryset,
-                "ratings": RATING_CHOICES,
-            },
-        }
+        from .facets import get_cached_facet_counts
+
+        qs = Idea.objects.with_translated_fields("title").order_by(
+            "translated_title"
+        )
+        facets = {"selected": {}}
+        selected_filters = {}
         if form.is_valid():
             filters = (
             # query parameter, filter parameter
             ("author", "author"),
-            ("category", "categories"),
+            ("category", "categories_django_mptt"),
             ("rating", "rating"),
             )
             qs = self.filter_facets(facets, qs, form, filters)
+            selected_filters = {
+                query_param: form.cleaned_data[query_param]
+                for query_param, filter_param in filters
+            }
+        # the counts of the currently filtered ideas
+        facets["categories"] = get_cached_facet_counts(qs, selected_filters)
         return qs, facets
 
     @staticmethod
     def filter_facets(facets, qs, form, filters):
+        from .facets import filter_by_category
+
         for query_param, filter_param in filters:
             value = form.cleaned_data[query_param]
             if value:
@@ -149,20 +162,22 @@ class IdeaListView(View):
                     rating = int(value)
                     selected_value = (rating, dict(RATING_CHOICES)[rating])
                 facets["selected"][query_param] = selected_value
-                filter_args = {filter_param: value}
-                qs = qs.filter(**filter_args).distinct()
+                if query_param == "category":
+                    # including the ideas of the subcategories
+                    qs = filter_by_category(qs, value)
+                else:
+                    qs = qs.filter(**{filter_param: value})
         return qs
 
     def get_page(self, request, qs):
-        paginator = Paginator(qs, PAGE_SIZE)
-        page_number = request.GET.get("page")
-        try:
-            page = paginator.page(page_number)
-        except PageNotAnInteger:
-            page = paginator.page(1)
-        except EmptyPage:
-            page = paginator.page(paginator.num_pages)
-        return page
+        # the unique pk makes the order of equal titles deterministic
+        paginator = KeysetPaginator(
+            qs,
+            PAGE_SIZE,
+            ordering=("translated_title", "pk"),
+            approximate_count=True,
+        )
+        return paginator.get_page(request.GET.get("cursor"))
 
 
 def idea_handout_pdf(request, pk):
@@ -173,7 +188,7 @@ def idea_handout_pdf(request, pk):
     from weasyprint.text.fonts import FontConfiguration
 
 
-    idea = get_object_or_404(Idea, pk=pk)
+    idea = get_object_or_404(Idea.objects.with_translations(), pk=pk)
     context = {"idea": idea}
     html = render_to_string("ideas/idea_handout_pdf.html", context)
     response = HttpResponse(content_type="application/pdf")
@@ -0,0 +1 @@
+default_app_config = "myproject.apps.likes.apps.LikesAppConfig"
@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+from django.utils.translation import ugettext_lazy as _
+
+
+class LikesAppConfig(AppConfig):
+    name = "myproject.apps.likes"
+    verbose_name = _("Likes")
+
+    def ready(self):
+        from .signals import increment_like_counter, decrement_like_counter
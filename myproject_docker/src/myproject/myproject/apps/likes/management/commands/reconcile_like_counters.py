@@ -0,0 +1,94 @@
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = (
+        "Reconciles the denormalized like counters with the actual "
+        "amount of likes per object."
+    )
+    SILENT, NORMAL, VERBOSE, VERY_VERBOSE = 0, 1, 2, 3
+
+    def add_arguments(self, parser):
+        # Named (optional) arguments
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report the differences without fixing them.",
+        )
+
+    def handle(self, *args, **options):
+        self.verbosity = options.get("verbosity", self.NORMAL)
+        self.dry_run = options["dry_run"]
+        self.prepare()
+        self.main()
+        self.finalize()
+
+    def prepare(self):
+        self.created_counter = 0
+        self.updated_counter = 0
+        self.deleted_counter = 0
+
+    def main(self):
+        from django.db import models, transaction
+        from ...models import Like, LikeCounter
+
+        if self.verbosity >= self.NORMAL:
+            self.stdout.write("=== Reconciling like counters ===")
+
+        with transaction.atomic():
+            actual_counts = {
+                (ct_id, str(object_id)): count
+                for ct_id, object_id, count in Like.objects.order_by()
+                .values("content_type_id", "object_id")
+                .annotate(count=models.Count("pk"))
+                .values_list("content_type_id", "object_id", "count")
+            }
+
+            counters_to_update = []
+            counters_to_delete = []
+            for counter in LikeCounter.objects.select_for_update():
+                key = (counter.content_type_id, str(counter.object_id))
+                count = actual_counts.pop(key, 0)
+                if count == 0:
+                    counters_to_delete.append(counter.pk)
+                elif counter.count != count:
+                    self.report(key, counter.count, count)
+                    counter.count = count
+                    counters_to_update.append(counter)
+
+            counters_to_create = []
+            for (ct_id, object_id), count in actual_counts.items():
+                self.report((ct_id, object_id), 0, count)
+                counters_to_create.append(
+                    LikeCounter(
+                        content_type_id=ct_id, object_id=object_id, count=count
+                    )
+                )
+
+            self.created_counter = len(counters_to_create)
+            self.updated_counter = len(counters_to_update)
+            self.deleted_counter = len(counters_to_delete)
+            if self.dry_run:
+                return
+
+            LikeCounter.objects.bulk_create(counters_to_create, batch_size=1000)
+            LikeCounter.objects.bulk_update(
+                counters_to_update, ["count"], batch_size=1000
+            )
+            LikeCounter.objects.filter(pk__in=counters_to_delete).delete()
+
+    def report(self, key, stored_count, actual_count):
+        if self.verbosity >= self.VERBOSE:
+            ct_id, object_id = key
+            self.stdout.write(
+                f" - content type {ct_id}, object {object_id}: "
+                f"{stored_count} -> {actual_count}\n"
+            )
+
+    def finalize(self):
+        if self.verbosity >= self.NORMAL:
+            suffix = " (dry run)" if self.dry_run else ""
+            self.stdout.write(f"-------------------------\n")
+            self.stdout.write(f"Counters created{suffix}: {self.created_counter}\n")
+            self.stdout.write(f"Counters updated{suffix}: {self.updated_counter}\n")
+            self.stdout.write(f"Counters deleted{suffix}: {self.deleted_counter}\n\n")
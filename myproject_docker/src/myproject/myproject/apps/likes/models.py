@@ -7,11 +7,22 @@ from myproject.apps.core.models import (
     object_relation_base_factory,
 )
 
-LikeableObject = object_relation_base_factory(is_required=True)
+# Ideas, locations and songs have UUID primary keys
+LikeableObject = object_relation_base_factory(
+    is_required=True,
+    object_id_type="uuid",
+    unique_with=["user"],
+)
+
+LikeCountedObject = object_relation_base_factory(
+    is_required=True,
+    object_id_type="uuid",
+    unique=True,
+)
 
 
 class Like(CreationModificationDateBase, LikeableObject):
-    class Meta:
+    class Meta(LikeableObject.Meta):
         verbose_name = _("Like")
         verbose_name_plural = _("Likes")
         ordering = ("-created",)
@@ -19,4 +30,51 @@ class Like(CreationModificationDateBase, LikeableObject):
     user = models.ForeignKey(settings.AUTH_USER_MODEL, on_delete=models.CASCADE)
 
     def __str__(self):
-        return _("{user} likes {obj}").format(user=self.user, obj=self.content_object)
\ No newline at end of file
+        return _("{user} likes {obj}").format(user=self.user, obj=self.content_object)
+
+
+class LikeCounterManager(models.Manager):
+    def get_count(self, content_type_id, object_id):
+        count = (
+            self.filter(content_type_id=content_type_id, object_id=object_id)
+            .values_list("count", flat=True)
+            .first()
+        )
+        return count or 0
+
+    def increment(self, content_type_id, object_id):
+        updated = self.filter(
+            content_type_id=content_type_id, object_id=object_id
+        ).update(count=models.F("count") + 1)
+        if not updated:
+            counter, is_created = self.get_or_create(
+                content_type_id=content_type_id,
+                object_id=object_id,
+                defaults={"count": 1},
+            )
+            if not is_created:
+                # somebody else has created the counter in the meantime
+                self.filter(pk=counter.pk).update(count=models.F("count") + 1)
+
+    def decrement(self, content_type_id, object_id):
+        self.filter(
+            content_type_id=content_type_id, object_id=object_id, count__gt=0
+        ).update(count=models.F("count") - 1)
+
+
+class LikeCounter(LikeCountedObject):
+    """
+    Denormalized amount of likes per object, maintained by the signal
+    handlers of the likes app and reconciled by the
+    reconcile_like_counters management command.
+    """
+    count = models.PositiveIntegerField(_("Count"), default=0)
+
+    objects = LikeCounterManager()
+
+    class Meta(LikeCountedObject.Meta):
+        verbose_name = _("Like counter")
+        verbose_name_plural = _("Like counters")
+
+    def __str__(self):
+        return f"{self.content_object}: {self.count}"
@@ -0,0 +1,19 @@
+from django.db.models.signals import post_save, post_delete
+from django.dispatch import receiver
+
+from .models import Like, LikeCounter
+
+
+@receiver(post_save, sender=Like)
+def increment_like_counter(sender, **kwargs):
+    instance = kwargs["instance"]
+    if kwargs["created"]:
+        LikeCounter.objects.increment(
+            instance.content_type_id, instance.object_id
+        )
+
+
+@receiver(post_delete, sender=Like)
+def decrement_like_counter(sender, **kwargs):
+    instance = kwargs["instance"]
+    LikeCounter.objects.decrement(instance.content_type_id, instance.object_id)
@@ -2,7 +2,12 @@ from django import template
 from django.contrib.contenttypes.models import ContentType
 from django.template.loader import render_to_string
 
-from ..models import Like
+from ..helpers import (
+    PREFETCHED_COUNT_ATTR,
+    PREFETCHED_LIKED_BY_ATTR,
+    prefetch_likes as _prefetch_likes,
+)
+from ..models import Like, LikeCounter
 
 register = template.Library()
 
@@ -41,10 +46,29 @@ def like_widget(parser, token):
     var = template.Variable(var_name)
     return ObjectLikeWidget(var)
 
+
+@register.simple_tag(takes_context=True)
+def prefetch_likes(context, objects):
+    """
+    Resolves the like counts and the current user's liked state
+    for all objects at once, so that the filters below don't
+    query the database per object.
+
+    Usage:
+        {% prefetch_likes object_list %}
+    """
+    request = context.get("request")
+    user = getattr(request, "user", None)
+    _prefetch_likes(objects, user=user)
+    return ""
+
 # FILTERS
 
 @register.filter
 def liked_by(obj, user):
+    prefetched = getattr(obj, PREFETCHED_LIKED_BY_ATTR, {})
+    if user.pk in prefetched:
+        return prefetched[user.pk]
     ct = ContentType.objects.get_for_model(obj)
     liked = Like.objects.filter(user=user, content_type=ct, object_id=obj.pk)
     return liked.count() > 0
@@ -52,6 +76,7 @@ def liked_by(obj, user):
 
 @register.filter
 def liked_count(obj):
+    if hasattr(obj, PREFETCHED_COUNT_ATTR):
+        return getattr(obj, PREFETCHED_COUNT_ATTR)
     ct = ContentType.objects.get_for_model(obj)
-    likes = Like.objects.filter(content_type=ct, object_id=obj.pk)
-    return likes.count()
\ No newline at end of file
+    return LikeCounter.objects.get_count(ct.pk, obj.pk)
\ No newline at end of file
@@ -0,0 +1,74 @@
+from django.contrib.contenttypes.models import ContentType
+from django.core.management import call_command
+from django.test import TestCase
+
+from myproject.apps.locations.models import Location
+from myproject.apps.accounts.models import User
+from ..models import Like, LikeCounter
+
+
+class LikeCounterTest(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super(LikeCounterTest, cls).setUpClass()
+
+        cls.location = Location.objects.create(
+            name="Park Güell",
+            description="A dummy location for like counter tests.",
+            picture="locations/2020/01/20200101012345.jpg",  # dummy path
+        )
+        cls.content_type = ContentType.objects.get_for_model(Location)
+        cls.users = [
+            User.objects.create_user(
+                username=f"user{index}",
+                password=f"user{index}",
+                email=f"user{index}@example.com",
+            )
+            for index in range(3)
+        ]
+
+    @classmethod
+    def tearDownClass(cls):
+        super(LikeCounterTest, cls).tearDownClass()
+        cls.location.delete()
+        for user in cls.users:
+            user.delete()
+
+    def get_count(self):
+        return LikeCounter.objects.get_count(self.content_type.pk, self.location.pk)
+
+    def test_counter_follows_likes(self):
+        likes = [
+            Like.objects.create(
+                content_type=self.content_type,
+                object_id=self.location.pk,
+                user=user,
+            )
+            for user in self.users
+        ]
+        self.assertEqual(self.get_count(), 3)
+
+        likes[0].delete()
+        self.assertEqual(self.get_count(), 2)
+
+        Like.objects.filter(pk__in=[like.pk for like in likes[1:]]).delete()
+        self.assertEqual(self.get_count(), 0)
+
+    def test_reconcile_like_counters(self):
+        Like.objects.bulk_create([
+            Like(
+                content_type=self.content_type,
+                object_id=self.location.pk,
+                user=user,
+            )
+            for user in self.users[:2]
+        ])  # bulk_create doesn't send signals
+        self.assertEqual(self.get_count(), 0)
+
+        call_command("reconcile_like_counters", verbosity=0)
+        self.assertEqual(self.get_count(), 2)
+
+        Like.objects.all().delete()
+        self.assertEqual(self.get_count(), 0)
+        call_command("reconcile_like_counters", verbosity=0)
+        self.assertFalse(LikeCounter.objects.exists())
@@ -0,0 +1,79 @@
+from django.contrib.contenttypes.models import ContentType
+from django.test import TestCase
+
+from myproject.apps.locations.models import Location
+from myproject.apps.accounts.models import User
+from ..models import Like
+
+
+class PrefetchLikesTest(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super(PrefetchLikesTest, cls).setUpClass()
+
+        cls.locations = [
+            Location.objects.create(
+                name=f"Location {index}",
+                description="A dummy location for like tests.",
+                picture="locations/2020/01/20200101012345.jpg",  # dummy path
+            )
+            for index in range(3)
+        ]
+        cls.content_type = ContentType.objects.get_for_model(Location)
+        cls.user = User.objects.create_user(
+            username="liker", password="liker", email="liker@example.com"
+        )
+        cls.other_user = User.objects.create_user(
+            username="other", password="other", email="other@example.com"
+        )
+        for user in (cls.user, cls.other_user):
+            Like.objects.create(
+                content_type=cls.content_type,
+                object_id=cls.locations[0].pk,
+                user=user,
+            )
+        Like.objects.create(
+            content_type=cls.content_type,
+            object_id=cls.locations[1].pk,
+            user=cls.other_user,
+        )
+
+    @classmethod
+    def tearDownClass(cls):
+        super(PrefetchLikesTest, cls).tearDownClass()
+        Like.objects.all().delete()
+        for location in cls.locations:
+            location.delete()
+        cls.user.delete()
+        cls.other_user.delete()
+
+    def test_filters_read_prefetched_data(self):
+        from ..helpers import prefetch_likes
+        from ..templatetags.likes_tags import liked_by, liked_count
+
+        locations = list(Location.objects.filter(
+            pk__in=[location.pk for location in self.locations]
+        ))
+        with self.assertNumQueries(2):
+            prefetch_likes(locations, user=self.user)
+
+        with self.assertNumQueries(0):
+            counts = {location.pk: liked_count(location) for location in locations}
+            liked = {location.pk: liked_by(location, self.user) for location in locations}
+
+        self.assertEqual(counts[self.locations[0].pk], 2)
+        self.assertEqual(counts[self.locations[1].pk], 1)
+        self.assertEqual(counts[self.locations[2].pk], 0)
+        self.assertTrue(liked[self.locations[0].pk])
+        self.assertFalse(liked[self.locations[1].pk])
+        self.assertFalse(liked[self.locations[2].pk])
+
+    def test_liked_by_other_user_falls_back_to_query(self):
+        from ..helpers import prefetch_likes
+        from ..templatetags.likes_tags import liked_by
+
+        location = Location.objects.get(pk=self.locations[1].pk)
+        prefetch_likes([location], user=self.user)
+
+        self.assertFalse(liked_by(location, self.user))
+        self.assertTrue(liked_by(location, self.other_user))
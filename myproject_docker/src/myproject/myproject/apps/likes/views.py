@@ -1,6 +1,7 @@
 import json
 
 from django.contrib.contenttypes.models import ContentType
+from django.db import transaction
 from django.forms.models import model_to_dict
 from django.http import JsonResponse
 from django.views.decorators.cache import never_cache
@@ -23,12 +24,15 @@ def json_set_like(request, content_type_id, object_id):
         content_type = ContentType.objects.get(id=content_type_id)
         obj = content_type.get_object_for_this_type(pk=object_id)
 
-        like, is_created = Like.objects.get_or_create(
-            content_type=ContentType.objects.get_for_model(obj),
-            object_id=obj.pk,
-            user=request.user)
-        if not is_created:
-            like.delete()
+        # the like counter is updated by the signal handlers
+        # within the same transaction
+        with transaction.atomic():
+            like, is_created = Like.objects.get_or_create(
+                content_type=ContentType.objects.get_for_model(obj),
+                object_id=obj.pk,
+                user=request.user)
+            if not is_created:
+                like.delete()
 
         result = {
             "success": True,
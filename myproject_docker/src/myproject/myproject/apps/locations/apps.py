@@ -4,4 +4,7 @@ from django.utils.translation import gettext_lazy as _
 
 class LocationsAppConfig(AppConfig):
     name = "myproject.apps.locations"
-    verbose_name = _("Locations")
\ No newline at end of file
+    verbose_name = _("Locations")
+
+    def ready(self):
+        from . import signals
@@ -1,4 +1,3 @@
-import contextlib
 import os
 import uuid
 from collections import namedtuple
@@ -13,6 +12,7 @@ from django.utils.translation import gettext_lazy as _
 from django.utils.timezone import now as timezone_now
 
 from myproject.apps.core.models import CreationModificationDateBase, UrlBase
+from myproject.apps.core.storages import content_addressed_storage
 
 COUNTRY_CHOICES = getattr(settings, "COUNTRY_CHOICES", [])
 
@@ -21,10 +21,11 @@ RATING_CHOICES = ((1, "★☆☆☆☆"), (2, "★★☆☆☆"), (3, "★★★
 Geoposition = namedtuple("Geoposition", ["longitude", "latitude"])
 
 def upload_to(instance, filename):
+    # the content-addressed storage adds the content hash as a directory
     now = timezone_now()
     base, extension = os.path.splitext(filename)
     extension = extension.lower()
-    return f"locations/{now:%Y/%m}/{instance.pk}/{extension}"
+    return f"locations/{now:%Y/%m}/{base}{extension}"
 
 
 class Location(CreationModificationDateBase, UrlBase):
@@ -75,7 +76,12 @@ class Location(CreationModificationDateBase, UrlBase):
     )
     geoposition = models.PointField(blank=True, null=True)
 
-    picture = models.ImageField(_("Picture"), upload_to=upload_to)
+    picture = models.ImageField(
+        _("Picture"),
+        upload_to=upload_to,
+        storage=content_addressed_storage,
+        max_length=255,
+    )
 
     picture_desktop = ImageSpecField(
         source="picture",
@@ -149,13 +155,4 @@ class Location(CreationModificationDateBase, UrlBase):
         from django.contrib.gis.geos import Point
         self.geoposition = Point(longitude, latitude, srid=4326)
     
-    def delete(self, *args, **kwargs):
-        from django.core.files.storage import default_storage
-        if self.picture:
-            with contextlib.suppress(FileNotFoundError):
-                default_storage.delete(self.picture_desktop.path)
-                default_storage.delete(self.picture_tablet.path)
-                default_storage.delete(self.picture_mobile.path)
-            self.picture.delete()
-        super().delete(*args, **kwargs)
         
\ No newline at end of file
@@ -0,0 +1,38 @@
+from django.db.models.signals import post_delete, post_init, post_save
+from django.dispatch import receiver
+
+from myproject.apps.core.renditions import (
+    delete_released_renditions,
+    remember_source_names,
+    schedule_renditions,
+)
+from myproject.apps.core.storages import (
+    release_file_references,
+    remember_file_names,
+    update_file_references,
+)
+
+from .models import Location
+
+
+@receiver(post_init, sender=Location)
+def remember_location_picture(sender, instance, **kwargs):
+    remember_source_names(instance)
+    remember_file_names(instance)
+
+
+@receiver(post_save, sender=Location)
+def count_location_picture_references(sender, instance, created, **kwargs):
+    delete_released_renditions(instance, update_file_references(instance, created=created))
+
+
+@receiver(post_delete, sender=Location)
+def release_location_picture(sender, instance, **kwargs):
+    # also called for the locations deleted by QuerySet.delete()
+    delete_released_renditions(instance, release_file_references(instance))
+
+
+@receiver(post_save, sender=Location)
+def generate_location_renditions(sender, instance, created, update_fields=None, **kwargs):
+    if update_fields is None or "picture" in update_fields:
+        schedule_renditions(instance, created=created)
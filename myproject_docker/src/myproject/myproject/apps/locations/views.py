@@ -5,13 +5,16 @@ from django.conf import settings
 from django.contrib.auth.decorators import login_required
 
 
+from myproject.apps.core.paginators import KeysetPaginationMixin
+
 from .models import Location
 from .forms import LocationForm
 
 
-class LocationList(ListView):
+class LocationList(KeysetPaginationMixin, ListView):
     model = Location
     paginate_by = 3
+    keyset_ordering = ("-created", "-pk")
 
 class LocationDetail(DetailView):
     model = Location
@@ -1,8 +1,13 @@
 from django.contrib import admin
-from .models import Song
+from .models import ImportCheckpoint, Song
 
 @admin.register(Song)
 class SongAdmin(admin.ModelAdmin):
     list_display = ["title", "artist", "url"]
     list_filter = ["artist"]
-    search_fields = ["title", "artist"]
\ No newline at end of file
+    search_fields = ["title", "artist"]
+
+@admin.register(ImportCheckpoint)
+class ImportCheckpointAdmin(admin.ModelAdmin):
+    list_display = ["source", "last_page", "total_pages", "modified"]
+    readonly_fields = ["created", "modified"]
@@ -24,4 +24,13 @@ class SongFilterForm(forms.Form):
             label=_("Artist"),
             choices=artist_choices,
             required=False,
-        )
\ No newline at end of file
+        )
+
+class SongImportForm(SongForm):
+    """
+    Validates a song without querying the database: the uniqueness
+    of artist and title is checked by the importer against the set
+    of already known songs.
+    """
+    def validate_unique(self):
+        pass
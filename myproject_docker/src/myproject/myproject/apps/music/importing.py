@@ -0,0 +1,162 @@
+"""
+The music import engine.
+
+A SongImporter takes the batches of a source reader (see readers.py),
+skips the already known songs with one existence query per batch,
+validates the new ones without database queries and saves them with
+a bulk insert. The batches of file sources are read in a background
+thread while the previous batch is saved. Cover images are downloaded in parallel by an optional
+ImageSaver while the next batches are read.
+"""
+import time
+import uuid
+
+from django.db import transaction
+
+
+def save_song_batch(song_dicts):
+    """
+    Saves a batch of songs with a single existence query for the
+    known songs and a bulk insert for the new ones.
+    Returns a tuple of three lists: (song, song_dict) pairs of the
+    imported songs, song dictionaries of the already known songs and
+    (song_dict, errors) pairs of the invalid songs.
+    """
+    from .forms import SongImportForm
+    from .models import Song
+
+    keys = {
+        Song.get_import_key(song_dict.get("artist"), song_dict.get("title"))
+        for song_dict in song_dicts
+    }
+    existing_keys = set(
+        Song.objects.filter(import_key__in=keys).values_list("import_key", flat=True)
+    )
+
+    new_songs, known, invalid = [], [], []
+    for song_dict in song_dicts:
+        key = Song.get_import_key(song_dict.get("artist"), song_dict.get("title"))
+        if key in existing_keys:
+            known.append(song_dict)
+            continue
+        form = SongImportForm(data=song_dict)
+        if not form.is_valid():
+            invalid.append((song_dict, form.errors))
+            continue
+        existing_keys.add(key)  # duplicates within the batch
+        song = form.save(commit=False)
+        song.pk = uuid.uuid4()
+        song.import_key = key
+        new_songs.append((song, song_dict))
+
+    if not new_songs:
+        return [], known, invalid
+
+    with transaction.atomic():
+        Song.objects.bulk_create(
+            [song for song, song_dict in new_songs], ignore_conflicts=True
+        )
+    # the conflicting songs, e.g. saved before the import keys existed,
+    # were not inserted
+    inserted_pks = set(
+        Song.objects.filter(
+            pk__in=[song.pk for song, song_dict in new_songs]
+        ).values_list("pk", flat=True)
+    )
+    imported = []
+    for song, song_dict in new_songs:
+        if song.pk in inserted_pks:
+            imported.append((song, song_dict))
+        else:
+            known.append(song_dict)
+    return imported, known, invalid
+
+
+def prefetch_batches(batches):
+    """
+    Yields the batches while the next one is read in a background thread
+    """
+    from concurrent.futures import ThreadPoolExecutor
+
+    batches = iter(batches)
+    # one thread reads the batches in order
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        future = executor.submit(next, batches, None)
+        while True:
+            batch = future.result()
+            if batch is None:
+                break
+            future = executor.submit(next, batches, None)
+            yield batch
+
+
+class SongImporter(object):
+    """
+    Imports the songs of a reader batch by batch.
+
+    The reporter gets notified about the progress through the methods
+    report_song(song), report_known(song_dict),
+    report_invalid(song_dict, errors) and
+    report_batch(batch, imported, known, invalid, duration).
+    """
+    def __init__(self, reader, batch_size=1000, image_saver=None, reporter=None):
+        self.reader = reader
+        self.batch_size = batch_size
+        self.image_saver = image_saver
+        self.reporter = reporter
+        self.imported_counter = 0
+        self.known_counter = 0
+        self.invalid_counter = 0
+        self.batch_timings = []
+        self.duration = 0.0
+
+    def run(self):
+        started = time.perf_counter()
+        try:
+            batches = self.reader.read_batches(self.batch_size)
+            if self.reader.prefetch:
+                batches = prefetch_batches(batches)
+            for batch in batches:
+                self.save_batch(batch)
+            if self.image_saver:
+                self.image_saver.save_downloaded(wait=True)
+        finally:
+            self.reader.close()
+            self.duration = time.perf_counter() - started
+
+    def save_batch(self, batch):
+        started = time.perf_counter()
+        imported, known, invalid = save_song_batch(batch.song_dicts)
+        duration = time.perf_counter() - started
+        self.reader.batch_saved(batch)
+
+        self.batch_timings.append((len(batch.song_dicts), duration))
+        self.imported_counter += len(imported)
+        self.known_counter += len(known)
+        self.invalid_counter += len(invalid)
+
+        for song, song_dict in imported:
+            if self.image_saver:
+                self.image_saver.add(song, song_dict.get("image_url"))
+            self.report("report_song", song)
+        for song_dict in known:
+            self.report("report_known", song_dict)
+        for song_dict, errors in invalid:
+            self.report("report_invalid", song_dict, errors)
+        self.report(
+            "report_batch", batch, len(imported), len(known), len(invalid), duration
+        )
+
+        if self.image_saver:
+            self.image_saver.save_downloaded()
+
+    def report(self, method_name, *args):
+        if self.reporter:
+            getattr(self.reporter, method_name)(*args)
+
+    def get_throughput(self):
+        """
+        Returns the amount of read songs per second
+        """
+        song_count = self.imported_counter + self.known_counter + self.invalid_counter
+        return song_count / self.duration if self.duration else 0.0
@@ -0,0 +1,156 @@
+"""
+Concurrent HTTP pipeline for the Last.fm importers.
+
+Pages are fetched in a bounded thread pool through one pooled session,
+cover images are downloaded in a separate pool, and the requests to the
+API are throttled by a shared rate limiter. Database writes stay in
+the calling thread.
+"""
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+API_URL = "https://ws.audioscrobbler.com/2.0/"
+
+
+class RateLimiter(object):
+    """
+    Lets through at most the given amount of calls per second
+    over all threads; 0 means no limit.
+    """
+    def __init__(self, calls_per_second=0):
+        self.interval = 1.0 / calls_per_second if calls_per_second > 0 else 0
+        self.next_call = 0.0
+        self.lock = threading.Lock()
+
+    def wait(self):
+        if not self.interval:
+            return
+        with self.lock:
+            now = time.monotonic()
+            delay = self.next_call - now
+            self.next_call = max(now, self.next_call) + self.interval
+        if delay > 0:
+            time.sleep(delay)
+
+
+def create_session(pool_size):
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+class LastFmClient(object):
+    def __init__(self, params, api_url=API_URL, workers=4, image_workers=4,
+                 rate_limit=0, timeout=30):
+        self.params = params
+        self.api_url = api_url
+        self.workers = max(workers, 1)
+        self.image_workers = max(image_workers, 1)
+        self.timeout = timeout
+        self.rate_limiter = RateLimiter(rate_limit)
+        self.session = create_session(self.workers + self.image_workers)
+        self.image_executor = ThreadPoolExecutor(max_workers=self.image_workers)
+
+    def fetch_page(self, page_number):
+        self.rate_limiter.wait()
+        params = dict(self.params, page=page_number)
+        return self.session.get(self.api_url, params=params, timeout=self.timeout)
+
+    def fetch_pages(self, page_numbers):
+        """
+        Fetches the pages concurrently and yields tuples of the page
+        number and the response in the order of the page numbers.
+        At most twice the amount of workers are fetched ahead.
+        """
+        page_numbers = list(page_numbers)
+        window = self.workers * 2
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            futures = {}
+            for page_number in page_numbers[:window]:
+                futures[page_number] = executor.submit(self.fetch_page, page_number)
+            try:
+                for index, page_number in enumerate(page_numbers):
+                    response = futures.pop(page_number).result()
+                    if index + window < len(page_numbers):
+                        next_page_number = page_numbers[index + window]
+                        futures[next_page_number] = executor.submit(
+                            self.fetch_page, next_page_number
+                        )
+                    yield page_number, response
+            finally:
+                # when the reader stops or a request fails
+                for future in futures.values():
+                    future.cancel()
+
+    def download_image(self, image_url):
+        import requests
+
+        try:
+            response = self.session.get(image_url, timeout=self.timeout)
+        except requests.RequestException:
+            return None
+        if response.status_code != requests.codes.ok:
+            return None
+        return response.content
+
+    def submit_image_download(self, image_url):
+        """
+        Returns a future with the content of the image or None
+        """
+        return self.image_executor.submit(self.download_image, image_url)
+
+    def close(self):
+        self.image_executor.shutdown(wait=True)
+        self.session.close()
+
+
+def get_failed_url(error):
+    """
+    Returns the URL of the request that raised the RequestException
+    """
+    request = getattr(error, "request", None)
+    return getattr(request, "url", None) or str(error)
+
+
+class ImageSaver(object):
+    """
+    Collects the image downloads of songs and saves the downloaded
+    images to the songs in the calling thread.
+    """
+    def __init__(self, client):
+        self.client = client
+        self.pending = []
+        self.saved_counter = 0
+        self.failed_counter = 0
+
+    def add(self, song, image_url):
+        if image_url:
+            future = self.client.submit_image_download(image_url)
+            self.pending.append((song, image_url, future))
+
+    def save_downloaded(self, wait=False):
+        import os
+        from io import BytesIO
+        from django.core.files import File
+
+        still_pending = []
+        for song, image_url, future in self.pending:
+            if not wait and not future.done():
+                still_pending.append((song, image_url, future))
+                continue
+            try:
+                content = future.result()
+            except Exception:
+                content = None
+            if content:
+                song.image.save(os.path.basename(image_url), File(BytesIO(content)))
+                self.saved_counter += 1
+            else:
+                self.failed_counter += 1
+        self.pending = still_pending
@@ -0,0 +1,178 @@
+from abc import ABC, abstractmethod
+
+from django.core.management.base import BaseCommand
+
+
+class SongImportCommand(ABC, BaseCommand):
+    """
+    The base of the music import commands: subclasses add their
+    source arguments and return a reader from get_reader().
+    """
+    SILENT, NORMAL, VERBOSE, VERY_VERBOSE = 0, 1, 2, 3
+    default_batch_size = 1000
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", "--chunk-size",
+            dest="batch_size",
+            type=int,
+            default=self.default_batch_size,
+            help="The amount of songs saved with one bulk insert.",
+        )
+        parser.add_argument(
+            "--error-report",
+            type=str,
+            default="",
+            help="Write the invalid songs with their errors to a CSV file.",
+        )
+
+    def handle(self, *args, **options):
+        self.verbosity = options.get("verbosity", self.NORMAL)
+        self.batch_size = options["batch_size"]
+        self.error_report_path = options["error_report"]
+        self.prepare(options)
+        try:
+            self.main()
+        finally:
+            if self.error_report_file:
+                self.error_report_file.close()
+        self.finalize()
+
+    @abstractmethod
+    def get_reader(self, options):
+        """
+        Returns the SongReader of the source given in the options
+        """
+
+    def get_image_saver(self):
+        return None
+
+    def prepare(self, options):
+        import csv
+        from ..importing import SongImporter
+
+        self.reader = self.get_reader(options)
+        self.importer = SongImporter(
+            self.reader,
+            batch_size=self.batch_size,
+            image_saver=self.get_image_saver(),
+            reporter=self,
+        )
+        self.error_report_file = None
+        if self.error_report_path:
+            self.error_report_file = open(self.error_report_path, mode="w", newline="")
+            self.error_report_writer = csv.writer(self.error_report_file)
+            self.error_report_writer.writerow(["artist", "title", "url", "errors"])
+
+    def main(self):
+        if self.verbosity >= self.NORMAL:
+            self.stdout.write(f"=== Importing music from {self.reader} ===")
+        self.importer.run()
+
+    def report_song(self, song):
+        if self.verbosity >= self.NORMAL:
+            self.stdout.write(f" - {song}\n")
+
+    def report_known(self, song_dict):
+        if self.verbosity >= self.VERBOSE:
+            self.stdout.write(
+                f" = {song_dict['artist']} - {song_dict['title']} "
+                f"(already imported)\n"
+            )
+
+    def report_invalid(self, song_dict, errors):
+        if self.error_report_file:
+            self.error_report_writer.writerow([
+                song_dict.get("artist"),
+                song_dict.get("title"),
+                song_dict.get("url"),
+                errors.as_json(),
+            ])
+        if self.verbosity >= self.NORMAL:
+            self.stderr.write(
+                f"Errors importing song "
+                f"{song_dict['artist']} - {song_dict['title']}:\n"
+            )
+            self.stderr.write(f"{errors.as_json()}\n")
+
+    def report_batch(self, batch, imported_count, known_count, invalid_count,
+                     duration):
+        if self.verbosity >= self.NORMAL:
+            self.stdout.write(
+                f"Batch {batch.number}: {imported_count} imported, "
+                f"{known_count} known, {invalid_count} invalid "
+                f"in {duration:.3f} s\n"
+            )
+
+    def finalize(self):
+        if self.verbosity >= self.NORMAL:
+            image_saver = self.importer.image_saver
+            self.stdout.write(f"-------------------------\n")
+            self.stdout.write(f"Songs imported: {self.importer.imported_counter}\n")
+            self.stdout.write(f"Songs already imported: {self.importer.known_counter}\n")
+            self.stdout.write(f"Songs skipped: {self.importer.invalid_counter}\n")
+            if image_saver:
+                self.stdout.write(f"Images saved: {image_saver.saved_counter}\n")
+            self.stdout.write(f"Songs per second: {self.importer.get_throughput():.1f}\n")
+            self.stdout.write("\n")
+
+
+class LastFmImportCommand(SongImportCommand):
+    """
+    The base of the Last.fm import commands: the pages of the API
+    are the batches, fetched concurrently by the reader.
+    """
+    reader_class = None
+
+    def add_arguments(self, parser):
+        from ..lastfm import API_URL
+
+        super().add_arguments(parser)
+        parser.add_argument("--max_pages", type=int, default=0)
+        parser.add_argument(
+            "--workers", type=int, default=4,
+            help="The amount of pages fetched in parallel.",
+        )
+        parser.add_argument(
+            "--image-workers", type=int, default=4,
+            help="The amount of cover images downloaded in parallel.",
+        )
+        parser.add_argument(
+            "--rate-limit", type=float, default=5,
+            help="The maximum amount of API requests per second (0 for no limit).",
+        )
+        parser.add_argument("--api-url", type=str, default=API_URL)
+        parser.add_argument(
+            "--resume", action="store_true",
+            help="Continue after the last completed page of the previous run.",
+        )
+
+    def get_reader(self, options):
+        from django.conf import settings
+
+        return self.reader_class(
+            api_key=settings.LAST_FM_API_KEY,
+            api_url=options["api_url"],
+            workers=options["workers"],
+            image_workers=options["image_workers"],
+            rate_limit=options["rate_limit"],
+            max_pages=options["max_pages"],
+            resume=options["resume"],
+        )
+
+    def get_image_saver(self):
+        from ..lastfm import ImageSaver
+
+        return ImageSaver(self.reader.client)
+
+    def main(self):
+        super().main()
+        reader = self.reader
+        if reader.failed_url:
+            self.stderr.write(f"Error connecting to {reader.failed_url}\n")
+            self.stderr.write(
+                f"Imported up to page {reader.checkpoint.last_page}. "
+                f"Run the command again with --resume to continue.\n"
+            )
+        elif reader.start_page > reader.pages and self.verbosity >= self.NORMAL:
+            self.stdout.write(f"All {reader.pages} page(s) already imported\n")
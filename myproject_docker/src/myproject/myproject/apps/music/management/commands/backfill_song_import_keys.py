@@ -0,0 +1,51 @@
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = (
+        "Computes the import keys of the songs saved before the imports "
+        "were resumable."
+    )
+    SILENT, NORMAL, VERBOSE, VERY_VERBOSE = 0, 1, 2, 3
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--batch-size", type=int, default=1000,
+            help="The amount of songs updated with one query.",
+        )
+
+    def handle(self, *args, **options):
+        self.verbosity = options.get("verbosity", self.NORMAL)
+        self.batch_size = options["batch_size"]
+        self.prepare()
+        self.main()
+        self.finalize()
+
+    def prepare(self):
+        self.updated_count = 0
+
+    def main(self):
+        import time
+        from django.db import transaction
+        from myproject.apps.core.misc import iterate_in_chunks
+        from ...models import Song
+
+        started = time.perf_counter()
+        queryset = Song.objects.filter(import_key=None).only("pk", "artist", "title")
+        for songs in iterate_in_chunks(queryset, self.batch_size):
+            for song in songs:
+                song.import_key = Song.get_import_key(song.artist, song.title)
+            # the keys are unique like the artists and titles,
+            # so the rows don't conflict with each other
+            with transaction.atomic():
+                Song.objects.bulk_update(songs, ["import_key"])
+            self.updated_count += len(songs)
+            if self.verbosity >= self.VERBOSE:
+                self.stdout.write(f" - {self.updated_count} songs updated\n")
+        self.duration = time.perf_counter() - started
+
+    def finalize(self):
+        if self.verbosity >= self.NORMAL:
+            self.stdout.write(f"-------------------------\n")
+            self.stdout.write(f"Songs updated: {self.updated_count}\n")
+            self.stdout.write(f"Total time: {self.duration:.2f} s\n\n")
@@ -1,63 +1,45 @@
-from django.core.management.base import BaseCommand
+from ..base import SongImportCommand
 
 
-class Command(BaseCommand):
+class Command(SongImportCommand):
     help = (
         "Imports music from a local XLSX file. "
         "Expects columns: Artist, Title, URL"
     )
-    SILENT, NORMAL, VERBOSE, VERY_VERBOSE = 0, 1, 2, 3
 
     def add_arguments(self, parser):
         # Positional arguments
         parser.add_argument("file_path",
                             nargs=1,
                             type=str)
-
-    def handle(self, *args, **options):
-        self.verbosity = options.get("verbosity", self.NORMAL)
-        self.file_path = options["file_path"][0]
-        self.prepare()
-        self.main()
-        self.finalize()
-
-    def prepare(self):
-        self.imported_counter = 0
-        self.skipped_counter = 0
-
-    def main(self):
-        from openpyxl import load_workbook
-        from ...forms import SongForm
-
-        # open an Excel file
-        wb = load_workbook(filename=self.file_path)
-        ws = wb.worksheets[0]
-
-        if self.verbosity >= self.NORMAL:
-            self.stdout.write("=== Importing music ===")
-
-        columns = ["artist", "title", "url"]
-        rows = ws.iter_rows(min_row=2)  # skip the column captions
-        for index, row in enumerate(rows, start=1): # iterating through the file row by row
-            row_values = [cell.value for cell in row]
-            row_dict = dict(zip(columns, row_values))
-            form = SongForm(data=row_dict)
-            if form.is_valid():
-                song = form.save()
-                if self.verbosity >= self.NORMAL:
-                    self.stdout.write(f" - {song}\n")
-                self.imported_counter += 1
-            else:
-                if self.verbosity >= self.NORMAL:
-                    self.stderr.write(
-                        f"Errors importing song "
-                        f"{row_dict['artist']} - {row_dict['title']}:\n"
-                    )
-                    self.stderr.write(f"{form.errors.as_json()}\n")
-                self.skipped_counter += 1
-
-    def finalize(self):
-        if self.verbosity >= self.NORMAL:
-            self.stdout.write(f"-------------------------\n")
-            self.stdout.write(f"Songs imported: {self.imported_counter}\n")
-            self.stdout.write(f"Songs skipped: {self.skipped_counter}\n\n")
\ No newline at end of file
+        # Named (optional) arguments
+        super().add_arguments(parser)
+        parser.add_argument(
+            "--streaming",
+            action="store_true",
+            help="Read the sheet in read-only mode with constant memory.",
+        )
+        parser.add_argument(
+            "--start-row",
+            type=int,
+            default=2,  # skip the column captions
+            help="The first sheet row to import (1-based, inclusive).",
+        )
+        parser.add_argument(
+            "--end-row",
+            type=int,
+            default=None,
+            help="The last sheet row to import (1-based, inclusive). "
+                 "Use disjoint row ranges to import a large sheet "
+                 "in several parallel processes.",
+        )
+
+    def get_reader(self, options):
+        from ...readers import XLSXReader
+
+        return XLSXReader(
+            options["file_path"][0],
+            start_row=options["start_row"],
+            end_row=options["end_row"],
+            streaming=options["streaming"],
+        )
@@ -1,3 +1,4 @@
+import hashlib
 import os
 import uuid
 
@@ -22,6 +23,15 @@ class Song(CreationModificationDateBase, UrlBase):
     title = models.CharField(_("Title"), max_length=250)
     url = models.URLField(_("URL"), blank=True)
     image = models.ImageField(_("Image"), upload_to=upload_to, blank=True, null=True)
+    import_key = models.CharField(
+        _("Import key"),
+        max_length=40,
+        unique=True,
+        blank=True,
+        null=True,
+        editable=False,
+        help_text=_("Identifies the track in imports."),
+    )
 
     class Meta:
         verbose_name = _("Song")
@@ -34,7 +44,28 @@ class Song(CreationModificationDateBase, UrlBase):
     def get_url_path(self):
         return reverse("music:song_detail", kwargs={"pk": self.pk})
 
+    @staticmethod
+    def get_import_key(artist, title):
+        return hashlib.sha1(f"{artist}\n{title}".encode("utf-8")).hexdigest()
+
     def save(self, *args, **kwargs):
         if self.pk is None:
             self.pk = uuid.uuid4()
-        super().save(*args, **kwargs)
\ No newline at end of file
+        self.import_key = Song.get_import_key(self.artist, self.title)
+        super().save(*args, **kwargs)
+
+
+class ImportCheckpoint(CreationModificationDateBase):
+    """
+    The progress of a paginated import, so that it can be resumed
+    """
+    source = models.CharField(_("Source"), max_length=255, unique=True)
+    last_page = models.PositiveIntegerField(_("Last completed page"), default=0)
+    total_pages = models.PositiveIntegerField(_("Total pages"), default=0)
+
+    class Meta:
+        verbose_name = _("Import checkpoint")
+        verbose_name_plural = _("Import checkpoints")
+
+    def __str__(self):
+        return f"{self.source}: {self.last_page}/{self.total_pages}"
\ No newline at end of file
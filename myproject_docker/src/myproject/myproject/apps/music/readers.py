@@ -0,0 +1,270 @@
+"""
+Source readers for the music import engine.
+
+A reader yields batches of song dictionaries with the keys artist,
+title, url and optionally image_url. The batches are saved by the
+SongImporter from importing.py, so a new source only needs to
+implement read() and optionally read_batches().
+"""
+from abc import ABC, abstractmethod
+from collections import namedtuple
+
+ReadBatch = namedtuple("ReadBatch", ["number", "song_dicts"])
+
+
+class SongReader(ABC):
+    description = "songs"
+    # whether the next batch can be read in a background thread while
+    # the previous one is saved; the reader must not use the database
+    prefetch = False
+
+    def __str__(self):
+        return self.description
+
+    @abstractmethod
+    def read(self):
+        """
+        Yields song dictionaries
+        """
+
+    def read_batches(self, batch_size):
+        """
+        Yields ReadBatch tuples of at most batch_size songs
+        """
+        number, song_dicts = 0, []
+        for song_dict in self.read():
+            song_dicts.append(song_dict)
+            if len(song_dicts) >= batch_size:
+                number += 1
+                yield ReadBatch(number, song_dicts)
+                song_dicts = []
+        if song_dicts:
+            yield ReadBatch(number + 1, song_dicts)
+
+    def batch_saved(self, batch):
+        """
+        Is called by the importer after the batch was saved
+        """
+
+    def close(self):
+        pass
+
+
+class CSVReader(SongReader):
+    """
+    Reads a CSV file with the columns artist, title, url
+    """
+    prefetch = True
+
+    def __init__(self, file_path):
+        self.file_path = file_path
+        self.description = f"CSV file {file_path}"
+
+    def read(self):
+        import csv
+
+        with open(self.file_path, mode="r", newline="") as f:
+            yield from csv.DictReader(f)
+
+
+class XLSXReader(SongReader):
+    """
+    Reads the first sheet of an XLSX file with the columns
+    Artist, Title, URL. In the streaming mode the sheet is opened
+    read-only and the rows are loaded lazily with constant memory.
+    """
+    columns = ["artist", "title", "url"]
+    prefetch = True
+
+    def __init__(self, file_path, start_row=2, end_row=None, streaming=False):
+        self.file_path = file_path
+        self.start_row = max(start_row, 2)  # skip the column captions
+        self.end_row = end_row
+        self.streaming = streaming
+        self.description = f"XLSX file {file_path}"
+
+    def read(self):
+        from openpyxl import load_workbook
+
+        wb = load_workbook(filename=self.file_path, read_only=self.streaming)
+        try:
+            rows = wb.worksheets[0].iter_rows(
+                min_row=self.start_row,
+                max_row=self.end_row,
+                max_col=len(self.columns),
+                values_only=True,
+            )
+            for row_values in rows:
+                if not any(row_values):
+                    continue  # skip empty rows
+                yield dict(zip(self.columns, row_values))
+        finally:
+            # read-only workbooks keep the file open
+            wb.close()
+
+
+class LastFmReader(SongReader):
+    """
+    Reads the top tracks of a tag from the Last.fm API. Every API page
+    is a batch: the pages are fetched concurrently by the LastFmClient
+    and the last saved page is stored in an ImportCheckpoint, so that
+    an interrupted import can be resumed.
+    """
+    format = None
+
+    def __init__(self, api_key, tag="indie", api_url=None, workers=4,
+                 image_workers=4, rate_limit=0, max_pages=0, resume=False):
+        from .lastfm import API_URL, LastFmClient
+
+        self.params = {
+            "method": "tag.gettoptracks",
+            "tag": tag,
+            "api_key": api_key,
+            "format": self.format,
+        }
+        self.client = LastFmClient(
+            self.params,
+            api_url=api_url or API_URL,
+            workers=workers,
+            image_workers=image_workers,
+            rate_limit=rate_limit,
+        )
+        self.max_pages = max_pages
+        self.resume = resume
+        # both formats import the same tracks, so they share the checkpoint
+        self.source = f"lastfm:{self.params['method']}:{tag}"
+        self.description = f"Last.fm tag {tag} as {self.format.upper()}"
+        self.checkpoint = None
+        self.start_page = 1
+        self.pages = None
+        self.failed_url = None
+
+    @abstractmethod
+    def parse(self, content):
+        """
+        Returns the parsed data of an API page
+        """
+
+    @abstractmethod
+    def get_total_pages(self, data):
+        """
+        Returns the amount of API pages
+        """
+
+    @abstractmethod
+    def get_song_dicts(self, data):
+        """
+        Returns the song dictionaries of an API page
+        """
+
+    def read(self):
+        # the API pages are the batches
+        for batch in self.read_batches(batch_size=None):
+            yield from batch.song_dicts
+
+    def read_batches(self, batch_size):
+        import requests
+        from .lastfm import get_failed_url
+        from .models import ImportCheckpoint
+
+        self.checkpoint, created = ImportCheckpoint.objects.get_or_create(
+            source=self.source
+        )
+        if self.resume:
+            self.start_page = self.checkpoint.last_page + 1
+        else:
+            self.checkpoint.last_page = 0
+            self.checkpoint.save()
+
+        # the timeouts and dropped connections stop the import
+        # like the error responses, so that it can be resumed
+        try:
+            response = self.client.fetch_page(self.start_page)
+        except requests.RequestException as error:
+            self.failed_url = get_failed_url(error)
+            return
+        if response.status_code != requests.codes.ok:
+            self.failed_url = response.url
+            return
+        data = self.parse(response.content)
+
+        self.pages = self.get_total_pages(data)
+        if self.max_pages > 0:
+            self.pages = min(self.pages, self.max_pages)
+        if self.start_page > self.pages:
+            return
+
+        yield ReadBatch(self.start_page, self.get_song_dicts(data))
+
+        page_numbers = range(self.start_page + 1, self.pages + 1)
+        try:
+            for page_number, response in self.client.fetch_pages(page_numbers):
+                if response.status_code != requests.codes.ok:
+                    self.failed_url = response.url
+                    break
+                data = self.parse(response.content)
+                yield ReadBatch(page_number, self.get_song_dicts(data))
+        except requests.RequestException as error:
+            self.failed_url = get_failed_url(error)
+
+    def batch_saved(self, batch):
+        self.checkpoint.last_page = batch.number
+        self.checkpoint.total_pages = self.pages
+        self.checkpoint.save()
+
+    def close(self):
+        self.client.close()
+
+
+class LastFmJSONReader(LastFmReader):
+    format = "json"
+
+    def parse(self, content):
+        import json
+
+        return json.loads(content)
+
+    def get_total_pages(self, data):
+        return int(data.get("tracks", {}).get("@attr", {}).get("totalPages", 1))
+
+    def get_song_dicts(self, data):
+        song_dicts = []
+        for track_dict in data.get("tracks", {}).get("track") or []:
+            if not track_dict:
+                continue
+
+            image_dict = track_dict.get("image", None)
+            song_dicts.append({
+                "artist": track_dict.get("artist", {}).get("name", ""),
+                "title": track_dict.get("name", ""),
+                "url": track_dict.get("url", ""),
+                "image_url": image_dict[1]["#text"] if image_dict else "",
+            })
+        return song_dicts
+
+
+class LastFmXMLReader(LastFmReader):
+    format = "xml"
+
+    def parse(self, content):
+        from defusedxml import ElementTree
+
+        return ElementTree.fromstring(content)
+
+    def get_total_pages(self, root):
+        return int(root.find("tracks").attrib.get("totalPages", 1))
+
+    def get_song_dicts(self, root):
+        song_dicts = []
+        for track_node in root.findall("tracks/track"):
+            if not track_node:
+                continue
+
+            image_node = track_node.find("image[@size='medium']")
+            song_dicts.append({
+                "artist": track_node.find("artist/name").text,
+                "title": track_node.find("name").text,
+                "url": track_node.find("url").text,
+                "image_url": image_node.text if image_node is not None else "",
+            })
+        return song_dicts
@@ -0,0 +1,144 @@
+"""
+A local stand-in for the Last.fm API, so that the importers can be
+tested and benchmarked offline.
+
+Usage:
+    with LastFmStubServer(pages=3, tracks_per_page=10) as server:
+        call_command("import_music_from_lastfm_json",
+                     api_url=server.api_url, rate_limit=0)
+"""
+import json
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlparse
+from xml.sax.saxutils import escape
+
+# the smallest valid GIF image
+IMAGE_CONTENT = (
+    b"GIF89a\x01\x00\x01\x00\x80\x00\x00\x00\x00\x00\xff\xff\xff!\xf9\x04"
+    b"\x01\x00\x00\x00\x00,\x00\x00\x00\x00\x01\x00\x01\x00\x00\x02\x02D\x01\x00;"
+)
+
+
+class LastFmStubServer(object):
+    def __init__(self, pages=3, tracks_per_page=10, delay=0.0, failing_pages=(),
+                 dropped_pages=(), drop_images=False):
+        self.pages = pages
+        self.tracks_per_page = tracks_per_page
+        self.delay = delay  # simulated network latency in seconds
+        self.failing_pages = set(failing_pages)
+        # the connections of these requests are closed without a response
+        self.dropped_pages = set(dropped_pages)
+        self.drop_images = drop_images
+        self.requests = []
+        self.lock = threading.Lock()
+        self.httpd = ThreadingHTTPServer(("127.0.0.1", 0), self.get_handler_class())
+        self.thread = threading.Thread(target=self.httpd.serve_forever, daemon=True)
+
+    @property
+    def base_url(self):
+        host, port = self.httpd.server_address
+        return f"http://{host}:{port}"
+
+    @property
+    def api_url(self):
+        return f"{self.base_url}/2.0/"
+
+    def __enter__(self):
+        self.thread.start()
+        return self
+
+    def __exit__(self, *args):
+        self.httpd.shutdown()
+        self.httpd.server_close()
+        self.thread.join()
+
+    def get_tracks(self, page):
+        first = (page - 1) * self.tracks_per_page + 1
+        return [
+            {
+                "artist": f"Artist {number}",
+                "name": f"Song {number}",
+                "url": f"https://www.last.fm/music/artist-{number}/_/song-{number}",
+                "image": f"{self.base_url}/images/{number}.gif",
+            }
+            for number in range(first, first + self.tracks_per_page)
+        ]
+
+    def render_json(self, page):
+        data = {
+            "tracks": {
+                "track": [
+                    {
+                        "name": track["name"],
+                        "url": track["url"],
+                        "artist": {"name": track["artist"]},
+                        "image": [
+                            {"#text": track["image"], "size": "small"},
+                            {"#text": track["image"], "size": "medium"},
+                        ],
+                    }
+                    for track in self.get_tracks(page)
+                ],
+                "@attr": {"page": str(page), "totalPages": str(self.pages)},
+            }
+        }
+        return json.dumps(data).encode("utf-8"), "application/json"
+
+    def render_xml(self, page):
+        tracks = "".join(
+            f"<track><name>{escape(track['name'])}</name>"
+            f"<url>{escape(track['url'])}</url>"
+            f"<artist><name>{escape(track['artist'])}</name></artist>"
+            f"<image size=\"medium\">{escape(track['image'])}</image></track>"
+            for track in self.get_tracks(page)
+        )
+        content = (
+            f'<?xml version="1.0" encoding="utf-8"?><lfm status="ok">'
+            f'<tracks page="{page}" totalPages="{self.pages}">{tracks}</tracks></lfm>'
+        )
+        return content.encode("utf-8"), "text/xml"
+
+    def get_handler_class(self):
+        server = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                url = urlparse(self.path)
+                with server.lock:
+                    server.requests.append(self.path)
+                if server.delay:
+                    time.sleep(server.delay)
+
+                if url.path.startswith("/images/"):
+                    if server.drop_images:
+                        return self.drop()
+                    return self.respond(200, IMAGE_CONTENT, "image/gif")
+
+                query = parse_qs(url.query)
+                page = int(query.get("page", ["1"])[0])
+                if page in server.dropped_pages:
+                    return self.drop()
+                if page in server.failing_pages:
+                    return self.respond(503, b"Service Unavailable", "text/plain")
+                if query.get("format", ["xml"])[0] == "json":
+                    content, content_type = server.render_json(page)
+                else:
+                    content, content_type = server.render_xml(page)
+                return self.respond(200, content, content_type)
+
+            def respond(self, status, content, content_type):
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(content)))
+                self.end_headers()
+                self.wfile.write(content)
+
+            def drop(self):
+                self.close_connection = True
+
+            def log_message(self, format, *args):
+                pass  # keep the test output clean
+
+        return Handler
@@ -0,0 +1,27 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from ..models import Song
+
+
+class BackfillSongImportKeysCommandTest(TestCase):
+    def setUp(self):
+        for title in ["Video Games", "Summertime Sadness", "Born To Die"]:
+            Song.objects.create(artist="Lana Del Rey", title=title)
+        # the songs saved before the import keys existed
+        Song.objects.exclude(title="Born To Die").update(import_key=None)
+
+    def test_backfill(self):
+        stdout = StringIO()
+        call_command("backfill_song_import_keys", batch_size=1, stdout=stdout)
+        self.assertIn("Songs updated: 2", stdout.getvalue())
+        for song in Song.objects.all():
+            self.assertEqual(
+                song.import_key, Song.get_import_key(song.artist, song.title)
+            )
+
+        stdout = StringIO()
+        call_command("backfill_song_import_keys", stdout=stdout)
+        self.assertIn("Songs updated: 0", stdout.getvalue())
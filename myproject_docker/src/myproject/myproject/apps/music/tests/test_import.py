@@ -0,0 +1,159 @@
+import csv
+import os
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase
+
+from ..models import Song
+
+
+class CSVImportTest(TestCase):
+    def setUp(self):
+        Song.objects.create(
+            artist="Capital Cities",
+            title="Safe And Sound",
+            url="https://example.com/safe-and-sound",
+        )
+        handle, self.file_path = tempfile.mkstemp(suffix=".csv")
+        with os.fdopen(handle, mode="w") as f:
+            f.write("artist,title,url\n")
+            f.write("Capital Cities,Safe And Sound,https://example.com/1\n")
+            f.write("Milky Chance,Stolen Dance,https://example.com/2\n")
+            f.write("Milky Chance,Stolen Dance,https://example.com/3\n")
+            f.write("Men I Trust,Tailwhip,not-a-url\n")
+            f.write("Lana Del Rey,Video Games,https://example.com/4\n")
+            f.write("Lana Del Rey,Summertime Sadness,https://example.com/5\n")
+
+        handle, self.error_report_path = tempfile.mkstemp(suffix=".csv")
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.file_path)
+        os.remove(self.error_report_path)
+
+    def test_import(self):
+        stdout, stderr = StringIO(), StringIO()
+        call_command(
+            "import_music_from_csv",
+            self.file_path,
+            batch_size=2,
+            bulk=True,
+            error_report=self.error_report_path,
+            stdout=stdout,
+            stderr=stderr,
+        )
+        self.assertEqual(Song.objects.count(), 4)
+        self.assertEqual(
+            set(Song.objects.values_list("artist", "title")),
+            {
+                ("Capital Cities", "Safe And Sound"),
+                ("Milky Chance", "Stolen Dance"),
+                ("Lana Del Rey", "Video Games"),
+                ("Lana Del Rey", "Summertime Sadness"),
+            },
+        )
+        output = stdout.getvalue()
+        self.assertIn("Batch 1: 1 imported, 1 known, 0 invalid", output)
+        self.assertIn("Batch 2: 0 imported, 1 known, 1 invalid", output)
+        self.assertIn("Batch 3: 2 imported, 0 known, 0 invalid", output)
+        self.assertIn("Songs imported: 3", output)
+        self.assertIn("Songs already imported: 2", output)
+        self.assertIn("Songs skipped: 1", output)
+
+        with open(self.error_report_path) as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]["title"], "Tailwhip")
+        self.assertIn("url", rows[0]["errors"])
+
+
+class SongImporterTest(TestCase):
+    def test_custom_reader(self):
+        from ..importing import SongImporter
+        from ..readers import SongReader
+
+        class ListReader(SongReader):
+            def __init__(self, song_dicts):
+                self.song_dicts = song_dicts
+                self.saved_batches = []
+
+            def read(self):
+                return iter(self.song_dicts)
+
+            def batch_saved(self, batch):
+                self.saved_batches.append(batch.number)
+
+        reader = ListReader([
+            {"artist": f"Artist {index}", "title": "Title", "url": ""}
+            for index in range(5)
+        ])
+        importer = SongImporter(reader, batch_size=2)
+        importer.run()
+        self.assertEqual(reader.saved_batches, [1, 2, 3])
+        self.assertEqual(importer.imported_counter, 5)
+        self.assertEqual(Song.objects.count(), 5)
+
+    def test_prefetching_reader(self):
+        import threading
+        from ..importing import SongImporter
+        from ..readers import SongReader
+
+        class PrefetchingListReader(SongReader):
+            prefetch = True
+
+            def __init__(self, song_dicts):
+                self.song_dicts = song_dicts
+                self.threads = set()
+
+            def read(self):
+                for song_dict in self.song_dicts:
+                    self.threads.add(threading.current_thread())
+                    yield song_dict
+
+        reader = PrefetchingListReader([
+            {"artist": f"Artist {index}", "title": "Title", "url": ""}
+            for index in range(5)
+        ])
+        importer = SongImporter(reader, batch_size=2)
+        importer.run()
+        self.assertNotIn(threading.current_thread(), reader.threads)
+        self.assertEqual(importer.batch_timings[-1][0], 1)
+        self.assertEqual(importer.imported_counter, 5)
+        self.assertEqual(Song.objects.count(), 5)
+
+
+class StreamingXLSXImportTest(TestCase):
+    def setUp(self):
+        from openpyxl import Workbook
+
+        wb = Workbook()
+        ws = wb.active
+        ws.append(["Artist", "Title", "URL"])
+        for index in range(1, 7):
+            ws.append([f"Artist {index}", f"Title {index}", f"https://example.com/{index}"])
+        handle, self.file_path = tempfile.mkstemp(suffix=".xlsx")
+        os.close(handle)
+        wb.save(self.file_path)
+
+    def tearDown(self):
+        os.remove(self.file_path)
+
+    def test_import_row_ranges(self):
+        # rows 2-4 and 5-7 as if imported by two parallel processes
+        for start_row, end_row in ((2, 4), (5, 7)):
+            call_command(
+                "import_music_from_xlsx",
+                self.file_path,
+                streaming=True,
+                batch_size=2,
+                start_row=start_row,
+                end_row=end_row,
+                verbosity=0,
+            )
+            self.assertEqual(Song.objects.count(), end_row - 1)
+        self.assertEqual(
+            sorted(Song.objects.values_list("title", flat=True)),
+            [f"Title {index}" for index in range(1, 7)],
+        )
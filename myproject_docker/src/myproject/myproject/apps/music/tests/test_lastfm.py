@@ -0,0 +1,105 @@
+import shutil
+import tempfile
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from ..models import ImportCheckpoint, Song
+from .lastfm_server import LastFmStubServer
+
+
+class LastFmImportTest(TestCase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.media_root = tempfile.mkdtemp()
+        cls.media_settings = override_settings(MEDIA_ROOT=cls.media_root)
+        cls.media_settings.enable()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.media_settings.disable()
+        shutil.rmtree(cls.media_root, ignore_errors=True)
+        super().tearDownClass()
+
+    def import_songs(self, command_name, server, **options):
+        stdout, stderr = StringIO(), StringIO()
+        call_command(
+            command_name,
+            api_url=server.api_url,
+            workers=3,
+            image_workers=3,
+            rate_limit=0,
+            stdout=stdout,
+            stderr=stderr,
+            **options,
+        )
+        return stdout.getvalue(), stderr.getvalue()
+
+    def test_json_import(self):
+        with LastFmStubServer(pages=4, tracks_per_page=5) as server:
+            stdout, stderr = self.import_songs("import_music_from_lastfm_json", server)
+        self.assertEqual(Song.objects.count(), 20)
+        self.assertEqual(Song.objects.exclude(image="").count(), 20)
+        self.assertIn("Songs imported: 20", stdout)
+        self.assertEqual(stderr, "")
+
+    def test_xml_import_with_max_pages(self):
+        with LastFmStubServer(pages=4, tracks_per_page=5) as server:
+            self.import_songs("import_music_from_lastfm_xml", server, max_pages=2)
+        self.assertEqual(Song.objects.count(), 10)
+        self.assertEqual(Song.objects.exclude(image="").count(), 10)
+
+    def test_import_stops_at_failing_page(self):
+        with LastFmStubServer(pages=4, tracks_per_page=5, failing_pages=[3]) as server:
+            stdout, stderr = self.import_songs("import_music_from_lastfm_json", server)
+        self.assertEqual(Song.objects.count(), 10)
+        self.assertIn("Error connecting to", stderr)
+
+    def test_import_stops_at_dropped_connection(self):
+        with LastFmStubServer(pages=4, tracks_per_page=5, dropped_pages=[3]) as server:
+            stdout, stderr = self.import_songs("import_music_from_lastfm_json", server)
+        self.assertEqual(Song.objects.count(), 10)
+        self.assertIn("Error connecting to", stderr)
+        self.assertIn("Imported up to page 2", stderr)
+        self.assertEqual(ImportCheckpoint.objects.get().last_page, 2)
+
+    def test_first_page_dropped(self):
+        with LastFmStubServer(pages=2, tracks_per_page=5, dropped_pages=[1]) as server:
+            stdout, stderr = self.import_songs("import_music_from_lastfm_json", server)
+        self.assertFalse(Song.objects.exists())
+        self.assertIn("Imported up to page 0", stderr)
+
+    def test_dropped_images_are_skipped(self):
+        with LastFmStubServer(pages=2, tracks_per_page=5, drop_images=True) as server:
+            stdout, stderr = self.import_songs("import_music_from_lastfm_json", server)
+        self.assertEqual(Song.objects.count(), 10)
+        self.assertFalse(Song.objects.exclude(image="").exists())
+        self.assertIn("Images saved: 0", stdout)
+
+    def test_resume_after_failing_page(self):
+        with LastFmStubServer(pages=4, tracks_per_page=5, failing_pages=[3]) as server:
+            stdout, stderr = self.import_songs("import_music_from_lastfm_json", server)
+        self.assertIn("--resume", stderr)
+        self.assertEqual(ImportCheckpoint.objects.get().last_page, 2)
+
+        with LastFmStubServer(pages=4, tracks_per_page=5) as server:
+            stdout, stderr = self.import_songs(
+                "import_music_from_lastfm_xml", server, resume=True
+            )
+            requested_pages = sorted(
+                path for path in server.requests if not path.startswith("/images/")
+            )
+        self.assertEqual(len(requested_pages), 2)
+        self.assertEqual(Song.objects.count(), 20)
+        self.assertEqual(ImportCheckpoint.objects.get().last_page, 4)
+        self.assertEqual(stderr, "")
+
+    def test_reimport_skips_known_tracks(self):
+        with LastFmStubServer(pages=2, tracks_per_page=5) as server:
+            self.import_songs("import_music_from_lastfm_json", server)
+            stdout, stderr = self.import_songs("import_music_from_lastfm_json", server)
+        self.assertEqual(Song.objects.count(), 10)
+        self.assertIn("Songs imported: 0", stdout)
+        self.assertIn("Songs already imported: 10", stdout)
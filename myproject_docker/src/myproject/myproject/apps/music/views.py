@@ -5,15 +5,19 @@ from django.utils.translation import ugettext_lazy as _
 
 from rest_framework import generics
 
+from myproject.apps.core.paginators import KeysetPaginationMixin
+
 from .serializers import SongSerializer
 from .models import Song
 from .forms import SongFilterForm
 
 # Create your views here.
 
-class SongList(ListView, FormView):
+class SongList(KeysetPaginationMixin, ListView, FormView):
     form_class = SongFilterForm
     model = Song
+    paginate_by = 50
+    keyset_ordering = ("created", "pk")
 
     def get(self, request, *args, **kwargs):
         form_class = self.get_form_class()
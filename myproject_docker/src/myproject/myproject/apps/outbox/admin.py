@@ -0,0 +1,9 @@
+from django.contrib import admin
+from .models import OutgoingEmail
+
+@admin.register(OutgoingEmail)
+class OutgoingEmailAdmin(admin.ModelAdmin):
+    list_display = ["subject", "status", "attempts", "next_attempt", "sent"]
+    list_filter = ["status"]
+    search_fields = ["subject", "recipients"]
+    readonly_fields = ["attempts", "last_error", "sent", "created", "modified"]
@@ -0,0 +1,7 @@
+from django.apps import AppConfig
+from django.utils.translation import gettext_lazy as _
+
+
+class OutboxAppConfig(AppConfig):
+    name = "myproject.apps.outbox"
+    verbose_name = _("Outbox")
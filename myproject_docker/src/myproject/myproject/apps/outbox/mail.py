@@ -0,0 +1,81 @@
+from django.conf import settings
+from django.db import transaction
+from django.utils.timezone import now as timezone_now
+
+from .models import OutgoingEmail
+
+
+def queue_mail(subject, message, recipient_list, from_email=None, html_message=""):
+    """
+    Stores an email in the outbox instead of sending it
+    """
+    return OutgoingEmail.objects.create(
+        subject=subject,
+        body=message,
+        html_body=html_message or "",
+        from_email=from_email or settings.DEFAULT_FROM_EMAIL,
+        recipients="\n".join(recipient_list),
+    )
+
+
+def queue_mail_admins(subject, message, html_message=""):
+    """
+    Queued version of django.core.mail.mail_admins()
+    """
+    if not settings.ADMINS:
+        return None
+    return queue_mail(
+        subject=f"{settings.EMAIL_SUBJECT_PREFIX}{subject}",
+        message=message,
+        recipient_list=[email for name, email in settings.ADMINS],
+        from_email=settings.SERVER_EMAIL,
+        html_message=html_message,
+    )
+
+
+def send_queued_mail(batch_size=50):
+    """
+    Sends a batch of due emails over a single connection.
+    Rows locked by other workers are skipped.
+    Returns a tuple of the amounts of sent and failed emails.
+    """
+    from django.core.mail import get_connection
+
+    sent_counter = failed_counter = 0
+    with transaction.atomic():
+        emails = list(
+            OutgoingEmail.objects.select_for_update(skip_locked=True)
+            .filter(
+                status=OutgoingEmail.STATUS_PENDING,
+                next_attempt__lte=timezone_now(),
+            )
+            .order_by("next_attempt")[:batch_size]
+        )
+        if not emails:
+            return sent_counter, failed_counter
+
+        connection = get_connection()
+        try:
+            connection.open()
+        except Exception as error:
+            # the whole batch will be retried later
+            for email in emails:
+                email.mark_failed(error)
+            failed_counter = len(emails)
+        else:
+            for email in emails:
+                try:
+                    email.get_message(connection=connection).send()
+                except Exception as error:
+                    email.mark_failed(error)
+                    failed_counter += 1
+                else:
+                    email.mark_sent()
+                    sent_counter += 1
+            connection.close()
+
+        OutgoingEmail.objects.bulk_update(
+            emails,
+            ["status", "attempts", "next_attempt", "last_error", "sent"],
+        )
+    return sent_counter, failed_counter
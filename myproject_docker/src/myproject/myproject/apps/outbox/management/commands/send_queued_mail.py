@@ -0,0 +1,46 @@
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = (
+        "Sends the emails waiting in the outbox in batches. "
+        "Failed emails are retried with an exponential backoff."
+    )
+    SILENT, NORMAL, VERBOSE, VERY_VERBOSE = 0, 1, 2, 3
+
+    def add_arguments(self, parser):
+        # Named (optional) arguments
+        parser.add_argument("--batch-size", type=int, default=50)
+        parser.add_argument(
+            "--interval",
+            type=int,
+            default=0,
+            help="Keep draining the outbox every given amount of seconds.",
+        )
+
+    def handle(self, *args, **options):
+        import time
+
+        self.verbosity = options.get("verbosity", self.NORMAL)
+        self.batch_size = options["batch_size"]
+        interval = options["interval"]
+        self.drain()
+        while interval > 0:
+            time.sleep(interval)
+            self.drain()
+
+    def drain(self):
+        from ...mail import send_queued_mail
+
+        sent_counter = failed_counter = 0
+        while True:
+            sent, failed = send_queued_mail(batch_size=self.batch_size)
+            sent_counter += sent
+            failed_counter += failed
+            # stop when the outbox is empty or the SMTP server fails
+            if sent == 0:
+                break
+
+        if self.verbosity >= self.NORMAL:
+            self.stdout.write(f"Emails sent: {sent_counter}\n")
+            self.stdout.write(f"Emails failed: {failed_counter}\n")
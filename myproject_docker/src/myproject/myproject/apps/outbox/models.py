@@ -0,0 +1,86 @@
+from datetime import timedelta
+
+from django.conf import settings
+from django.db import models
+from django.utils.timezone import now as timezone_now
+from django.utils.translation import gettext_lazy as _
+
+from myproject.apps.core.models import CreationModificationDateBase
+
+MAX_ATTEMPTS = getattr(settings, "OUTBOX_MAX_ATTEMPTS", 5)
+RETRY_DELAY = getattr(settings, "OUTBOX_RETRY_DELAY", 60)  # seconds
+
+
+class OutgoingEmail(CreationModificationDateBase):
+    STATUS_PENDING, STATUS_SENT, STATUS_FAILED = "pending", "sent", "failed"
+    STATUS_CHOICES = (
+        (STATUS_PENDING, _("Pending")),
+        (STATUS_SENT, _("Sent")),
+        (STATUS_FAILED, _("Failed")),
+    )
+
+    subject = models.CharField(_("Subject"), max_length=255)
+    body = models.TextField(_("Plain text message"))
+    html_body = models.TextField(_("HTML message"), blank=True)
+    from_email = models.CharField(_("From"), max_length=255)
+    recipients = models.TextField(_("Recipients"), help_text=_("One per line."))
+    status = models.CharField(
+        _("Status"),
+        max_length=10,
+        choices=STATUS_CHOICES,
+        default=STATUS_PENDING,
+    )
+    attempts = models.PositiveIntegerField(_("Attempts"), default=0)
+    next_attempt = models.DateTimeField(
+        _("Next attempt"), default=timezone_now, db_index=True
+    )
+    last_error = models.TextField(_("Last error"), blank=True)
+    sent = models.DateTimeField(_("Sent"), blank=True, null=True)
+
+    class Meta:
+        verbose_name = _("Outgoing email")
+        verbose_name_plural = _("Outgoing emails")
+        ordering = ("next_attempt",)
+
+    def __str__(self):
+        return self.subject
+
+    def get_recipient_list(self):
+        return [
+            recipient.strip()
+            for recipient in self.recipients.splitlines()
+            if recipient.strip()
+        ]
+
+    def get_message(self, connection=None):
+        from django.core.mail import EmailMultiAlternatives
+
+        message = EmailMultiAlternatives(
+            subject=self.subject,
+            body=self.body,
+            from_email=self.from_email,
+            to=self.get_recipient_list(),
+            connection=connection,
+        )
+        if self.html_body:
+            message.attach_alternative(self.html_body, "text/html")
+        return message
+
+    def mark_sent(self):
+        self.status = self.STATUS_SENT
+        self.attempts += 1
+        self.sent = timezone_now()
+        self.last_error = ""
+
+    def mark_failed(self, error):
+        """
+        Schedules the next attempt with an exponential backoff
+        or gives up after MAX_ATTEMPTS attempts.
+        """
+        self.attempts += 1
+        self.last_error = str(error)
+        if self.attempts >= MAX_ATTEMPTS:
+            self.status = self.STATUS_FAILED
+        else:
+            delay = RETRY_DELAY * 2 ** (self.attempts - 1)
+            self.next_attempt = timezone_now() + timedelta(seconds=delay)
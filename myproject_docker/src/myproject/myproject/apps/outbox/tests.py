@@ -0,0 +1,59 @@
+from unittest import mock
+
+from django.core import mail
+from django.test import TestCase, override_settings
+from django.utils.timezone import now as timezone_now
+
+from .mail import queue_mail, send_queued_mail
+from .models import MAX_ATTEMPTS, OutgoingEmail
+
+
+@override_settings(EMAIL_BACKEND="django.core.mail.backends.locmem.EmailBackend")
+class OutboxTest(TestCase):
+    def queue(self, index=0):
+        return queue_mail(
+            subject=f"Hello {index}",
+            message="Plain text",
+            html_message="<p>HTML</p>",
+            recipient_list=["admin@example.com"],
+            from_email="site@example.com",
+        )
+
+    def test_emails_are_sent_in_batches(self):
+        for index in range(3):
+            self.queue(index)
+        self.assertEqual(len(mail.outbox), 0)
+
+        self.assertEqual(send_queued_mail(batch_size=2), (2, 0))
+        self.assertEqual(send_queued_mail(batch_size=2), (1, 0))
+        self.assertEqual(send_queued_mail(batch_size=2), (0, 0))
+
+        self.assertEqual(len(mail.outbox), 3)
+        self.assertEqual(mail.outbox[0].alternatives, [("<p>HTML</p>", "text/html")])
+        self.assertFalse(
+            OutgoingEmail.objects.exclude(status=OutgoingEmail.STATUS_SENT).exists()
+        )
+
+    def test_failed_emails_are_retried_with_backoff(self):
+        email = self.queue()
+        with mock.patch(
+            "django.core.mail.EmailMultiAlternatives.send",
+            side_effect=ConnectionError("SMTP is down"),
+        ):
+            self.assertEqual(send_queued_mail(), (0, 1))
+            email.refresh_from_db()
+            self.assertEqual(email.status, OutgoingEmail.STATUS_PENDING)
+            self.assertEqual(email.attempts, 1)
+            self.assertGreater(email.next_attempt, timezone_now())
+            self.assertEqual(email.last_error, "SMTP is down")
+
+            # not due yet
+            self.assertEqual(send_queued_mail(), (0, 0))
+
+            for __ in range(MAX_ATTEMPTS - 1):
+                OutgoingEmail.objects.update(next_attempt=timezone_now())
+                send_queued_mail()
+
+        email.refresh_from_db()
+        self.assertEqual(email.status, OutgoingEmail.STATUS_FAILED)
+        self.assertEqual(email.attempts, MAX_ATTEMPTS)
@@ -0,0 +1 @@
+default_app_config = "myproject.apps.search.apps.SearchAppConfig"
@@ -0,0 +1,10 @@
+from django.contrib import admin
+
+from .models import QueuedIndexUpdate
+
+
+@admin.register(QueuedIndexUpdate)
+class QueuedIndexUpdateAdmin(admin.ModelAdmin):
+    list_display = ["content_type", "object_id", "language", "created"]
+    list_filter = ["content_type", "language"]
+    readonly_fields = ["content_type", "object_id", "language", "created"]
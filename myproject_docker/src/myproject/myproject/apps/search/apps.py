@@ -0,0 +1,10 @@
+from django.apps import AppConfig
+from django.utils.translation import gettext_lazy as _
+
+
+class SearchAppConfig(AppConfig):
+    name = "myproject.apps.search"
+    verbose_name = _("Search")
+
+    def ready(self):
+        from . import signals
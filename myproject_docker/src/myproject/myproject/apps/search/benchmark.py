@@ -0,0 +1,212 @@
+"""
+Benchmark of the multilingual search.
+
+A reproducible synthetic corpus of ideas with translations in all
+languages is indexed into temporary index directories, so that the
+real indexes and the database stay untouched: the corpus is created
+in a transaction that is rolled back at the end.
+"""
+import contextlib
+import os
+import random
+import shutil
+import tempfile
+import time
+
+SYLLABLES = [
+    "ka", "lo", "mi", "ne", "ru", "sa", "ti", "vo", "ze", "pa",
+    "do", "li", "mu", "ko", "ra", "se", "tu", "ve", "zo", "pi",
+]
+
+
+def get_percentile(durations, percentile):
+    durations = sorted(durations)
+    index = min(len(durations) - 1, int(round(percentile / 100 * (len(durations) - 1))))
+    return durations[index]
+
+
+class SyntheticCorpus(object):
+    """
+    Generates pseudo words, which are unique per language,
+    from a seeded random generator
+    """
+    def __init__(self, lang_codes, seed=0, vocabulary_size=500):
+        from django.conf import settings
+
+        # the titles and contents of the ideas are in the default language
+        lang_codes = list(lang_codes)
+        if settings.LANGUAGE_CODE not in lang_codes:
+            lang_codes.append(settings.LANGUAGE_CODE)
+        self.random = random.Random(seed)
+        self.vocabularies = {
+            lang_code: [
+                lang_code.replace("-", "") + "".join(
+                    self.random.choice(SYLLABLES)
+                    for index in range(self.random.randint(2, 4))
+                )
+                for word_index in range(vocabulary_size)
+            ]
+            for lang_code in lang_codes
+        }
+
+    def get_text(self, lang_code, word_count):
+        return " ".join(
+            self.random.choice(self.vocabularies[lang_code])
+            for index in range(word_count)
+        )
+
+    def get_query(self, lang_code):
+        return self.random.choice(self.vocabularies[lang_code])
+
+    def create_ideas(self, idea_count):
+        from django.conf import settings
+        from myproject.apps.ideas.models import Idea, IdeaTranslations
+
+        ideas = Idea.objects.bulk_create([
+            Idea(
+                title=f"Benchmark {index} {self.get_text(settings.LANGUAGE_CODE, 3)}",
+                content=self.get_text(settings.LANGUAGE_CODE, 30),
+                picture="ideas/benchmark.jpg",  # dummy path
+            )
+            for index in range(idea_count)
+        ])
+        IdeaTranslations.objects.bulk_create([
+            IdeaTranslations(
+                idea=idea,
+                language=lang_code,
+                title=self.get_text(lang_code, 4),
+                content=self.get_text(lang_code, 30),
+            )
+            for idea in ideas
+            for lang_code in self.vocabularies
+            if lang_code != settings.LANGUAGE_CODE
+        ])
+        return ideas
+
+
+@contextlib.contextmanager
+def temporary_indexes(aliases):
+    """
+    Points the search connections to empty temporary directories
+    """
+    from haystack import connections
+
+    index_root = tempfile.mkdtemp(prefix="search_benchmark_")
+    original_paths = {
+        alias: connections.connections_info[alias]["PATH"] for alias in aliases
+    }
+    try:
+        for alias in aliases:
+            connections.connections_info[alias]["PATH"] = f"{index_root}/{alias}"
+            connections.reload(alias)
+        yield index_root
+    finally:
+        for alias, path in original_paths.items():
+            connections.connections_info[alias]["PATH"] = path
+            connections.reload(alias)
+        shutil.rmtree(index_root, ignore_errors=True)
+
+
+class SearchBenchmark(object):
+    def __init__(self, lang_codes, idea_count=200, update_count=20,
+                 query_count=50, batch_size=500, seed=0):
+        self.lang_codes = lang_codes
+        self.idea_count = idea_count
+        self.update_count = update_count
+        self.query_count = query_count
+        self.batch_size = batch_size
+        self.seed = seed
+        self.corpus = SyntheticCorpus(lang_codes, seed=seed)
+
+    def run(self):
+        from django.db import transaction
+        from django.test.utils import override_settings
+        from .multilingual_whoosh_backend import get_language_alias
+
+        results = {
+            "seed": self.seed,
+            "ideas": self.idea_count,
+            "languages": self.lang_codes,
+        }
+        from .cache import forget
+
+        aliases = [get_language_alias(lang_code) for lang_code in self.lang_codes]
+        # measure the index, not the result cache, and keep the
+        # generations of the real indexes in the shared cache untouched
+        with override_settings(
+            SEARCH_RESULT_CACHE_TIMEOUT=0,
+            SEARCH_CACHE_KEY_PREFIX=f"search-benchmark-{os.getpid()}",
+        ):
+            try:
+                with temporary_indexes(aliases), transaction.atomic():
+                    ideas = self.corpus.create_ideas(self.idea_count)
+                    results["rebuild"] = self.measure_rebuild()
+                    results["incremental"] = self.measure_incremental(ideas)
+                    results["queries"] = self.measure_queries()
+                    transaction.set_rollback(True)
+            finally:
+                for alias in aliases + ["default"]:
+                    forget(alias)
+        return results
+
+    def measure_rebuild(self):
+        from .parallel import index_language
+
+        # the corpus isn't committed, so the languages are indexed
+        # in this process instead of a process pool
+        per_language = {}
+        started = time.perf_counter()
+        for lang_code in self.lang_codes:
+            result = index_language(lang_code, chunk_size=self.batch_size, clear=True)
+            per_language[lang_code] = round(result.duration, 4)
+        return {
+            "total_seconds": round(time.perf_counter() - started, 4),
+            "per_language_seconds": per_language,
+        }
+
+    def measure_incremental(self, ideas):
+        from myproject.apps.ideas.models import IdeaTranslations
+        from .models import QueuedIndexUpdate
+        from .queue import process_index_queue
+
+        QueuedIndexUpdate.objects.all().delete()
+        translations = list(
+            IdeaTranslations.objects.filter(
+                idea__in=ideas[:self.update_count], language__in=self.lang_codes
+            )[:self.update_count]
+        )
+        latencies = []
+        for idea_translation in translations:
+            started = time.perf_counter()
+            idea_translation.title = self.corpus.get_text(idea_translation.language, 4)
+            idea_translation.save()  # queues the update
+            while process_index_queue() is not None:
+                pass
+            latencies.append(time.perf_counter() - started)
+        if not latencies:
+            return {"updates": 0}
+        return {
+            "updates": len(latencies),
+            "mean_ms": round(sum(latencies) / len(latencies) * 1000, 3),
+            "p99_ms": round(get_percentile(latencies, 99) * 1000, 3),
+        }
+
+    def measure_queries(self):
+        from django.utils import translation
+        from haystack.query import SearchQuerySet
+
+        per_language = {}
+        for lang_code in self.lang_codes:
+            durations = []
+            with translation.override(lang_code):
+                for index in range(self.query_count):
+                    query = self.corpus.get_query(lang_code)
+                    started = time.perf_counter()
+                    list(SearchQuerySet().auto_query(query)[:10])
+                    durations.append(time.perf_counter() - started)
+            per_language[lang_code] = {
+                "qps": round(len(durations) / sum(durations), 1),
+                "p50_ms": round(get_percentile(durations, 50) * 1000, 3),
+                "p99_ms": round(get_percentile(durations, 99) * 1000, 3),
+            }
+        return per_language
@@ -0,0 +1,108 @@
+"""
+Caching of search results per language index.
+
+The cache keys contain a generation number of the index, which is
+increased whenever the index is committed, so all cached results of
+a language become stale at once without deleting them one by one.
+The generations and the hit and miss counters are kept in the shared
+cache, so they are the same for all worker processes.
+"""
+import hashlib
+import time
+from collections import namedtuple
+
+from django.conf import settings
+from django.core.cache import cache
+
+CacheStats = namedtuple("CacheStats", ["hits", "misses"])
+
+
+def get_timeout():
+    return getattr(settings, "SEARCH_RESULT_CACHE_TIMEOUT", 300)  # seconds
+
+
+def get_key_prefix():
+    # the benchmark uses its own prefix,
+    # so that it doesn't touch the real generations
+    return getattr(settings, "SEARCH_CACHE_KEY_PREFIX", "search")
+
+
+def normalize_query(query_string):
+    # the operators of the query syntax are case-sensitive,
+    # so only the whitespace is normalized
+    return " ".join(str(query_string).split())
+
+
+def get_generation(alias):
+    generation = cache.get(f"{get_key_prefix()}:generation:{alias}")
+    if generation is None:
+        # starting from the current time, an evicted generation
+        # can't bring back the results of an older one
+        generation = cache.get_or_set(
+            f"{get_key_prefix()}:generation:{alias}", int(time.time()), timeout=None
+        )
+    return generation
+
+
+def bump_generation(alias):
+    try:
+        cache.incr(f"{get_key_prefix()}:generation:{alias}")
+    except ValueError:
+        cache.set(f"{get_key_prefix()}:generation:{alias}", int(time.time()), timeout=None)
+
+
+def normalize_option(value):
+    # sets like narrow_queries or models are repr'ed in the order of
+    # their hashes, which differs between processes
+    if isinstance(value, (set, frozenset)):
+        return sorted(repr(item) for item in value)
+    if isinstance(value, (list, tuple)):
+        return [normalize_option(item) for item in value]
+    if isinstance(value, dict):
+        return sorted((key, normalize_option(item)) for key, item in value.items())
+    return value
+
+
+def get_cache_key(alias, query_string, start_offset, end_offset, options):
+    key_parts = [
+        normalize_query(query_string),
+        str(start_offset),
+        str(end_offset),
+        repr(normalize_option(options)),
+    ]
+    digest = hashlib.sha1("\n".join(key_parts).encode("utf-8")).hexdigest()
+    return f"{get_key_prefix()}:results:{alias}:{get_generation(alias)}:{digest}"
+
+
+def count(alias, name):
+    key = f"{get_key_prefix()}:stats:{name}:{alias}"
+    if not cache.add(key, 1, timeout=None):
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.set(key, 1, timeout=None)
+
+
+def get_stats(alias):
+    return CacheStats(
+        cache.get(f"{get_key_prefix()}:stats:hits:{alias}", 0),
+        cache.get(f"{get_key_prefix()}:stats:misses:{alias}", 0),
+    )
+
+
+def reset_stats(alias):
+    cache.delete_many([
+        f"{get_key_prefix()}:stats:hits:{alias}",
+        f"{get_key_prefix()}:stats:misses:{alias}",
+    ])
+
+
+def forget(alias):
+    """
+    Removes the generation and the counters of an index from the cache
+    """
+    cache.delete_many([
+        f"{get_key_prefix()}:generation:{alias}",
+        f"{get_key_prefix()}:stats:hits:{alias}",
+        f"{get_key_prefix()}:stats:misses:{alias}",
+    ])
@@ -0,0 +1,58 @@
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = (
+        "Measures the indexing and query performance of the multilingual "
+        "search with a synthetic corpus and prints the results as JSON."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument("--ideas", type=int, default=200)
+        parser.add_argument(
+            "--updates", type=int, default=20,
+            help="The amount of translation changes for the incremental updates.",
+        )
+        parser.add_argument(
+            "--queries", type=int, default=50,
+            help="The amount of queries per language.",
+        )
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument("--seed", type=int, default=0)
+        parser.add_argument(
+            "--language", dest="languages", action="append", default=[],
+            help="Only benchmark the given language. Can be used several times.",
+        )
+        parser.add_argument(
+            "--output", type=str, default="",
+            help="Write the JSON to a file instead of the standard output.",
+        )
+
+    def handle(self, *args, **options):
+        import json
+        from django.conf import settings
+        from ...benchmark import SearchBenchmark
+
+        lang_codes = [lang_code for lang_code, lang_name in settings.LANGUAGES]
+        unknown_languages = set(options["languages"]) - set(lang_codes)
+        if unknown_languages:
+            raise CommandError(
+                f"Unknown languages: {', '.join(sorted(unknown_languages))}"
+            )
+
+        benchmark = SearchBenchmark(
+            options["languages"] or lang_codes,
+            idea_count=options["ideas"],
+            update_count=options["updates"],
+            query_count=options["queries"],
+            batch_size=options["batch_size"],
+            seed=options["seed"],
+        )
+        results = benchmark.run()
+
+        content = json.dumps(results, indent=2, sort_keys=True)
+        if options["output"]:
+            with open(options["output"], "w") as f:
+                f.write(content + "\n")
+        else:
+            self.stdout.write(content)
@@ -0,0 +1,71 @@
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = (
+        "Applies the queued changes of the indexed objects "
+        "to the search indexes of the affected languages."
+    )
+    SILENT, NORMAL, VERBOSE, VERY_VERBOSE = 0, 1, 2, 3
+
+    def add_arguments(self, parser):
+        # Named (optional) arguments
+        parser.add_argument("--batch-size", type=int, default=100)
+        parser.add_argument(
+            "--interval",
+            type=int,
+            default=0,
+            help="Keep processing the queue every given amount of seconds.",
+        )
+        parser.add_argument(
+            "--stats",
+            action="store_true",
+            help="Only print the amount of pending updates and the lag.",
+        )
+
+    def handle(self, *args, **options):
+        import time
+
+        self.verbosity = options.get("verbosity", self.NORMAL)
+        self.batch_size = options["batch_size"]
+        interval = options["interval"]
+        if options["stats"]:
+            self.print_stats()
+            return
+        self.drain()
+        while interval > 0:
+            time.sleep(interval)
+            self.drain()
+
+    def drain(self):
+        from ...queue import process_index_queue
+
+        item_counter = updated_counter = removed_counter = 0
+        max_lag = 0.0
+        while True:
+            result = process_index_queue(batch_size=self.batch_size)
+            if result is None:
+                break
+            item_counter += result.item_count
+            updated_counter += result.updated_count
+            removed_counter += result.removed_count
+            max_lag = max(max_lag, result.lag)
+            if self.verbosity >= self.VERBOSE:
+                self.stdout.write(
+                    f"Batch of {result.item_count} queued updates applied "
+                    f"to {result.language_count} language(s), "
+                    f"lag {result.lag:.1f} s\n"
+                )
+
+        if self.verbosity >= self.NORMAL:
+            self.stdout.write(f"Queued updates processed: {item_counter}\n")
+            self.stdout.write(f"Documents updated: {updated_counter}\n")
+            self.stdout.write(f"Documents removed: {removed_counter}\n")
+            self.stdout.write(f"Maximum lag: {max_lag:.1f} s\n")
+
+    def print_stats(self):
+        from ...queue import get_queue_stats
+
+        stats = get_queue_stats()
+        self.stdout.write(f"Pending updates: {stats.pending_count}\n")
+        self.stdout.write(f"Lag: {stats.lag:.1f} s\n")
@@ -0,0 +1,41 @@
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = "Shows the hits and misses of the search result cache per language."
+    SILENT, NORMAL, VERBOSE, VERY_VERBOSE = 0, 1, 2, 3
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--reset", action="store_true", help="Reset the counters afterwards."
+        )
+
+    def handle(self, *args, **options):
+        from django.conf import settings
+        from ...cache import get_stats, reset_stats
+        from ...multilingual_whoosh_backend import get_language_alias
+
+        total_hits = total_misses = 0
+        for lang_code, lang_name in settings.LANGUAGES:
+            alias = get_language_alias(lang_code)
+            stats = get_stats(alias)
+            total_hits += stats.hits
+            total_misses += stats.misses
+            if stats.hits or stats.misses:
+                self.stdout.write(
+                    f" - {lang_code}: {stats.hits} hits, {stats.misses} misses, "
+                    f"{self.get_ratio(stats.hits, stats.misses):.0%} hit ratio\n"
+                )
+            if options["reset"]:
+                reset_stats(alias)
+
+        self.stdout.write(f"-------------------------\n")
+        self.stdout.write(f"Hits: {total_hits}\n")
+        self.stdout.write(f"Misses: {total_misses}\n")
+        self.stdout.write(
+            f"Hit ratio: {self.get_ratio(total_hits, total_misses):.0%}\n\n"
+        )
+
+    @staticmethod
+    def get_ratio(hits, misses):
+        return hits / (hits + misses) if hits + misses else 0.0
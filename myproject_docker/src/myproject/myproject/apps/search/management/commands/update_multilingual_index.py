@@ -0,0 +1,79 @@
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = (
+        "Rebuilds the Whoosh indexes of all languages in parallel processes."
+    )
+    SILENT, NORMAL, VERBOSE, VERY_VERBOSE = 0, 1, 2, 3
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--workers", type=int, default=None,
+            help="The amount of worker processes (by default the amount of CPUs).",
+        )
+        parser.add_argument(
+            "--batch-size", type=int, default=500,
+            help="The amount of objects indexed with one commit.",
+        )
+        parser.add_argument(
+            "--language", dest="languages", action="append", default=[],
+            help="Only index the given language. Can be used several times.",
+        )
+        parser.add_argument(
+            "--clear", action="store_true",
+            help="Remove the indexes before indexing.",
+        )
+
+    def handle(self, *args, **options):
+        self.verbosity = options.get("verbosity", self.NORMAL)
+        self.workers = options["workers"]
+        self.batch_size = options["batch_size"]
+        self.languages = options["languages"]
+        self.clear = options["clear"]
+        self.prepare()
+        self.main()
+        self.finalize()
+
+    def prepare(self):
+        from django.conf import settings
+
+        lang_codes = [lang_code for lang_code, lang_name in settings.LANGUAGES]
+        unknown_languages = set(self.languages) - set(lang_codes)
+        if unknown_languages:
+            raise CommandError(
+                f"Unknown languages: {', '.join(sorted(unknown_languages))}"
+            )
+        self.lang_codes = self.languages or lang_codes
+        self.results = []
+
+    def main(self):
+        import time
+        from ...parallel import index_languages_in_parallel
+
+        if self.verbosity >= self.NORMAL:
+            self.stdout.write(
+                f"=== Indexing {len(self.lang_codes)} language(s) ==="
+            )
+        started = time.perf_counter()
+        for result in index_languages_in_parallel(
+            self.lang_codes,
+            workers=self.workers,
+            chunk_size=self.batch_size,
+            clear=self.clear,
+        ):
+            self.results.append(result)
+            if self.verbosity >= self.NORMAL:
+                self.stdout.write(
+                    f" - {result.lang_code}: {result.document_count} documents "
+                    f"in {result.chunk_count} chunks, {result.duration:.2f} s\n"
+                )
+        self.duration = time.perf_counter() - started
+
+    def finalize(self):
+        if self.verbosity >= self.NORMAL:
+            serial_duration = sum(result.duration for result in self.results)
+            self.stdout.write(f"-------------------------\n")
+            self.stdout.write(f"Languages indexed: {len(self.results)}\n")
+            self.stdout.write(f"Total time: {self.duration:.2f} s\n")
+            self.stdout.write(f"Sum of language times: {serial_duration:.2f} s\n\n")
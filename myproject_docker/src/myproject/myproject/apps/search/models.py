@@ -0,0 +1,32 @@
+from django.db import models
+from django.utils.translation import gettext_lazy as _
+
+
+class QueuedIndexUpdate(models.Model):
+    """
+    An object whose search documents have to be updated or removed.
+    The rows are written in the same transaction as the changed object,
+    so no change gets lost, and are processed by the
+    process_search_queue management command.
+    """
+    content_type = models.ForeignKey(
+        "contenttypes.ContentType",
+        verbose_name=_("Content type"),
+        on_delete=models.CASCADE,
+    )
+    object_id = models.CharField(_("Object ID"), max_length=255)
+    language = models.CharField(
+        _("Language"),
+        max_length=7,
+        blank=True,
+        help_text=_("Empty for all languages."),
+    )
+    created = models.DateTimeField(_("Creation date and time"), auto_now_add=True)
+
+    class Meta:
+        verbose_name = _("Queued index update")
+        verbose_name_plural = _("Queued index updates")
+        ordering = ("pk",)
+
+    def __str__(self):
+        return f"{self.content_type_id}:{self.object_id} ({self.language or '*'})"
@@ -1,4 +1,5 @@
 from django.conf import settings
+from django.core.cache import cache
 from django.utils import translation
 from haystack.backends.whoosh_backend import (
     WhooshSearchBackend,
@@ -8,25 +9,82 @@ from haystack.backends.whoosh_backend import (
 from haystack import connections
 from haystack.constants import DEFAULT_ALIAS
 
+from .cache import bump_generation, count, get_cache_key, get_timeout
+from .searchers import PooledIndex
+
+
+def get_language_alias(lang_code):
+    lang_code_underscored = lang_code.replace("-", "_")
+    return f"default_{lang_code_underscored}"
+
+
 class MultilingualWhooshSearchBackend(WhooshSearchBackend):
+    def setup(self):
+        super().setup()
+        # keep the searchers open between the searches
+        self.index = PooledIndex(self.index)
+
     def update(self, index, iterable, commit=True, language_specific=False):
         if not language_specific and self.connection_alias == "default":
             current_language = (translation.get_language() or settings.LANGUAGE_CODE)[:2]
+            # the objects are prepared for each language, so a generator
+            # would be exhausted after the first one
+            iterable = list(iterable)
             for lang_code, lang_name in settings.LANGUAGES:
-                lang_code_underscored = lang_code.replace("-", "_")
-                using = f"default_{lang_code_underscored}"
+                using = get_language_alias(lang_code)
                 translation.activate(lang_code)
                 backend = connections[using].get_backend()
                 backend.update(index, iterable, commit, language_specific=True)
             translation.activate(current_language)
         elif language_specific:
             super().update(index, iterable, commit)
+            self.invalidate_cached_results()
+
+    def remove(self, obj_or_string, commit=True):
+        super().remove(obj_or_string, commit)
+        self.invalidate_cached_results()
+
+    def clear(self, models=None, commit=True):
+        super().clear(models, commit)
+        self.invalidate_cached_results()
+
+    def invalidate_cached_results(self):
+        bump_generation(self.connection_alias)
+        if self.connection_alias == get_language_alias(settings.LANGUAGE_CODE):
+            # the default connection uses the same index
+            bump_generation("default")
+
+    def search(self, query_string, start_offset=0, end_offset=None, **kwargs):
+        """
+        Returns the cached results of the same query in the same
+        language index when available
+        """
+        timeout = get_timeout()
+        if not timeout:
+            return super().search(
+                query_string, start_offset=start_offset, end_offset=end_offset,
+                **kwargs
+            )
+        alias = self.connection_alias
+        cache_key = get_cache_key(
+            alias, query_string, start_offset, end_offset, kwargs
+        )
+        results = cache.get(cache_key)
+        if results is None:
+            count(alias, "misses")
+            results = super().search(
+                query_string, start_offset=start_offset, end_offset=end_offset,
+                **kwargs
+            )
+            cache.set(cache_key, results, timeout)
+        else:
+            count(alias, "hits")
+        return results
 
 
 class MultilingualWhooshSearchQuery(WhooshSearchQuery):
     def __init__(self, using=DEFAULT_ALIAS):
-        lang_code_underscored = translation.get_language().replace("-", "_")
-        using = f"default_{lang_code_underscored}"
+        using = get_language_alias(translation.get_language())
         super().__init__(using=using)
 
 
@@ -0,0 +1,66 @@
+"""
+Parallel rebuilding of the per-language Whoosh indexes.
+
+Every language has its own index directory, so the languages are
+indexed in separate processes without competing for the writer lock.
+Each worker iterates the index querysets in primary key chunks and
+commits the index once per chunk.
+"""
+import time
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+from myproject.apps.core.misc import iterate_in_chunks
+
+LanguageResult = namedtuple(
+    "LanguageResult", ["lang_code", "document_count", "chunk_count", "duration"]
+)
+
+
+def index_language(lang_code, chunk_size=500, clear=False):
+    """
+    Rebuilds the index of one language and returns a LanguageResult
+    """
+    from django.utils import translation
+    from haystack import connections
+    from .multilingual_whoosh_backend import get_language_alias
+
+    started = time.perf_counter()
+    using = get_language_alias(lang_code)
+    backend = connections[using].get_backend()
+    if clear:
+        backend.clear()
+
+    document_count = chunk_count = 0
+    with translation.override(lang_code):
+        for index in connections[using].get_unified_index().get_indexes().values():
+            queryset = index.index_queryset(using=using)
+            for chunk in iterate_in_chunks(queryset, chunk_size):
+                backend.update(index, chunk, commit=True, language_specific=True)
+                document_count += len(chunk)
+                chunk_count += 1
+    return LanguageResult(
+        lang_code, document_count, chunk_count, time.perf_counter() - started
+    )
+
+
+def index_languages_in_parallel(lang_codes, workers=None, chunk_size=500,
+                                clear=False):
+    """
+    Rebuilds the indexes of the given languages in a process pool and
+    yields a LanguageResult for each language as soon as it's done
+    """
+    import multiprocessing
+    from django.db import connections as db_connections
+
+    # the forked workers must not share the database connections
+    db_connections.close_all()
+    with ProcessPoolExecutor(
+        max_workers=workers, mp_context=multiprocessing.get_context("fork")
+    ) as executor:
+        futures = [
+            executor.submit(index_language, lang_code, chunk_size, clear)
+            for lang_code in lang_codes
+        ]
+        for future in as_completed(futures):
+            yield future.result()
@@ -0,0 +1,136 @@
+"""
+Incremental updates of the per-language search indexes.
+
+Changes of indexed objects are queued as QueuedIndexUpdate rows by the
+signal handlers. A worker takes the rows in batches, coalesces the
+repeated changes of the same object and updates only the indexes of
+the affected languages.
+"""
+from collections import defaultdict, namedtuple
+
+from django.conf import settings
+from django.db import transaction
+from django.utils.timezone import now as timezone_now
+
+from .models import QueuedIndexUpdate
+
+BatchResult = namedtuple(
+    "BatchResult",
+    ["item_count", "updated_count", "removed_count", "language_count", "lag"],
+)
+QueueStats = namedtuple("QueueStats", ["pending_count", "lag"])
+
+
+def queue_index_update(model, object_ids, languages=None):
+    """
+    Queues the index update of the objects of the model in the given
+    languages or in all of them
+    """
+    from django.contrib.contenttypes.models import ContentType
+
+    content_type = ContentType.objects.get_for_model(model)
+    QueuedIndexUpdate.objects.bulk_create([
+        QueuedIndexUpdate(
+            content_type=content_type,
+            object_id=str(object_id),
+            language=language,
+        )
+        for object_id in object_ids
+        for language in (languages or [""])
+    ])
+
+
+def get_queue_stats():
+    """
+    Returns the amount of pending updates and the age of the oldest
+    one in seconds
+    """
+    from django.db.models import Count, Min
+
+    stats = QueuedIndexUpdate.objects.aggregate(
+        pending_count=Count("pk"), oldest=Min("created")
+    )
+    lag = 0.0
+    if stats["oldest"]:
+        lag = (timezone_now() - stats["oldest"]).total_seconds()
+    return QueueStats(stats["pending_count"], lag)
+
+
+def process_index_queue(batch_size=100):
+    """
+    Applies a batch of queued updates. Rows locked by other workers are
+    skipped. Returns a BatchResult or None when the queue is empty.
+    """
+    from django.contrib.contenttypes.models import ContentType
+    from django.utils import translation
+    from haystack import connections
+    from haystack.exceptions import NotHandled
+    from .multilingual_whoosh_backend import get_language_alias
+
+    all_languages = [lang_code for lang_code, lang_name in settings.LANGUAGES]
+
+    with transaction.atomic():
+        items = list(
+            QueuedIndexUpdate.objects.select_for_update(skip_locked=True)
+            .order_by("pk")[:batch_size]
+        )
+        if not items:
+            return None
+
+        # coalesce the repeated changes of the same objects
+        languages_by_object = defaultdict(set)
+        for item in items:
+            key = (item.content_type_id, item.object_id)
+            languages_by_object[key].update(
+                [item.language] if item.language else all_languages
+            )
+
+        object_ids_by_content_type = defaultdict(set)
+        for content_type_id, object_id in languages_by_object:
+            object_ids_by_content_type[content_type_id].add(object_id)
+
+        updated_count = removed_count = 0
+        affected_languages = set()
+        unified_index = connections["default"].get_unified_index()
+        for content_type_id, object_ids in object_ids_by_content_type.items():
+            model = ContentType.objects.get_for_id(content_type_id).model_class()
+            try:
+                index = unified_index.get_index(model)
+            except NotHandled:
+                continue
+            for lang_code in all_languages:
+                changed_ids = [
+                    object_id
+                    for object_id in object_ids
+                    if lang_code in languages_by_object[(content_type_id, object_id)]
+                ]
+                if not changed_ids:
+                    continue
+                affected_languages.add(lang_code)
+                backend = connections[get_language_alias(lang_code)].get_backend()
+                with translation.override(lang_code):
+                    # the queryset prefetches the translations of the language
+                    objects = {
+                        str(pk): obj
+                        for pk, obj in index.index_queryset().in_bulk(changed_ids).items()
+                    }
+                    changed_objects = list(objects.values())
+                    if changed_objects:
+                        backend.update(
+                            index, changed_objects, commit=True,
+                            language_specific=True,
+                        )
+                updated_count += len(changed_objects)
+                for object_id in changed_ids:
+                    if object_id not in objects:
+                        backend.remove(
+                            f"{model._meta.app_label}.{model._meta.model_name}.{object_id}"
+                        )
+                        removed_count += 1
+
+        QueuedIndexUpdate.objects.filter(pk__in=[item.pk for item in items]).delete()
+
+    lag = (timezone_now() - min(item.created for item in items)).total_seconds()
+    return BatchResult(
+        len(items), updated_count, removed_count, len(affected_languages), lag
+    )
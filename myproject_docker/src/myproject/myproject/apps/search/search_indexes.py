@@ -12,13 +12,30 @@ class IdeaIndex(indexes.SearchIndex, indexes.Indexable):
     def index_queryset(self, using=None):
         """
         Used when the entire index for model is updated.
+        The translations of the active language are prefetched once
+        per chunk, so that the documents are prepared from memory.
+        The documents of each language are prepared from their own
+        queryset; see the update_multilingual_index command.
         """
-        return self.get_model().objects.all()
+        from django.db import models
+        from django.utils import translation
+        from myproject.apps.categories.models import Category
+
+        lang_code = translation.get_language()
+        return self.get_model().objects.with_translations(lang_code).prefetch_related(
+            models.Prefetch(
+                "categories_m2m",
+                queryset=Category.objects.with_translations(lang_code),
+            )
+        )
 
     def prepare_text(self, idea):
         """
         Called for each language / backend
         """
+        # the translated fields use the prefetched translations
         fields = [idea.translated_title, idea.translated_content]
-        fields += [category.translated_title for category in idea.categories.all()]
-        return "\n".join(fields)
\ No newline at end of file
+        fields += [
+            category.translated_title for category in idea.categories_m2m.all()
+        ]
+        return "\n".join(fields)
@@ -0,0 +1,82 @@
+"""
+Long-lived Whoosh searchers.
+
+Opening a searcher opens the files of all index segments, so instead
+of opening and closing one for every search, each process (and thread)
+keeps one searcher per language index open. It is refreshed only when
+a new generation of the index was committed; the readers of unchanged
+segments are reused.
+"""
+import os
+import threading
+
+
+class PooledSearcher(object):
+    """
+    A searcher whose close() keeps it open for the next search
+    """
+    def __init__(self, searcher):
+        self._searcher = searcher
+
+    def __getattr__(self, name):
+        return getattr(self._searcher, name)
+
+    def close(self):
+        pass
+
+
+class PooledIndex(object):
+    """
+    A proxy of a Whoosh index which hands out the pooled searcher
+    """
+    def __init__(self, index):
+        self._index = index
+        self._local = threading.local()
+
+    def __getattr__(self, name):
+        return getattr(self._index, name)
+
+    def refresh(self):
+        # the pooled searcher is refreshed in searcher()
+        return self
+
+    def get_searcher(self):
+        pid, searcher = getattr(self._local, "pid_and_searcher", (None, None))
+        if pid != os.getpid():
+            # the searcher of the parent process is not shared with forks
+            searcher = self._index.searcher()
+        elif not searcher.up_to_date():
+            searcher = searcher.refresh()
+        self._local.pid_and_searcher = (os.getpid(), searcher)
+        return searcher
+
+    def searcher(self, **kwargs):
+        if kwargs:
+            # custom searchers, e.g. with another weighting, aren't pooled
+            return self._index.searcher(**kwargs)
+        return PooledSearcher(self.get_searcher())
+
+    def doc_count(self):
+        return self.get_searcher().doc_count()
+
+    def close(self):
+        pid, searcher = getattr(self._local, "pid_and_searcher", (None, None))
+        if pid == os.getpid():
+            searcher.close()
+        self._local.pid_and_searcher = (None, None)
+        self._index.close()
+
+
+def warm_up_searchers():
+    """
+    Opens the searchers of all language indexes in the current process
+    """
+    from django.conf import settings
+    from haystack import connections
+    from .multilingual_whoosh_backend import get_language_alias
+
+    for lang_code, lang_name in settings.LANGUAGES:
+        backend = connections[get_language_alias(lang_code)].get_backend()
+        if not backend.setup_complete:
+            backend.setup()
+        backend.index.searcher()
@@ -0,0 +1,56 @@
+from django.db.models.signals import m2m_changed, post_delete, post_save, pre_delete
+from django.dispatch import receiver
+
+from myproject.apps.categories.models import Category, CategoryTranslations
+from myproject.apps.ideas.models import Idea, IdeaTranslations
+
+from .queue import queue_index_update
+
+
+@receiver(post_save, sender=Idea)
+@receiver(post_delete, sender=Idea)
+def queue_idea_update(sender, **kwargs):
+    instance = kwargs["instance"]
+    # the fields of the main model are the fallback for all languages
+    queue_index_update(Idea, [instance.pk])
+
+
+@receiver(post_save, sender=IdeaTranslations)
+@receiver(post_delete, sender=IdeaTranslations)
+def queue_idea_translation_update(sender, **kwargs):
+    instance = kwargs["instance"]
+    queue_index_update(Idea, [instance.idea_id], languages=[instance.language])
+
+
+@receiver(m2m_changed, sender=Idea.categories_m2m.through)
+def queue_idea_categories_update(sender, **kwargs):
+    if kwargs["action"] not in ("post_add", "post_remove", "post_clear"):
+        return
+    if kwargs["reverse"]:
+        # the ideas were added to or removed from a category
+        idea_ids = kwargs["pk_set"] or []
+    else:
+        idea_ids = [kwargs["instance"].pk]
+    queue_index_update(Idea, idea_ids)
+
+
+@receiver(post_save, sender=CategoryTranslations)
+@receiver(post_delete, sender=CategoryTranslations)
+def queue_category_translation_update(sender, **kwargs):
+    instance = kwargs["instance"]
+    idea_ids = Idea.objects.filter(
+        categories_m2m=instance.category_id
+    ).values_list("pk", flat=True)
+    queue_index_update(Idea, idea_ids, languages=[instance.language])
+
+
+@receiver(post_save, sender=Category)
+@receiver(pre_delete, sender=Category)
+def queue_category_update(sender, **kwargs):
+    instance = kwargs["instance"]
+    # the title of the main model is the fallback for all languages;
+    # before deletion the ideas of the category can still be found
+    idea_ids = Idea.objects.filter(
+        categories_m2m=instance.pk
+    ).values_list("pk", flat=True)
+    queue_index_update(Idea, idea_ids)
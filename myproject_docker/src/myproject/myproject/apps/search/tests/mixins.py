@@ -0,0 +1,49 @@
+import shutil
+import tempfile
+
+from django.core.cache import cache
+from django.test import override_settings
+
+from ..multilingual_whoosh_backend import get_language_alias
+
+LOCMEM_CACHES = {"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+
+
+class TemporaryIndexesMixin(object):
+    """
+    Points the search connections of the test languages to empty
+    temporary index directories and keeps the cached search results
+    in memory
+    """
+    languages = [("en", "English")]
+    result_cache_timeout = 0
+
+    def setUp(self):
+        from haystack import connections
+
+        super().setUp()
+        settings_override = override_settings(
+            LANGUAGES=self.languages,
+            SEARCH_RESULT_CACHE_TIMEOUT=self.result_cache_timeout,
+            CACHES=LOCMEM_CACHES,
+        )
+        settings_override.enable()
+        self.addCleanup(settings_override.disable)
+        cache.clear()
+
+        index_root = tempfile.mkdtemp(prefix="search_tests_")
+        self.addCleanup(shutil.rmtree, index_root, ignore_errors=True)
+        for lang_code, lang_name in self.languages:
+            alias = get_language_alias(lang_code)
+            # the cleanups run in reverse order, before the directory is removed
+            self.addCleanup(
+                self.set_index_path, alias, connections.connections_info[alias]["PATH"]
+            )
+            self.set_index_path(alias, f"{index_root}/{alias}")
+
+    @staticmethod
+    def set_index_path(alias, path):
+        from haystack import connections
+
+        connections.connections_info[alias]["PATH"] = path
+        connections.reload(alias)
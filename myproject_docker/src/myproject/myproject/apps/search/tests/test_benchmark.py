@@ -0,0 +1,44 @@
+import json
+from io import StringIO
+
+from django.core.cache import cache
+from django.core.management import call_command
+from django.test import TestCase, override_settings
+
+from .mixins import LOCMEM_CACHES
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class BenchmarkSearchCommandTest(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_non_default_language(self):
+        from ..cache import get_generation
+
+        generations = {
+            alias: get_generation(alias) for alias in ("default", "default_de")
+        }
+        stdout = StringIO()
+        call_command(
+            "benchmark_search",
+            ideas=5,
+            updates=2,
+            queries=3,
+            languages=["de"],
+            stdout=stdout,
+        )
+        results = json.loads(stdout.getvalue())
+        self.assertEqual(results["languages"], ["de"])
+        self.assertEqual(set(results["rebuild"]["per_language_seconds"]), {"de"})
+        self.assertEqual(set(results["queries"]), {"de"})
+        self.assertEqual(results["incremental"]["updates"], 2)
+        # the generations of the real indexes weren't increased
+        for alias, generation in generations.items():
+            self.assertEqual(get_generation(alias), generation)
+
+    def test_corpus_has_default_language(self):
+        from ..benchmark import SyntheticCorpus
+
+        corpus = SyntheticCorpus(["de"])
+        self.assertTrue(corpus.get_text("en", 3))
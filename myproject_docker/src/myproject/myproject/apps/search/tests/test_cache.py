@@ -0,0 +1,81 @@
+from django.core.cache import cache
+from django.test import TestCase, override_settings
+
+from myproject.apps.ideas.models import Idea
+
+from ..cache import get_cache_key, get_generation, get_stats, normalize_option
+from ..multilingual_whoosh_backend import get_language_alias
+from ..queue import process_index_queue
+from .mixins import LOCMEM_CACHES, TemporaryIndexesMixin
+
+
+@override_settings(CACHES=LOCMEM_CACHES)
+class CacheKeyTest(TestCase):
+    def setUp(self):
+        cache.clear()
+
+    def test_sets_are_normalized(self):
+        first_set = set()
+        second_set = set()
+        for value in ["title:a", "title:b", "title:c", "title:d"]:
+            first_set.add(value)
+        for value in ["title:d", "title:c", "title:b", "title:a"]:
+            second_set.add(value)
+        self.assertEqual(
+            normalize_option({"narrow_queries": first_set, "models": {Idea}}),
+            [
+                ("models", [repr(Idea)]),
+                ("narrow_queries", ["'title:a'", "'title:b'", "'title:c'", "'title:d'"]),
+            ],
+        )
+        self.assertEqual(
+            get_cache_key("default_en", "idea", 0, 10, {"narrow_queries": first_set}),
+            get_cache_key("default_en", "idea", 0, 10, {"narrow_queries": second_set}),
+        )
+
+    def test_keys_differ(self):
+        key = get_cache_key("default_en", "idea", 0, 10, {})
+        self.assertEqual(key, get_cache_key("default_en", " idea ", 0, 10, {}))
+        self.assertNotEqual(key, get_cache_key("default_de", "idea", 0, 10, {}))
+        self.assertNotEqual(key, get_cache_key("default_en", "Idea", 0, 10, {}))
+        self.assertNotEqual(key, get_cache_key("default_en", "idea", 10, 20, {}))
+        self.assertNotEqual(
+            key, get_cache_key("default_en", "idea", 0, 10, {"models": {Idea}})
+        )
+
+
+class CachedSearchTest(TemporaryIndexesMixin, TestCase):
+    result_cache_timeout = 300
+
+    def setUp(self):
+        super().setUp()
+        self.alias = get_language_alias("en")
+
+    def search(self, query_string):
+        from haystack import connections
+
+        return connections[self.alias].get_backend().search(query_string)
+
+    def test_hits_and_misses(self):
+        Idea.objects.create(title="Lighthouse", content="")
+        process_index_queue()
+
+        self.assertEqual(self.search("lighthouse")["hits"], 1)
+        self.assertEqual(get_stats(self.alias), (0, 1))
+        self.assertEqual(self.search("lighthouse")["hits"], 1)
+        self.assertEqual(get_stats(self.alias), (1, 1))
+        self.search("harbour")
+        self.assertEqual(get_stats(self.alias), (1, 2))
+
+    def test_commit_invalidates_results(self):
+        Idea.objects.create(title="Lighthouse", content="")
+        process_index_queue()
+        self.assertEqual(self.search("lighthouse")["hits"], 1)
+        generation = get_generation(self.alias)
+
+        Idea.objects.create(title="Another lighthouse", content="")
+        process_index_queue()
+        self.assertGreater(get_generation(self.alias), generation)
+        # the cached results of the older generation aren't used
+        self.assertEqual(self.search("lighthouse")["hits"], 2)
+        self.assertEqual(get_stats(self.alias), (0, 2))
@@ -0,0 +1,83 @@
+from unittest import mock
+
+from django.test import TestCase
+
+from myproject.apps.categories.models import Category
+from myproject.apps.ideas.models import Idea
+
+from ..models import QueuedIndexUpdate
+from ..multilingual_whoosh_backend import get_language_alias
+from ..queue import process_index_queue
+from .mixins import TemporaryIndexesMixin
+
+
+class IndexQueueTest(TemporaryIndexesMixin, TestCase):
+    languages = [("en", "English"), ("de", "German")]
+
+    def get_indexed_ids(self, lang_code):
+        from haystack.query import SearchQuerySet
+
+        return {
+            result.pk
+            for result in SearchQuerySet().using(get_language_alias(lang_code)).all()
+        }
+
+    def test_repeated_saves_are_coalesced(self):
+        idea = Idea.objects.create(title="Idea", content="")
+        idea.title = "Changed idea"
+        idea.save()
+        idea.save()
+        self.assertEqual(QueuedIndexUpdate.objects.count(), 3)
+
+        with mock.patch(
+            "myproject.apps.search.multilingual_whoosh_backend"
+            ".MultilingualWhooshSearchBackend.update",
+        ) as update:
+            result = process_index_queue()
+        self.assertEqual(result.item_count, 3)
+        # one update of the idea per language
+        self.assertEqual(update.call_count, len(self.languages))
+        self.assertEqual(result.updated_count, len(self.languages))
+        self.assertEqual(result.language_count, len(self.languages))
+        self.assertFalse(QueuedIndexUpdate.objects.exists())
+        self.assertIsNone(process_index_queue())
+
+    def test_deleted_objects_are_removed(self):
+        idea = Idea.objects.create(title="Idea", content="")
+        process_index_queue()
+        for lang_code, lang_name in self.languages:
+            self.assertEqual(self.get_indexed_ids(lang_code), {str(idea.pk)})
+
+        idea.delete()
+        result = process_index_queue()
+        self.assertEqual(result.removed_count, len(self.languages))
+        for lang_code, lang_name in self.languages:
+            self.assertEqual(self.get_indexed_ids(lang_code), set())
+
+    def test_failed_updates_stay_queued(self):
+        Idea.objects.create(title="Idea", content="")
+        with mock.patch(
+            "myproject.apps.search.multilingual_whoosh_backend"
+            ".MultilingualWhooshSearchBackend.update",
+            side_effect=IOError,
+        ):
+            with self.assertRaises(IOError):
+                process_index_queue()
+        self.assertEqual(QueuedIndexUpdate.objects.count(), 1)
+
+        result = process_index_queue()
+        self.assertEqual(result.item_count, 1)
+        self.assertFalse(QueuedIndexUpdate.objects.exists())
+
+    def test_category_title_queues_its_ideas(self):
+        category = Category.objects.create(title="Category")
+        idea = Idea.objects.create(title="Idea", content="")
+        idea.categories_m2m.add(category)
+        QueuedIndexUpdate.objects.all().delete()
+
+        category.title = "Renamed category"
+        category.save()
+        queued = QueuedIndexUpdate.objects.get()
+        self.assertEqual(queued.object_id, str(idea.pk))
+        # the default language title is the fallback for all languages
+        self.assertEqual(queued.language, "")
@@ -0,0 +1,47 @@
+from django.test import TestCase, override_settings
+from django.utils import translation
+
+from myproject.apps.categories.models import Category, CategoryTranslations
+from myproject.apps.ideas.models import Idea, IdeaTranslations
+
+from ..search_indexes import IdeaIndex
+
+
+@override_settings(LANGUAGES=[("en", "English"), ("de", "German"), ("fr", "French")])
+class IdeaIndexTest(TestCase):
+    def setUp(self):
+        category = Category.objects.create(title="Maritime")
+        for lang_code, title in (("de", "Seefahrt"), ("fr", "Maritime")):
+            CategoryTranslations.objects.create(
+                category=category, language=lang_code, title=title
+            )
+        self.idea = Idea.objects.create(title="Lighthouse", content="")
+        for lang_code, title in (("de", "Leuchtturm"), ("fr", "Phare")):
+            IdeaTranslations.objects.create(
+                idea=self.idea, language=lang_code, title=title, content=""
+            )
+        self.idea.categories_m2m.add(category)
+
+    def test_only_the_active_language_is_prefetched(self):
+        index = IdeaIndex()
+        with translation.override("de"):
+            # the ideas, their categories and the German translations of both
+            with self.assertNumQueries(4):
+                ideas = list(index.index_queryset())
+            idea = ideas[0]
+            with self.assertNumQueries(0):
+                self.assertEqual(index.prepare_text(idea), "Leuchtturm\n\nSeefahrt")
+        # the translations of the other languages aren't loaded
+        self.assertNotIn("translations", getattr(idea, "_prefetched_objects_cache", {}))
+        category = idea.categories_m2m.all()[0]
+        self.assertNotIn(
+            "translations", getattr(category, "_prefetched_objects_cache", {})
+        )
+
+    def test_default_language_needs_no_translations(self):
+        index = IdeaIndex()
+        with translation.override("en"):
+            with self.assertNumQueries(2):
+                ideas = list(index.index_queryset())
+            with self.assertNumQueries(0):
+                self.assertEqual(index.prepare_text(ideas[0]), "Lighthouse\n\nMaritime")
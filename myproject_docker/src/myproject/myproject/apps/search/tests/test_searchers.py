@@ -0,0 +1,74 @@
+from django.test import SimpleTestCase, TestCase
+
+from myproject.apps.ideas.models import Idea
+
+from ..multilingual_whoosh_backend import get_language_alias
+from ..queue import process_index_queue
+from ..searchers import PooledIndex, PooledSearcher
+from .mixins import TemporaryIndexesMixin
+
+
+class PooledIndexTest(SimpleTestCase):
+    def setUp(self):
+        from whoosh.fields import ID, TEXT, Schema
+        from whoosh.filedb.filestore import RamStorage
+
+        self.index = PooledIndex(
+            RamStorage().create_index(Schema(id=ID(stored=True), text=TEXT))
+        )
+        self.add_document("1", "lighthouse")
+
+    def tearDown(self):
+        self.index.close()
+
+    def add_document(self, document_id, text):
+        writer = self.index.writer()
+        writer.add_document(id=document_id, text=text)
+        writer.commit()
+
+    def test_searcher_is_reused(self):
+        searcher = self.index.searcher()
+        self.assertIsInstance(searcher, PooledSearcher)
+        searcher.close()
+        other_searcher = self.index.searcher()
+        self.assertIs(other_searcher._searcher, searcher._searcher)
+        self.assertEqual(other_searcher.doc_count(), 1)
+
+    def test_searcher_is_refreshed_after_commit(self):
+        searcher = self.index.searcher()._searcher
+        self.add_document("2", "harbour")
+        refreshed_searcher = self.index.searcher()._searcher
+        self.assertIsNot(refreshed_searcher, searcher)
+        self.assertTrue(refreshed_searcher.up_to_date())
+        self.assertEqual(self.index.doc_count(), 2)
+        # and it's reused until the next commit
+        self.assertIs(self.index.searcher()._searcher, refreshed_searcher)
+
+    def test_custom_searchers_arent_pooled(self):
+        from whoosh import scoring
+
+        searcher = self.index.searcher(weighting=scoring.TF_IDF())
+        self.assertNotIsInstance(searcher, PooledSearcher)
+        searcher.close()
+
+
+class PooledBackendTest(TemporaryIndexesMixin, TestCase):
+    def setUp(self):
+        super().setUp()
+        self.alias = get_language_alias("en")
+
+    def test_searches_see_the_updates(self):
+        from haystack import connections
+
+        backend = connections[self.alias].get_backend()
+        Idea.objects.create(title="Lighthouse", content="")
+        process_index_queue()
+        self.assertEqual(backend.search("lighthouse")["hits"], 1)
+        searcher = backend.index.searcher()._searcher
+        self.assertEqual(backend.search("lighthouse")["hits"], 1)
+        self.assertIs(backend.index.searcher()._searcher, searcher)
+
+        Idea.objects.create(title="Another lighthouse", content="")
+        process_index_queue()
+        self.assertEqual(backend.search("lighthouse")["hits"], 2)
+        self.assertIsNot(backend.index.searcher()._searcher, searcher)
@@ -0,0 +1,49 @@
+from io import StringIO
+
+from django.core.management import call_command
+from django.test import TransactionTestCase
+
+from myproject.apps.ideas.models import Idea, IdeaTranslations
+
+from ..multilingual_whoosh_backend import get_language_alias
+from .mixins import TemporaryIndexesMixin
+
+
+class UpdateMultilingualIndexCommandTest(TemporaryIndexesMixin, TransactionTestCase):
+    # the command closes the database connections and forks
+    # the workers, which need the committed ideas
+    languages = [("en", "English"), ("de", "German")]
+
+    def search(self, lang_code, query_string):
+        from haystack import connections
+
+        backend = connections[get_language_alias(lang_code)].get_backend()
+        return sorted(
+            result.pk for result in backend.search(query_string)["results"]
+        )
+
+    def test_languages_are_indexed_in_parallel(self):
+        lighthouse = Idea.objects.create(title="Lighthouse", content="")
+        IdeaTranslations.objects.create(
+            idea=lighthouse, language="de", title="Leuchtturm", content=""
+        )
+        harbour = Idea.objects.create(title="Harbour", content="")
+
+        stdout = StringIO()
+        call_command(
+            "update_multilingual_index",
+            workers=2,
+            batch_size=1,
+            clear=True,
+            stdout=stdout,
+        )
+        output = stdout.getvalue()
+        self.assertIn(" - en: 2 documents in 2 chunks", output)
+        self.assertIn(" - de: 2 documents in 2 chunks", output)
+        self.assertIn("Languages indexed: 2", output)
+
+        self.assertEqual(self.search("en", "lighthouse"), [str(lighthouse.pk)])
+        self.assertEqual(self.search("de", "leuchtturm"), [str(lighthouse.pk)])
+        self.assertEqual(self.search("de", "lighthouse"), [])
+        # the German index falls back to the default language
+        self.assertEqual(self.search("de", "harbour"), [str(harbour.pk)])
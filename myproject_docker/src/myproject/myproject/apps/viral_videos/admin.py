@@ -1,6 +1,52 @@
 from django.contrib import admin
+from django.utils.translation import ugettext_lazy as _
+
+from .counters import NO_PENDING_VIEWS, get_pending_views
 from .models import ViralVideo
 
 @admin.register(ViralVideo)
 class ViralVideoAdmin(admin.ModelAdmin):
-    list_display = ["title", "created", "modified"]
+    list_display = [
+        "title",
+        "get_authenticated_views",
+        "get_anonymous_views",
+        "get_total_views",
+        "created",
+        "modified",
+    ]
+    readonly_fields = [
+        "get_authenticated_views",
+        "get_anonymous_views",
+        "get_total_views",
+    ]
+
+    def get_changelist_instance(self, request):
+        changelist = super().get_changelist_instance(request)
+        # load the pending impressions of the whole page at once
+        pending = get_pending_views([video.pk for video in changelist.result_list])
+        for video in changelist.result_list:
+            video.pending_views = pending.get(video.pk, NO_PENDING_VIEWS)
+        return changelist
+
+    @staticmethod
+    def _get_pending_views(obj):
+        if not hasattr(obj, "pending_views"):
+            obj.pending_views = get_pending_views([obj.pk]).get(
+                obj.pk, NO_PENDING_VIEWS
+            )
+        return obj.pending_views
+
+    def get_authenticated_views(self, obj):
+        return obj.authenticated_views + self._get_pending_views(obj).authenticated
+
+    get_authenticated_views.short_description = _("Authenticated impressions")
+
+    def get_anonymous_views(self, obj):
+        return obj.anonymous_views + self._get_pending_views(obj).anonymous
+
+    get_anonymous_views.short_description = _("Anonymous impressions")
+
+    def get_total_views(self, obj):
+        return self.get_authenticated_views(obj) + self.get_anonymous_views(obj)
+
+    get_total_views.short_description = _("Total impressions")
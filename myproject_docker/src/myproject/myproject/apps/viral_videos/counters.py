@@ -0,0 +1,97 @@
+"""
+Write-behind view counters for viral videos.
+
+Every impression only increments a counter in the cache. The
+flush_viral_video_views management command applies the accumulated
+deltas to the database in batches and subtracts the applied amounts
+from the cache, so that impressions counted in the meantime are kept.
+"""
+import contextlib
+from collections import namedtuple
+
+from django.core.cache import cache
+from django.db import models, transaction
+
+PendingViews = namedtuple("PendingViews", ["authenticated", "anonymous"])
+
+NO_PENDING_VIEWS = PendingViews(0, 0)
+
+VIEW_FIELDS = {
+    "authenticated": "authenticated_views",
+    "anonymous": "anonymous_views",
+}
+
+
+def _get_cache_key(kind, video_pk):
+    return f"viral_videos:pending_views:{kind}:{video_pk}"
+
+
+def add_view(video_pk, authenticated):
+    kind = "authenticated" if authenticated else "anonymous"
+    key = _get_cache_key(kind, video_pk)
+    try:
+        cache.incr(key)
+    except ValueError:
+        # the key doesn't exist yet
+        if not cache.add(key, 1, timeout=None):
+            cache.incr(key)
+
+
+def get_pending_views(video_pks):
+    """
+    Returns a dictionary of pending impressions by video primary key
+    """
+    keys = {
+        _get_cache_key(kind, pk): (kind, pk)
+        for pk in video_pks
+        for kind in VIEW_FIELDS
+    }
+    pending = {}
+    for key, value in cache.get_many(keys).items():
+        kind, pk = keys[key]
+        views = pending.get(pk, NO_PENDING_VIEWS)
+        pending[pk] = views._replace(**{kind: int(value)})
+    return pending
+
+
+def flush_pending_views(batch_size=500):
+    """
+    Applies the pending impressions of all videos to the database,
+    one UPDATE query per batch of videos.
+    Returns the amount of flushed impressions.
+    """
+    from .models import ViralVideo
+
+    flushed = 0
+    pks = ViralVideo.objects.order_by("pk").values_list("pk", flat=True)
+    for start in range(0, pks.count(), batch_size):
+        pending = {
+            pk: views
+            for pk, views in get_pending_views(pks[start:start + batch_size]).items()
+            if views.authenticated or views.anonymous
+        }
+        if not pending:
+            continue
+        updates = {
+            field_name: models.F(field_name) + models.Case(
+                *[
+                    models.When(pk=pk, then=models.Value(getattr(views, kind)))
+                    for pk, views in pending.items()
+                ],
+                default=models.Value(0),
+                output_field=models.PositiveIntegerField(),
+            )
+            for kind, field_name in VIEW_FIELDS.items()
+        }
+        with transaction.atomic():
+            ViralVideo.objects.filter(pk__in=pending.keys()).update(**updates)
+
+        for pk, views in pending.items():
+            for kind in VIEW_FIELDS:
+                delta = getattr(views, kind)
+                if delta:
+                    # the key might have been evicted in the meantime
+                    with contextlib.suppress(ValueError):
+                        cache.decr(_get_cache_key(kind, pk), delta)
+                    flushed += delta
+    return flushed
@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand
+
+
+class Command(BaseCommand):
+    help = (
+        "Applies the impressions of viral videos buffered in the cache "
+        "to the database. Run it periodically, e.g. every minute by cron, "
+        "or keep it running with --interval."
+    )
+    SILENT, NORMAL, VERBOSE, VERY_VERBOSE = 0, 1, 2, 3
+
+    def add_arguments(self, parser):
+        # Named (optional) arguments
+        parser.add_argument("--batch-size", type=int, default=500)
+        parser.add_argument(
+            "--interval",
+            type=int,
+            default=0,
+            help="Keep flushing every given amount of seconds.",
+        )
+
+    def handle(self, *args, **options):
+        import time
+
+        self.verbosity = options.get("verbosity", self.NORMAL)
+        self.batch_size = options["batch_size"]
+        interval = options["interval"]
+        self.flush()
+        while interval > 0:
+            time.sleep(interval)
+            self.flush()
+
+    def flush(self):
+        from ...counters import flush_pending_views
+
+        flushed = flush_pending_views(batch_size=self.batch_size)
+        if self.verbosity >= self.NORMAL:
+            self.stdout.write(f"Impressions flushed: {flushed}\n")
@@ -7,7 +7,7 @@ from .models import ViralVideo
 
 @receiver(post_save, sender=ViralVideo)
 def inform_administrators(sender, **kwargs):
-    from django.core.mail import mail_admins
+    from myproject.apps.outbox.mail import queue_mail_admins
 
     instance = kwargs["instance"]
     created = kwargs["created"]
@@ -21,10 +21,9 @@ def inform_administrators(sender, **kwargs):
         html_message = render_to_string(
             "viral_videos/email/administrator/message.html", context)
 
-        mail = mail_admins(
+        # the email is sent by the send_queued_mail management command
+        queue_mail_admins(
             subject=subject.strip(),
             message=plain_text_message,
             html_message=html_message,
-            fail_silently=True,
         )
-        print(mail)
\ No newline at end of file
@@ -1,3 +1,35 @@
-from django.test import TestCase
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 
-# Create your tests here.
+from .counters import add_view, flush_pending_views, get_pending_views
+from .models import ViralVideo
+
+
+@override_settings(
+    CACHES={"default": {"BACKEND": "django.core.cache.backends.locmem.LocMemCache"}}
+)
+class BufferedViewsTest(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.video = ViralVideo.objects.create(title="Dancing cats")
+
+    def test_views_are_buffered_and_flushed(self):
+        for __ in range(3):
+            add_view(self.video.pk, authenticated=False)
+        add_view(self.video.pk, authenticated=True)
+
+        self.video.refresh_from_db()
+        self.assertEqual(self.video.anonymous_views, 0)
+        pending = get_pending_views([self.video.pk])[self.video.pk]
+        self.assertEqual(pending.anonymous, 3)
+        self.assertEqual(pending.authenticated, 1)
+
+        self.assertEqual(flush_pending_views(), 4)
+
+        self.video.refresh_from_db()
+        self.assertEqual(self.video.anonymous_views, 3)
+        self.assertEqual(self.video.authenticated_views, 1)
+        pending = get_pending_views([self.video.pk])[self.video.pk]
+        self.assertEqual(pending.anonymous, 0)
+        self.assertEqual(pending.authenticated, 0)
+        self.assertEqual(flush_pending_views(), 0)
@@ -6,6 +6,7 @@ from django.utils.timezone import now, timedelta
 from django.shortcuts import render, get_object_or_404
 from django.views.generic import ListView
 
+from .counters import NO_PENDING_VIEWS, add_view, get_pending_views
 from .models import ViralVideo
 
 POPULAR_FROM = getattr(settings, "VIRAL_VIDEOS_POPULAR_FROM", 500)
@@ -21,8 +22,20 @@ class ViralVideoList(ListView):
 def viral_video_detail(request, pk):
     yesterday = now() - timedelta(days=1)
 
+    # impressions are buffered in the cache and flushed periodically
+    # by the flush_viral_video_views management command
+    pending = get_pending_views([pk]).get(pk, NO_PENDING_VIEWS)
+
     qs = ViralVideo.objects.annotate(
-        total_views=models.F("authenticated_views") + models.F("anonymous_views"),
+        authenticated_impressions=(
+            models.F("authenticated_views") + models.Value(pending.authenticated)
+        ),
+        anonymous_impressions=(
+            models.F("anonymous_views") + models.Value(pending.anonymous)
+        ),
+        total_views=(
+            models.F("authenticated_impressions") + models.F("anonymous_impressions")
+        ),
         label=models.Case(
             models.When(total_views__gt=POPULAR_FROM, then=models.Value("popular")),
             models.When(created__gt=yesterday, then=models.Value("new")),
@@ -34,12 +47,7 @@ def viral_video_detail(request, pk):
     # DEBUG: check the SQL query that Django ORM generates
     logger.debug(f"Query: {qs.query}")
 
-    qs = qs.filter(pk=pk)
-    if request.user.is_authenticated:
-        qs.update(authenticated_views=models.F("authenticated_views") + 1)
-    else:
-        qs.update(anonymous_views=models.F("anonymous_views") + 1)
-
-    video = get_object_or_404(qs)
+    video = get_object_or_404(qs, pk=pk)
+    add_view(video.pk, authenticated=request.user.is_authenticated)
 
     return render(request, "viral_videos/viral_video_detail.html", {"video": video})
\ No newline at end of file
@@ -87,6 +87,7 @@ INSTALLED_APPS = [
     "myproject.apps.locations",
     "myproject.apps.likes",
     "myproject.apps.news",
+    "myproject.apps.outbox",
     "myproject.apps.products",
     "myproject.apps.viral_videos"
 ]
@@ -264,6 +265,9 @@ for lang_code, lang_name in LANGUAGES:
     }
 lang_code_underscored = LANGUAGE_CODE.replace("-", "_")
 HAYSTACK_CONNECTIONS["default"] = HAYSTACK_CONNECTIONS[f"default_{lang_code_underscored}"]
+# True opens the searchers of all indexes when a WSGI worker starts
+# instead of in its first search request; see myproject/wsgi.py
+SEARCH_WARM_UP_SEARCHERS = False
 
 AUTHENTICATION_BACKENDS = [
     "myproject.apps.external_auth.backends.Auth0",
@@ -291,6 +295,15 @@ CACHES = {
 }
 CACHES["default"] = CACHES["memcached"]
 
+# the renditions are generated in worker processes, never in templates
+IMAGEKIT_DEFAULT_CACHEFILE_STRATEGY = "myproject.apps.core.renditions.DeferredStrategy"
+RENDITION_WORKERS = None  # the amount of CPUs
+# False generates the renditions in the saving process after the commit,
+# e.g. in tests or without a process pool
+RENDITIONS_ASYNC = True
+# the renditions of identical pictures are shared
+IMAGEKIT_SPEC_CACHEFILE_NAMER = "myproject.apps.core.storages.content_hash_as_path"
+
 LAST_FM_API_KEY = get_secret("LAST_FM_API_KEY")
 
 REST_FRAMEWORK = {
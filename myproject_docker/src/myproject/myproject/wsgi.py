@@ -14,3 +14,10 @@ from django.core.wsgi import get_wsgi_application
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'myproject.settings.production')
 
 application = get_wsgi_application()
+
+from django.conf import settings
+
+if settings.SEARCH_WARM_UP_SEARCHERS:
+    # open the search indexes before the first request of the worker
+    from myproject.apps.search.searchers import warm_up_searchers
+    warm_up_searchers()